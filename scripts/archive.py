@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+Digest Archive
+수집한 모든 항목과 발송한 다이제스트를 날짜별로 쌓아두고 전문 검색
+- 저장: .cache/archive/segments/YYYY-MM-DD.jsonl.gz - 추가만 하는 gzip 세그먼트
+  (실행 한 번 = gzip 멤버 하나, 파일 끝에 이어 붙임 → 기존 데이터는 다시 쓰지 않음)
+- 색인: .cache/archive/index.sqlite3 - 항목 메타데이터 + 역색인(토큰 → 항목)
+  세그먼트에서 언제든 다시 만들 수 있음 (reindex)
+- 토큰: 영문 단어 + 한글 음절 bigram (utils.text.search_tokens)
+
+CLI:
+    python archive.py search "lang:rust kind:repo month:2025-03"
+    python archive.py search "gemini kind:article last:7d"
+    python archive.py search "제미나이 source:GeekNews" --limit 50
+    python archive.py show 1234          # 원본 레코드 (세그먼트에서 읽음)
+    python archive.py stats
+    python archive.py reindex
+
+질의 문법: 검색어는 모두 포함(AND), 아래 key:value는 필터 (그 밖의 'word:...'는 검색어로)
+    kind:repo|article|post  source:이름  lang:언어(레포)
+    since:YYYY-MM-DD|7d|2w  until:YYYY-MM-DD  month:YYYY-MM  last:7d(= since)
+"""
+
+import argparse
+import gzip
+import json
+import re
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# 모듈 경로 추가 (python archive.py로 직접 실행할 때)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from models import Item
+from utils.text import search_tokens
+
+DEFAULT_ARCHIVE_DIR = Path(__file__).parent / '.cache' / 'archive'
+
+GZIP_MAGIC = b'\x1f\x8b\x08'  # gzip 멤버 헤더 (deflate)
+
+# 항목 종류별로 검색 색인에 넣을 필드
+INDEXED_FIELDS = ('title', 'summary', 'description', 'language', 'owner', 'name', 'author', 'text', 'source')
+
+FILTER_KEYS = ('kind', 'source', 'lang', 'since', 'last', 'until', 'month')
+# 단어 맨 앞의 아는 필터 이름만 (https://..., re:invent, note: 같은 건 검색어로 남음)
+FILTER_RE = re.compile(rf'(?<!\S)({"|".join(FILTER_KEYS)}):(\S+)', re.IGNORECASE)
+RELATIVE_RE = re.compile(r'^(\d+)([dw])$')
+
+
+def parse_day(value: str, end: bool = False) -> str:
+    """
+    질의 날짜 → 'YYYY-MM-DD'
+
+    '7d' / '2w'는 오늘부터 거꾸로, 'YYYY-MM'은 그 달의 첫날 (end=True면 마지막 날)
+    """
+    match = RELATIVE_RE.match(value)
+    if match:
+        days = int(match.group(1)) * (7 if match.group(2) == 'w' else 1)
+        return (date.today() - timedelta(days=days)).isoformat()
+    if re.match(r'^\d{4}-\d{2}$', value):
+        first = date.fromisoformat(value + '-01')
+        if not end:
+            return first.isoformat()
+        next_month = (first.replace(day=28) + timedelta(days=4)).replace(day=1)
+        return (next_month - timedelta(days=1)).isoformat()
+    return date.fromisoformat(value).isoformat()
+
+
+def parse_query(query: str) -> tuple:
+    """
+    질의 문자열 → (토큰 목록, 필터 dict)
+
+    FILTER_KEYS에 있는 key:value만 필터, 나머지는 모두 검색어
+
+    Raises:
+        ValueError: 잘못된 날짜
+    """
+    filters = {}
+    for key, value in FILTER_RE.findall(query):
+        key = key.lower()
+        if key in ('kind', 'source', 'lang'):
+            filters[key] = value
+        elif key in ('since', 'last'):
+            filters['since'] = parse_day(value)
+        elif key == 'until':
+            filters['until'] = parse_day(value, end=True)
+        elif key == 'month':
+            filters['since'], filters['until'] = parse_day(value), parse_day(value, end=True)
+
+    text = FILTER_RE.sub(' ', query)
+    return sorted(search_tokens(text)), filters
+
+
+class Archive:
+    def __init__(self, archive_dir: Path = None):
+        """
+        Args:
+            archive_dir: 세그먼트와 색인을 둘 디렉토리
+        """
+        self.archive_dir = Path(archive_dir) if archive_dir else DEFAULT_ARCHIVE_DIR
+        self.segments_dir = self.archive_dir / 'segments'
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.archive_dir / 'index.sqlite3'), check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS items (
+                id INTEGER PRIMARY KEY,
+                day TEXT NOT NULL,
+                collected_at REAL NOT NULL,
+                kind TEXT NOT NULL,
+                source TEXT,
+                language TEXT,
+                url TEXT,
+                title TEXT,
+                summary TEXT,
+                stars INTEGER,
+                segment TEXT NOT NULL,
+                member_offset INTEGER NOT NULL,
+                line INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_items_kind_day ON items(kind, day);
+            CREATE INDEX IF NOT EXISTS idx_items_day ON items(day);
+            CREATE INDEX IF NOT EXISTS idx_items_url ON items(url);
+            CREATE TABLE IF NOT EXISTS terms (
+                token TEXT NOT NULL,
+                item_id INTEGER NOT NULL,
+                PRIMARY KEY (token, item_id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS segments (
+                name TEXT PRIMARY KEY,
+                indexed_bytes INTEGER NOT NULL
+            );
+        """)
+        self.catch_up()
+
+    # ---- 저장 ----
+
+    def segment_path(self, day: str) -> Path:
+        return self.segments_dir / f"{day}.jsonl.gz"
+
+    def add_run(self, items: list, digest: str = None, collected_at: float = None) -> int:
+        """
+        실행 한 번 분량 저장 (세그먼트에 gzip 멤버 하나 추가 + 색인)
+
+        Args:
+            items: models.Item 목록
+            digest: 발송한 다이제스트 원문 (색인하지 않고 세그먼트에만 보관)
+            collected_at: 수집 시각 (epoch, 없으면 지금)
+
+        Returns:
+            저장한 항목 수
+        """
+        if not items and not digest:
+            return 0
+
+        collected_at = collected_at or time.time()
+        day = datetime.fromtimestamp(collected_at).date().isoformat()
+        records = [{**item.to_dict(), 'collected_at': collected_at} for item in items]
+        if digest:
+            records.append({'kind': 'digest', 'collected_at': collected_at, 'text': digest})
+
+        body = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+        path = self.segment_path(day)
+        with self._lock:
+            with open(path, 'ab') as f:
+                offset = f.tell()
+                f.write(gzip.compress(body.encode('utf-8')))
+            self._index_member(path.name, offset, records)
+            self.conn.execute("INSERT OR REPLACE INTO segments (name, indexed_bytes) VALUES (?, ?)",
+                              (path.name, path.stat().st_size))
+            self.conn.commit()
+        return len(items)
+
+    def _index_member(self, segment: str, offset: int, records: list):
+        """gzip 멤버 하나의 레코드들을 색인에 추가 (커밋은 호출한 쪽에서)"""
+        day = segment.split('.')[0]
+        for line, record in enumerate(records):
+            if record.get('kind') == 'digest':
+                continue
+            cursor = self.conn.execute(
+                "INSERT INTO items (day, collected_at, kind, source, language, url, title, summary, stars,"
+                " segment, member_offset, line) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (day, record.get('collected_at', 0), record.get('kind', 'item'), record.get('source'),
+                 (record.get('language') or '').lower() or None, record.get('url'), record.get('title'),
+                 record.get('summary'), record.get('stars'), segment, offset, line),
+            )
+            text = ' '.join(str(record.get(field) or '') for field in INDEXED_FIELDS)
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO terms (token, item_id) VALUES (?, ?)",
+                [(token, cursor.lastrowid) for token in search_tokens(text)],
+            )
+
+    @staticmethod
+    def read_members(path: Path, start: int = 0):
+        """
+        세그먼트의 gzip 멤버들 → (offset, 레코드 목록) (start 바이트부터)
+
+        기록 도중 중단돼 덜 쓰인 마지막 멤버는 건너뛴다. 깨진 멤버는 건너뛰고 다음 gzip
+        헤더부터 다시 읽는다 (덜 쓰인 멤버 뒤에 다음 실행이 이어 붙인 멤버도 살림).
+        """
+        data = path.read_bytes()
+        offset = start
+        while offset < len(data):
+            decompressor = zlib.decompressobj(wbits=31)
+            try:
+                body = decompressor.decompress(data[offset:])
+                if not decompressor.eof:
+                    print(f"⚠️ {path.name}: {offset}바이트부터 덜 쓰인 멤버, 건너뜀")
+                    return
+                records = [json.loads(line) for line in body.decode('utf-8').splitlines() if line]
+            except (zlib.error, ValueError) as e:  # UnicodeDecodeError, JSONDecodeError 포함
+                print(f"⚠️ {path.name}: {offset}바이트 멤버 깨짐 ({e}), 건너뜀")
+                offset = data.find(GZIP_MAGIC, offset + 1)
+                if offset < 0:
+                    return
+                continue
+            yield offset, records
+            offset = len(data) - len(decompressor.unused_data)
+
+    def catch_up(self) -> int:
+        """
+        세그먼트에 쓰였지만 색인되지 않은 멤버 색인 (세그먼트 기록 후 색인 커밋 전에 중단된 경우)
+
+        덜 쓰이거나 깨진 부분은 지우지 않고 건너뛴 것으로 기록한다 (다른 프로세스가 아직
+        쓰는 중인 멤버일 수 있음 - 그 프로세스는 자기 멤버를 직접 색인한다).
+
+        Returns:
+            새로 색인한 항목 수
+        """
+        count = 0
+        with self._lock:
+            indexed = dict(self.conn.execute("SELECT name, indexed_bytes FROM segments").fetchall())
+            for path in sorted(self.segments_dir.glob('*.jsonl.gz')):
+                size = path.stat().st_size
+                if size <= indexed.get(path.name, 0):
+                    continue
+                for offset, records in self.read_members(path, indexed.get(path.name, 0)):
+                    self._index_member(path.name, offset, records)
+                    count += sum(1 for record in records if record.get('kind') != 'digest')
+                self.conn.execute(
+                    "INSERT INTO segments (name, indexed_bytes) VALUES (?, ?) ON CONFLICT(name) "
+                    "DO UPDATE SET indexed_bytes = max(indexed_bytes, excluded.indexed_bytes)",
+                    (path.name, size),
+                )
+            self.conn.commit()
+        if count:
+            print(f"📚 아카이브 색인 보충: {count}개 항목")
+        return count
+
+    def reindex(self) -> int:
+        """세그먼트 전체에서 색인 다시 만들기 (색인이 없거나 깨졌을 때)"""
+        count = 0
+        with self._lock:
+            self.conn.executescript("DELETE FROM terms; DELETE FROM items; DELETE FROM segments;")
+            for path in sorted(self.segments_dir.glob('*.jsonl.gz')):
+                for offset, records in self.read_members(path):
+                    self._index_member(path.name, offset, records)
+                    count += sum(1 for record in records if record.get('kind') != 'digest')
+                self.conn.execute("INSERT INTO segments (name, indexed_bytes) VALUES (?, ?)",
+                                  (path.name, path.stat().st_size))
+            self.conn.commit()
+        return count
+
+    # ---- 검색 ----
+
+    def _filter_sql(self, filters: dict) -> tuple:
+        """필터 → (SQL 조건 목록, 인자)"""
+        where, params = [], []
+        if 'kind' in filters:
+            where.append("items.kind = ?")
+            params.append(filters['kind'])
+        if 'source' in filters:
+            where.append("items.source = ? COLLATE NOCASE")
+            params.append(filters['source'])
+        if 'lang' in filters:
+            where.append("items.language = ?")
+            params.append(filters['lang'].lower())
+        if 'since' in filters:
+            where.append("items.day >= ?")
+            params.append(filters['since'])
+        if 'until' in filters:
+            where.append("items.day <= ?")
+            params.append(filters['until'])
+        return where, params
+
+    def _posting_count(self, token: str, cap: int = 10000) -> int:
+        """토큰의 포스팅 수 (cap에서 멈춤 - 가장 드문 토큰을 고르는 용도라 대략이면 충분)"""
+        return self.conn.execute(
+            "SELECT count(*) FROM (SELECT 1 FROM terms WHERE token = ? LIMIT ?)", (token, cap)).fetchone()[0]
+
+    def search(self, query: str, limit: int = 20) -> list:
+        """
+        질의 → 같은 URL은 하나로 묶은 결과 (최근에 본 항목부터)
+
+        최신 기록부터 훑다가 서로 다른 항목이 limit개 모이면 멈추므로 기록이 쌓여도
+        훑는 양은 결과 수에 비례한다. 검색어가 있으면 가장 드문 토큰의 포스팅 목록을
+        최신순으로 따라가며 나머지 토큰은 (token, item_id) 기본 키로 하나씩 확인한다.
+
+        Returns:
+            list of {'id', 'kind', 'source', 'title', 'url', 'summary', 'language', 'stars',
+                     'first_day', 'last_day', 'days'} - first_day/last_day/days는 필터 범위 안에서
+        """
+        tokens, filters = parse_query(query)
+        where, params = self._filter_sql(filters)
+
+        with self._lock:
+            if tokens:
+                tokens.sort(key=self._posting_count)
+                driver, others = tokens[0], tokens[1:]
+                conditions = ["terms.token = ?"] + [
+                    "EXISTS (SELECT 1 FROM terms AS t WHERE t.token = ? AND t.item_id = items.id)" for _ in others
+                ] + where
+                cursor = self.conn.execute(
+                    "SELECT items.id, items.url FROM terms JOIN items ON items.id = terms.item_id "
+                    f"WHERE {' AND '.join(conditions)} ORDER BY terms.item_id DESC",
+                    [driver, *others, *params],
+                )
+            else:
+                cursor = self.conn.execute(
+                    f"SELECT id, url FROM items {'WHERE ' + ' AND '.join(where) if where else ''} "
+                    "ORDER BY day DESC, id DESC",
+                    params,
+                )
+
+            latest = {}  # URL(없으면 id) → 가장 최근 항목 id
+            for item_id, url in cursor:
+                latest.setdefault(url or item_id, item_id)
+                if len(latest) >= limit:
+                    break
+            cursor.close()
+            if not latest:
+                return []
+
+            urls = [key for key in latest if isinstance(key, str)]
+            spans = {}
+            if urls:
+                marks = ','.join('?' * len(urls))
+                spans = {
+                    url: (first, last, days)
+                    for url, first, last, days in self.conn.execute(
+                        f"SELECT url, min(day), max(day), count(DISTINCT day) FROM items "
+                        f"WHERE {' AND '.join([f'url IN ({marks})'] + where)} GROUP BY url",
+                        [*urls, *params],
+                    )
+                }
+
+            ids = list(latest.values())
+            rows = self.conn.execute(
+                "SELECT id, kind, source, title, url, summary, language, stars, day FROM items "
+                f"WHERE id IN ({','.join('?' * len(ids))})",
+                ids,
+            ).fetchall()
+
+        results = []
+        for item_id, kind, source, title, url, summary, language, stars, day in rows:
+            first, last, days = spans.get(url, (day, day, 1))
+            results.append({
+                'id': item_id, 'kind': kind, 'source': source, 'title': title, 'url': url,
+                'summary': summary, 'language': language, 'stars': stars,
+                'first_day': first, 'last_day': last, 'days': days,
+            })
+        results.sort(key=lambda result: (result['last_day'], result['days']), reverse=True)
+        return results
+
+    def get(self, item_id: int) -> Item:
+        """색인 id → 세그먼트에 저장된 원본 항목 (없으면 None)"""
+        with self._lock:
+            row = self.conn.execute("SELECT segment, member_offset, line FROM items WHERE id = ?",
+                                    (item_id,)).fetchone()
+        if not row:
+            return None
+
+        segment, offset, line = row
+        with open(self.segments_dir / segment, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+        body = zlib.decompressobj(wbits=31).decompress(data)  # 멤버 하나만 풀림
+        return Item.from_dict(json.loads(body.decode('utf-8').splitlines()[line]))
+
+    def stats(self) -> dict:
+        with self._lock:
+            items, first, last = self.conn.execute("SELECT count(*), min(day), max(day) FROM items").fetchone()
+            tokens = self.conn.execute("SELECT count(DISTINCT token) FROM terms").fetchone()[0]
+            kinds = dict(self.conn.execute("SELECT kind, count(*) FROM items GROUP BY kind").fetchall())
+        segments = list(self.segments_dir.glob('*.jsonl.gz'))
+        return {
+            'items': items,
+            'kinds': kinds,
+            'first_day': first,
+            'last_day': last,
+            'segments': len(segments),
+            'segment_bytes': sum(path.stat().st_size for path in segments),
+            'tokens': tokens,
+        }
+
+    def close(self):
+        self.conn.close()
+
+
+def format_result(result: dict) -> str:
+    seen = result['last_day'] if result['days'] == 1 else f"{result['first_day']}~{result['last_day']} ({result['days']}일)"
+    extra = f" ⭐{result['stars']:,}" if result['stars'] is not None else ""
+    line = f"[{result['id']}] {seen}  {result['kind']}/{result['source']}{extra}  {result['title']}"
+    if result['summary']:
+        line += f"\n      📌 {result['summary']}"
+    if result['url']:
+        line += f"\n      {result['url']}"
+    return line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="다이제스트 아카이브 검색")
+    parser.add_argument('--dir', type=Path, help="아카이브 위치 (기본 .cache/archive)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    search = commands.add_parser('search', help="검색 (예: \"gemini kind:article last:7d\")")
+    search.add_argument('query', nargs='+')
+    search.add_argument('--limit', type=int, default=20)
+    search.add_argument('--json', action='store_true', help="JSON으로 출력")
+
+    show = commands.add_parser('show', help="항목 원본 레코드")
+    show.add_argument('id', type=int)
+
+    commands.add_parser('stats', help="아카이브 통계")
+    commands.add_parser('reindex', help="세그먼트에서 색인 다시 만들기")
+    args = parser.parse_args()
+
+    archive = Archive(args.dir)
+
+    if args.command == 'search':
+        started = time.perf_counter()
+        try:
+            results = archive.search(' '.join(args.query), limit=args.limit)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(2)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        if args.json:
+            print(json.dumps(results, ensure_ascii=False, indent=2))
+        else:
+            for result in results:
+                print(format_result(result))
+            print(f"\n🔎 {len(results)}개 ({elapsed:.1f}ms)")
+
+    elif args.command == 'show':
+        item = archive.get(args.id)
+        if item is None:
+            print(f"❌ 항목 없음: {args.id}")
+            sys.exit(1)
+        print(json.dumps(item.to_dict(), ensure_ascii=False, indent=2))
+
+    elif args.command == 'stats':
+        stats = archive.stats()
+        print(f"📚 항목 {stats['items']:,}개 {stats['kinds']}, {stats['first_day']} ~ {stats['last_day']}")
+        print(f"   세그먼트 {stats['segments']}개 ({stats['segment_bytes'] / 1024:.0f}KB), 토큰 {stats['tokens']:,}개")
+
+    elif args.command == 'reindex':
+        started = time.perf_counter()
+        count = archive.reindex()
+        print(f"✅ {count:,}개 항목 색인 ({time.perf_counter() - started:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
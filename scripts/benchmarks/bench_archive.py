@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+아카이브 검색 벤치마크
+임시 디렉토리에 몇 년 치 가짜 수집 기록(하루 한 번, 레포 25개 + 기사 수십 개)을 쌓고
+저장 속도, 디스크 크기, 질의 지연 시간(중앙값)을 측정
+
+실행:
+    cd scripts
+    python benchmarks/bench_archive.py [--years 3] [--articles 60]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from archive import Archive
+from models import Article, Repo
+
+LANGUAGES = ['Python', 'Rust', 'TypeScript', 'Go', 'C++', 'Zig', 'Java', 'Swift']
+WORDS = ('gemini openai llama agent kubernetes postgres sqlite redis browser chip quantum '
+         'robotaxi satellite lawsuit funding startup malware passkeys android linux').split()
+KOREAN = ['제미나이', '오픈소스', '데이터베이스', '보안', '스타트업', '반도체', '클라우드', '인공지능']
+SOURCES = ['GeekNews', 'TechCrunch', 'The Verge', 'Ars Technica', 'Hacker News', 'Wired']
+
+QUERIES = [
+    "lang:rust kind:repo month:{month}",
+    "gemini kind:article last:7d",
+    "제미나이",
+    "kubernetes postgres",
+    "source:GeekNews 보안",
+    "kind:repo",
+]
+
+
+def fake_day(rng: random.Random, day: int, articles: int) -> list:
+    repos = [
+        Repo(source='github', url=f"https://github.com/owner{n}/project{n}", title=f"owner{n}/project{n}",
+             summary=f"{rng.choice(KOREAN)} {rng.choice(WORDS)} 도구",
+             description=' '.join(rng.sample(WORDS, 6)), language=rng.choice(LANGUAGES),
+             stars=rng.randint(100, 100_000), rank=rank)
+        for rank, n in enumerate(rng.sample(range(day * 3, day * 3 + 400), 25), 1)
+    ]
+    news = [
+        Article(source=(source := rng.choice(SOURCES)), url=f"https://news.example.com/{day}/{i}",
+                title=' '.join(rng.sample(WORDS, 5)).capitalize(),
+                summary=f"{rng.choice(KOREAN)} 관련 {rng.choice(KOREAN)} 소식",
+                description=' '.join(rng.sample(WORDS, 12)),
+                lang='ko' if source == 'GeekNews' else 'en')
+        for i in range(articles)
+    ]
+    return repos + news
+
+
+def main():
+    parser = argparse.ArgumentParser(description="아카이브 검색 벤치마크")
+    parser.add_argument('--years', type=float, default=3)
+    parser.add_argument('--articles', type=int, default=60, help="하루 기사 수")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    days = int(args.years * 365)
+    start = datetime.now() - timedelta(days=days - 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = Archive(Path(tmp))
+        started = time.perf_counter()
+        for day in range(days):
+            collected_at = (start + timedelta(days=day)).replace(hour=8).timestamp()
+            archive.add_run(fake_day(rng, day, args.articles), digest="digest", collected_at=collected_at)
+        ingest = time.perf_counter() - started
+
+        stats = archive.stats()
+        index_bytes = (Path(tmp) / 'index.sqlite3').stat().st_size
+        print(f"📚 {days}일, 항목 {stats['items']:,}개 - 저장 {ingest:.1f}초 ({stats['items'] / ingest:,.0f}개/초)")
+        print(f"   세그먼트 {stats['segment_bytes'] / 1024 / 1024:.1f}MB, 색인 {index_bytes / 1024 / 1024:.1f}MB, "
+              f"토큰 {stats['tokens']:,}개\n")
+
+        month = (start + timedelta(days=days // 2)).strftime('%Y-%m')
+        for query in QUERIES:
+            query = query.format(month=month)
+            times = []
+            for _ in range(args.repeat):
+                began = time.perf_counter()
+                results = archive.search(query)
+                times.append(time.perf_counter() - began)
+            print(f"  {query:<40} {statistics.median(times) * 1000:7.2f}ms  (최대 {max(times) * 1000:.2f}ms)  {len(results)}개")
+
+        archive.close()
+
+
+if __name__ == "__main__":
+    main()
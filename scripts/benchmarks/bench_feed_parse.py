@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+피드 다운로드/파싱 분리 벤치마크
+로컬 가짜 서버(fake_server.py)에 피드 N개(기본 60개)를 올리고 RSSCollector.fetch_all 처리량 측정
+- 저장해둔 실제 피드 9종 + 본문 전체를 싣는 큰 피드(The Verge 전문 피드 같은 1~2MB)를 섞어서 복제
+- 파싱 프로세스 0개(받은 스레드에서 바로 파싱, 예전 방식) vs 1/2/4개
+- 비교용: 받아둔 원문만 순서대로 파싱 / 프로세스 풀로 파싱 (네트워크 없이 파싱 상한)
+
+코어가 하나뿐인 환경에서는 프로세스 풀이 이득을 낼 수 없으므로 코어 수를 함께 출력한다.
+
+실행:
+    cd scripts
+    python benchmarks/bench_feed_parse.py [--feeds 60] [--big-every 4] [--workers 0 1 2 4] [--latency 50]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fake_server import FakeServer, FEED_FIXTURES
+
+from collectors.rss_collector import RSSCollector, parse_feed
+from utils.http_cache import HTTPCache
+
+PARAGRAPH = "<p>Lorem ipsum dolor sit amet, <b>consectetur</b> adipiscing elit &amp; sed do eiusmod.</p>"
+
+
+def full_content_feed(items: int, item_bytes: int) -> bytes:
+    """본문 전체(content:encoded)를 싣는 큰 RSS 피드"""
+    body = PARAGRAPH * max(1, item_bytes // len(PARAGRAPH))
+    entries = "".join(
+        f"<item><title>Full story {i}</title><link>https://big.example.com/{i}</link>"
+        f"<description><![CDATA[{PARAGRAPH}]]></description>"
+        f"<content:encoded><![CDATA[{body}]]></content:encoded>"
+        f"<pubDate>Mon, 06 Oct 2026 {i % 24:02d}:00:00 GMT</pubDate></item>"
+        for i in range(items)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+        f"<channel><title>Full content</title>{entries}</channel></rss>"
+    ).encode('utf-8')
+
+
+def build_feeds(server: FakeServer, count: int, big_every: int, big_items: int, big_item_bytes: int) -> dict:
+    """RSS_FEEDS 형식 피드 count개 (big_every개마다 하나는 큰 피드, URL은 모두 다르게)"""
+    server.fixtures['feed_full_content.xml'] = full_content_feed(big_items, big_item_bytes)
+    fixtures = list(FEED_FIXTURES.values())
+    feeds = {}
+    for i in range(count):
+        fixture = 'feed_full_content.xml' if big_every and i % big_every == 0 else fixtures[i % len(fixtures)]
+        feeds[f"feed-{i:03d}"] = {'url': f"{server.url}/feeds/{fixture}?copy={i}", 'lang': 'en', 'category': 'general'}
+    return feeds
+
+
+def run_fetch_all(feeds: dict, workers: int, repeat: int, max_workers: int) -> tuple:
+    """
+    같은 수집기(파싱 프로세스 유지)로 빈 캐시에서 repeat회 fetch_all
+
+    Returns:
+        (첫 실행 시간 - 프로세스 시작 포함, 이후 중앙값, 피드별 항목 수)
+    """
+    collector = RSSCollector(use_ai_summary=False, max_per_source=1000, max_workers=max_workers,
+                             feed_timeout=60, total_timeout=600, parse_workers=workers)
+    times, counts = [], {}
+    try:
+        for _ in range(repeat + 1):
+            with tempfile.TemporaryDirectory() as tmp:
+                collector.http_cache = HTTPCache(Path(tmp))
+                with contextlib.redirect_stdout(io.StringIO()):
+                    started = time.perf_counter()
+                    results = collector.fetch_all(feeds)
+                    times.append(time.perf_counter() - started)
+            counts = {name: len(articles) for name, articles in results.items()}
+    finally:
+        collector.close()
+    return times[0], statistics.median(times[1:]), counts
+
+
+def run_parse_only(bodies: list, workers: int, repeat: int) -> float:
+    """네트워크 없이 원문 파싱만 (workers=0이면 순서대로)"""
+    times = []
+    if not workers:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for body in bodies:
+                parse_feed(body)
+            times.append(time.perf_counter() - started)
+        return statistics.median(times)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(parse_feed, bodies[:workers]))  # 워커 시작은 빼고 측정
+        for _ in range(repeat):
+            started = time.perf_counter()
+            list(pool.map(parse_feed, bodies))
+            times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="피드 다운로드/파싱 분리 벤치마크")
+    parser.add_argument('--feeds', type=int, default=60)
+    parser.add_argument('--big-every', type=int, default=4, help="이 개수마다 큰 피드 하나 (0이면 없음)")
+    parser.add_argument('--big-items', type=int, default=100, help="큰 피드의 항목 수")
+    parser.add_argument('--big-item-kb', type=int, default=20, help="큰 피드 항목 하나의 본문 크기 (KB)")
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 1, 2, 4], help="파싱 프로세스 수 (0 = 스레드에서)")
+    parser.add_argument('--max-workers', type=int, default=8, help="다운로드 스레드 수")
+    parser.add_argument('--latency', type=float, default=50, help="HTTP 응답 지연 (ms)")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    server = FakeServer(latency=args.latency / 1000).start()
+    try:
+        feeds = build_feeds(server, args.feeds, args.big_every, args.big_items, args.big_item_kb * 1024)
+        bodies = [server.fixtures[info['url'].rsplit('/', 1)[1].split('?')[0]] for info in feeds.values()]
+        total_mb = sum(len(body) for body in bodies) / 1e6
+        big = sum(len(body) >= 128 * 1024 for body in bodies)
+        print(f"🧪 피드 {len(feeds)}개 (128KB 이상 {big}개), 원문 {total_mb:.1f}MB, "
+              f"지연 {args.latency:.0f}ms, 다운로드 스레드 {args.max_workers}개, 코어 {os.cpu_count()}개")
+        if (os.cpu_count() or 1) < 2:
+            print("⚠️ 코어가 하나라 파싱 프로세스는 병렬로 돌 수 없음 (왕복 비용만 측정됨)")
+
+        print("\n📊 파싱만 (네트워크 없음)")
+        baseline = None
+        for workers in args.workers:
+            seconds = run_parse_only(bodies, workers, args.repeat)
+            baseline = baseline or seconds
+            label = '순서대로' if not workers else f"프로세스 {workers}개"
+            print(f"  {label:<12} {seconds * 1000:8.1f}ms  {total_mb / seconds:7.1f}MB/s  x{baseline / seconds:.2f}")
+
+        print("\n📊 fetch_all (다운로드 스레드 + 파싱)")
+        baseline, expected = None, None
+        for workers in args.workers:
+            first, seconds, counts = run_fetch_all(feeds, workers, args.repeat, args.max_workers)
+            baseline = baseline or seconds
+            label = '스레드에서' if not workers else f"프로세스 {workers}개"
+            print(f"  {label:<12} {seconds * 1000:8.1f}ms  {len(feeds) / seconds:6.1f}피드/s  "
+                  f"{total_mb / seconds:6.1f}MB/s  x{baseline / seconds:.2f}  (첫 실행 {first * 1000:.0f}ms)")
+            if expected is None:
+                expected = counts
+            elif counts != expected:
+                print(f"❌ 프로세스 {workers}개 결과가 스레드 파싱과 다름")
+                sys.exit(1)
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+항목 모델 메모리/속도 비교
+같은 기사/레포 N개를 예전 dict 형식과 models의 __slots__ 데이터클래스로 만들어
+- tracemalloc으로 잰 항목당 메모리
+- 생성 시간, JSON 직렬화(to_dict + json.dumps) / 역직렬화 시간, 필드 읽기 시간
+을 비교
+
+실행:
+    cd scripts
+    python benchmarks/bench_item_memory.py [--count 100000]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models import Article, Item, Repo
+
+
+def article_dict(i: int) -> dict:
+    return {
+        'source': 'TechCrunch',
+        'lang': 'en',
+        'category': 'startup',
+        'title': f"Startup {i} raises Series A to build developer tools",
+        'link': f"https://techcrunch.com/2025/01/01/startup-{i}/",
+        'description': "A short description of the article.",
+        'published': '2025-01-01T09:00:00Z',
+        'summary_kr': "개발자 도구 스타트업 투자 유치",
+        'sources': ['TechCrunch'],
+    }
+
+
+def article_model(i: int) -> Article:
+    return Article(
+        source='TechCrunch',
+        url=f"https://techcrunch.com/2025/01/01/startup-{i}/",
+        title=f"Startup {i} raises Series A to build developer tools",
+        summary="개발자 도구 스타트업 투자 유치",
+        timestamp='2025-01-01T09:00:00Z',
+        description="A short description of the article.",
+        lang='en',
+        category='startup',
+        sources=['TechCrunch'],
+    )
+
+
+def repo_dict(i: int) -> dict:
+    return {
+        'rank': i % 25 + 1,
+        'owner': 'owner',
+        'name': f"project-{i}",
+        'full_name': f"owner/project-{i}",
+        'url': f"https://github.com/owner/project-{i}",
+        'description': "A fast library for something useful.",
+        'language': 'Python',
+        'stars': 1000 + i,
+        'forks': 100 + i,
+        'today_stars': "123 stars today",
+        'summary_kr': "유용한 무언가를 위한 빠른 라이브러리",
+    }
+
+
+def repo_model(i: int) -> Repo:
+    return Repo(
+        source='github',
+        url=f"https://github.com/owner/project-{i}",
+        title=f"owner/project-{i}",
+        summary="유용한 무언가를 위한 빠른 라이브러리",
+        owner='owner',
+        name=f"project-{i}",
+        description="A fast library for something useful.",
+        language='Python',
+        stars=1000 + i,
+        forks=100 + i,
+        today_stars="123 stars today",
+        rank=i % 25 + 1,
+    )
+
+
+def measure_memory(build, count: int) -> tuple:
+    """(항목 목록, 항목당 바이트) - 문자열 값까지 포함한 전체 할당"""
+    gc.collect()
+    tracemalloc.start()
+    items = [build(i) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return items, size / count
+
+
+def timed(fn, repeat: int = 5) -> float:
+    """repeat회 중 최솟값 (timeit처럼 측정 중에는 GC를 끔)"""
+    times = []
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - started)
+    finally:
+        gc.enable()
+    return min(times)
+
+
+def bench(kind: str, build_dict, build_model, count: int):
+    dicts, dict_bytes = measure_memory(build_dict, count)
+    models, model_bytes = measure_memory(build_model, count)
+
+    url_key = 'link' if kind == 'article' else 'url'
+    dict_json = json.dumps(dicts, ensure_ascii=False)
+    model_json = json.dumps([item.to_dict() for item in models], ensure_ascii=False)
+    rows = {
+        'build': (timed(lambda: [build_dict(i) for i in range(count)]),
+                  timed(lambda: [build_model(i) for i in range(count)])),
+        'to_json': (timed(lambda: json.dumps(dicts, ensure_ascii=False)),
+                    timed(lambda: json.dumps([item.to_dict() for item in models], ensure_ascii=False))),
+        'from_json': (timed(lambda: json.loads(dict_json)),
+                      timed(lambda: [Item.from_dict(data) for data in json.loads(model_json)])),
+        'read_fields': (timed(lambda: [(d['title'] if 'title' in d else d['full_name'], d[url_key]) for d in dicts]),
+                        timed(lambda: [(item.title, item.url) for item in models])),
+    }
+
+    print(f"\n📦 {kind} × {count:,}")
+    print(f"  {'memory/item':<12} dict {dict_bytes:8.0f}B   model {model_bytes:8.0f}B   "
+          f"({(model_bytes - dict_bytes) / dict_bytes * 100:+.1f}%)")
+    for name, (dict_s, model_s) in rows.items():
+        print(f"  {name:<12} dict {dict_s * 1000:8.1f}ms  model {model_s * 1000:8.1f}ms  "
+              f"({(model_s - dict_s) / dict_s * 100:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="dict vs __slots__ 항목 모델 비교")
+    parser.add_argument('--count', type=int, default=100_000, help="만들 항목 수")
+    args = parser.parse_args()
+
+    print(f"🧪 항목 모델 벤치마크 (Python {sys.version.split()[0]})")
+    bench('article', article_dict, article_model, args.count)
+    bench('repo', repo_dict, repo_model, args.count)
+
+
+if __name__ == "__main__":
+    main()
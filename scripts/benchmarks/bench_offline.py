@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+오프라인 벤치마크
+github.com / RSS 피드 / Gemini / Telegram 대신 로컬 가짜 서버(fake_server.py)를 띄우고
+단계별 처리량과 전체 지연 시간을 측정
+
+측정 단계:
+- get_trending (cold: 빈 캐시 / warm: 304 + 요약 캐시)
+- collect_all (cold / warm)
+- 포매터 (GitHub/RSS 마크다운, 텔레그램, 다이제스트 4개 형식)
+- main.main() (cold / warm, 텔레그램 발송까지)
+
+단계마다 빈 캐시 디렉토리에서 --repeat회 반복해 중앙값을 쓰고, 결과 JSON에 커밋과
+설정을 같이 저장해 커밋끼리 비교할 수 있게 한다.
+
+실행:
+    cd scripts
+    python benchmarks/bench_offline.py --output bench.json
+    python benchmarks/bench_offline.py --latency 200 --fail-rate 0.1 --compare bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fake_server import FakeServer, FakeLLMModel
+
+import archive
+import main as news_main
+import renderers
+import star_history
+from collectors.github_trending import GitHubTrendingCollector
+from collectors.rss_collector import RSSCollector, RSS_FEEDS
+from senders.telegram_sender import TelegramSender
+from utils import cursor_store, gemini, http_cache, seen_store, source_health, summary_cache
+from utils import metrics as metrics_module
+from utils.llm_executor import LLMExecutor
+
+
+def use_cache_dir(root: Path):
+    """캐시/기록/결과 파일 기본 위치를 임시 디렉토리로 (실제 .cache, output을 건드리지 않게)"""
+    renderers.OUTPUT_DIR = root / 'output'
+    archive.DEFAULT_ARCHIVE_DIR = root / 'archive'
+    star_history.DEFAULT_STARS_DIR = root / 'stars'
+    http_cache.DEFAULT_CACHE_DIR = root / 'http'
+    summary_cache.DEFAULT_DB_PATH = root / 'summaries.sqlite3'
+    seen_store.DEFAULT_DB_PATH = root / 'seen.sqlite3'
+    source_health.DEFAULT_DB_PATH = root / 'health.sqlite3'
+    cursor_store.DEFAULT_DB_PATH = root / 'x_cursors.sqlite3'
+    metrics_module.DEFAULT_METRICS_DIR = root / 'metrics'
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=Path(__file__).parent).stdout.strip() or 'unknown'
+    except OSError:
+        return 'unknown'
+
+
+class Bench:
+    def __init__(self, server: FakeServer, repeat: int, llm_rpm: float, verbose: bool = False):
+        self.server = server
+        self.repeat = repeat
+        self.llm_rpm = llm_rpm
+        self.verbose = verbose
+        self.results = {}
+
+    def quiet(self):
+        return contextlib.nullcontext() if self.verbose else contextlib.redirect_stdout(io.StringIO())
+
+    def record(self, stage: str, times: list, items: int, stats: dict):
+        median = statistics.median(times)
+        self.results[stage] = {
+            'median_s': round(median, 4),
+            'min_s': round(min(times), 4),
+            'items': items,
+            'items_per_s': round(items / median, 1) if median else None,
+            'http_requests': stats.get('trending', 0) + stats.get('feed', 0),
+            'not_modified': stats.get('304', 0),
+            'llm_calls': stats.get('llm', 0),
+            'telegram_calls': stats.get('telegram', 0),
+            'injected_failures': stats.get('injected_failures', 0),
+        }
+        result = self.results[stage]
+        print(f"  {stage:<22} {median * 1000:9.1f}ms  (min {min(times) * 1000:.1f}ms)  "
+              f"{items}개, HTTP {result['http_requests']} (304 {result['not_modified']}), LLM {result['llm_calls']}")
+
+    def run_stage(self, stage: str, setup, fn, warm: bool = False):
+        """
+        빈 캐시에서 setup() → (warm이면 한 번 미리 실행) → fn 시간 측정, repeat회
+
+        Args:
+            setup: 인자 없이 호출하면 측정 대상 객체 반환
+            fn: setup 결과를 받아 처리한 항목 수 반환
+        """
+        times, items = [], 0
+        for _ in range(self.repeat):
+            with tempfile.TemporaryDirectory() as tmp:
+                use_cache_dir(Path(tmp))
+                with self.quiet():
+                    target = setup()
+                    if warm:
+                        fn(target)
+                    self.server.reset_stats()
+                    started = time.perf_counter()
+                    items = fn(target)
+                    times.append(time.perf_counter() - started)
+        self.record(stage, times, items, dict(self.server.stats))
+
+    def github(self):
+        return GitHubTrendingCollector(use_ai_summary=True, llm_executor=LLMExecutor(rate_per_minute=self.llm_rpm))
+
+    def rss(self):
+        return RSSCollector(use_ai_summary=True, max_per_source=3, llm_executor=LLMExecutor(rate_per_minute=self.llm_rpm))
+
+    def run_formatters(self, repeat: int = 200):
+        """포매터 처리량 (한 번 수집한 결과로)"""
+        with tempfile.TemporaryDirectory() as tmp:
+            use_cache_dir(Path(tmp))
+            with self.quiet():
+                github, rss = self.github(), self.rss()
+                repos = github.get_trending()
+                articles = rss.collect_all()
+
+        sections = news_main.digest_sections(repos, articles, rss)
+        formats = tuple(renderers.FORMATS)
+
+        def digest():
+            renderers.render(sections, {fmt: io.StringIO() for fmt in formats})
+
+        formatters = {
+            'format_github_md': lambda: github.format_markdown(repos),
+            'format_rss_md': lambda: rss.format_markdown(articles),
+            'format_rss_tg': lambda: rss.format_telegram(articles, max_items=8),
+            'format_digest': digest,
+        }
+        for stage, fn in formatters.items():
+            times = []
+            for _ in range(self.repeat):
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    fn()
+                times.append(time.perf_counter() - started)
+            self.record(stage, times, repeat, {})
+
+    def groups(self) -> dict:
+        """단계 묶음 이름 → 실행 함수 (--only로 고를 수 있는 단위)"""
+        def trending(collector):
+            return len(collector.get_trending())
+
+        def collect(collector):
+            return sum(len(articles) for articles in collector.collect_all().values())
+
+        def run_main(_):
+            # main은 실제 설정 그대로 (Gemini 무료 티어 속도 제한 포함)
+            news_main.main()
+            return 1
+
+        def stage_pair(name, setup, fn):
+            return lambda: (self.run_stage(f"{name}.cold", setup, fn),
+                            self.run_stage(f"{name}.warm", setup, fn, warm=True))
+
+        return {
+            'get_trending': stage_pair('get_trending', self.github, trending),
+            'collect_all': stage_pair('collect_all', self.rss, collect),
+            'format': self.run_formatters,
+            'main': stage_pair('main', lambda: None, run_main),
+        }
+
+
+def compare(current: dict, previous: dict):
+    """이전 결과와 중앙값 비교"""
+    print(f"\n📊 비교: {previous.get('commit')} → {current.get('commit')}")
+    for stage, result in current['results'].items():
+        before = previous.get('results', {}).get(stage)
+        if not before or not before['median_s']:
+            continue
+        change = (result['median_s'] - before['median_s']) / before['median_s'] * 100
+        mark = '🟢' if change < -5 else '🔴' if change > 5 else '⚪'
+        print(f"  {mark} {stage:<22} {before['median_s'] * 1000:9.1f}ms → {result['median_s'] * 1000:9.1f}ms ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 벤치마크 (로컬 가짜 서버)")
+    parser.add_argument('--latency', type=float, default=50, help="HTTP 응답 지연 (ms)")
+    parser.add_argument('--jitter', type=float, default=0, help="지연에 더할 무작위 범위 (ms)")
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="HTTP 503 주입 비율 (0~1)")
+    parser.add_argument('--llm-latency', type=float, default=500, help="가짜 LLM 응답 시간 (ms)")
+    parser.add_argument('--llm-rpm', type=float, default=15, help="단계별 측정에서 LLM 분당 요청 한도")
+    parser.add_argument('--repeat', type=int, default=3, help="단계별 반복 횟수 (중앙값 사용)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', nargs='+', choices=['get_trending', 'collect_all', 'format', 'main'],
+                        help="이 단계만 측정")
+    parser.add_argument('--output', type=Path, help="결과 JSON 저장 위치")
+    parser.add_argument('--compare', type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument('--verbose', action='store_true', help="수집기 출력 그대로 보기")
+    args = parser.parse_args()
+
+    server = FakeServer(latency=args.latency / 1000, jitter=args.jitter / 1000, fail_rate=args.fail_rate,
+                        llm_latency=args.llm_latency / 1000, seed=args.seed).start()
+
+    # 외부 서비스 → 가짜 서버
+    gemini.model_factory = lambda model_name: FakeLLMModel(f"{server.url}/llm")
+    GitHubTrendingCollector.BASE_URL = f"{server.url}/trending"
+    RSSCollector.FEEDS = server.feeds(RSS_FEEDS)
+    TelegramSender.API_URL = f"{server.url}/bot{{token}}/sendMessage"
+    os.environ['TELEGRAM_BOT_TOKEN'] = 'bench'
+    os.environ['TELEGRAM_CHAT_ID'] = '1'
+
+    config = {key: value for key, value in vars(args).items() if key not in ('output', 'compare', 'verbose')}
+    print(f"🧪 오프라인 벤치마크 - 커밋 {git_commit()}, {server.url}")
+    print(f"   {config}\n")
+
+    bench = Bench(server, args.repeat, args.llm_rpm, args.verbose)
+    groups = bench.groups()
+    try:
+        for name in args.only or groups:
+            groups[name]()
+    finally:
+        server.stop()
+
+    current = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'config': config,
+        'results': bench.results,
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(current, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"\n💾 저장됨: {args.output}")
+
+    if args.compare:
+        compare(current, json.loads(args.compare.read_text(encoding='utf-8')))
+
+
+if __name__ == "__main__":
+    main()
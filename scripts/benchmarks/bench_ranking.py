@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+다이제스트 순위 매기기 벤치마크
+가짜 후보(기사 + 레포) N개에 점수를 매기고 상위 k개를 고르는 시간 측정
+- 힙 top-k (ranking.select_top, 소스당 제한 있음/없음)
+- 비교용: 전체 정렬 후 앞에서 k개
+
+실행:
+    cd scripts
+    python benchmarks/bench_ranking.py [--candidates 1000 5000 20000] [--k 13]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models import Article, Repo
+from ranking import Ranker, SOURCE_WEIGHTS
+
+SOURCES = [*SOURCE_WEIGHTS, 'TechCrunch', 'The Verge', 'Ars Technica', 'Wired']
+CATEGORIES = ['general', 'dev', 'research']
+
+
+def fake_candidates(rng: random.Random, count: int, now: datetime) -> list:
+    items = []
+    for i in range(count):
+        if i % 5 == 0:
+            items.append(Repo(source='github', url=f"https://github.com/o/r{i}", title=f"o/r{i}",
+                              today_stars=f"{rng.randint(0, 5000):,} stars today",
+                              appearances=[{}] * rng.randint(1, 4)))
+            continue
+        source = rng.choice(SOURCES)
+        published = now - timedelta(minutes=rng.randint(0, 72 * 60))
+        description = f"Points: {rng.randint(1, 1500)}" if source == 'Hacker News' else "본문 " * 20
+        items.append(Article(source=source, url=f"https://news.example.com/{i}", title=f"기사 {i}",
+                             timestamp=published.isoformat(), description=description,
+                             category=rng.choice(CATEGORIES), sources=[source] * rng.choice((1, 1, 1, 2, 3))))
+    return items
+
+
+def timed(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="순위 매기기 벤치마크")
+    parser.add_argument('--candidates', type=int, nargs='+', default=[1000, 5000, 20000])
+    parser.add_argument('--k', type=int, default=13)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    ranker = Ranker(now=now)
+    for count in args.candidates:
+        items = fake_candidates(random.Random(count), count, now)
+        runs = {
+            'score only': lambda: [ranker.score(item) for item in items],
+            'top_k': lambda: ranker.top_k(items, args.k),
+            'top_k per_source=3': lambda: ranker.top_k(items, args.k, per_source=3),
+            'sorted()[:k]': lambda: sorted(items, key=ranker.score, reverse=True)[:args.k],
+        }
+        print(f"📊 후보 {count:,}개, k={args.k}")
+        for name, fn in runs.items():
+            seconds = timed(fn, args.repeat)
+            print(f"  {name:<20} {seconds * 1000:8.2f}ms  ({seconds / count * 1e6:.2f}µs/후보)")
+
+        expected = [item.url for item in sorted(items, key=ranker.score, reverse=True)[:args.k]]
+        if [item.url for item in ranker.top_k(items, args.k)] != expected:
+            print("❌ top_k 결과가 전체 정렬과 다름")
+            sys.exit(1)
+        print()
+
+
+if __name__ == "__main__":
+    main()
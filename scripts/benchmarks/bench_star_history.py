@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+스타 기록(star_history) 벤치마크
+가짜 트렌딩 기록(레포 수천 개, 하루 150개씩 N일)을 쌓고
+- 기록 속도, 파일 크기
+- "이번 주 가장 빨리 오른 레포" 질의 시간 (numpy 열 연산)
+- 비교용: 같은 기록을 레포별 dict로 풀어서 계산하는 방식
+을 측정하고 두 방식의 상위 결과가 같은지 확인 (다르면 종료 코드 1)
+
+실행:
+    cd scripts
+    python benchmarks/bench_star_history.py [--days 365] [--repos 5000]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models import Repo
+from star_history import StarHistory
+
+PER_DAY = 150
+
+
+def fake_history(rng: random.Random, repos: int, days: int, start: datetime):
+    """날짜별 (collected_at, [Repo]) - 인기 레포일수록 자주 오르고 빨리 큼"""
+    stars = [rng.randint(50, 50_000) for _ in range(repos)]
+    growth = [rng.paretovariate(1.5) * 20 for _ in range(repos)]
+    weights = [g ** 0.5 for g in growth]
+    for day in range(days):
+        for index in range(repos):
+            stars[index] += int(growth[index] * rng.uniform(0.5, 1.5))
+        chosen = set(rng.choices(range(repos), weights=weights, k=PER_DAY))
+        yield start + timedelta(days=day, hours=8), [
+            Repo(source='github', url='', title=f"owner{index}/repo{index}", owner=f"owner{index}",
+                 name=f"repo{index}", stars=stars[index], forks=stars[index] // 10,
+                 today_stars=f"{int(growth[index]):,} stars today")
+            for index in sorted(chosen)
+        ]
+
+
+def risers_with_dicts(history: StarHistory, days: int, limit: int) -> list:
+    """비교용: 기록 전체를 {레포: [(day, stars, today)]}로 풀어서 계산"""
+    by_repo = {}
+    for record in history.observations().tolist():
+        day, repo, stars, forks, today = record
+        by_repo.setdefault(repo, {})[day] = (stars, today)
+    end = max(day for rows in by_repo.values() for day in rows)
+    start = end - days + 1
+    results = []
+    for repo, rows in by_repo.items():
+        window = sorted(day for day in rows if day >= start)
+        if not window:
+            continue
+        before = [day for day in rows if day < start]
+        if before:
+            gained = rows[window[-1]][0] - rows[max(before)][0]
+        else:
+            gained = rows[window[-1]][0] - rows[window[0]][0] + rows[window[0]][1]
+        results.append((gained, repo))
+    results.sort(key=lambda result: (-result[0], result[1]))
+    return [history.names[repo] for _, repo in results[:limit]]
+
+
+def timed(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스타 기록 벤치마크")
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--repos', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start = datetime.now() - timedelta(days=args.days)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = StarHistory(Path(tmp))
+        runs = list(fake_history(rng, args.repos, args.days, start))
+        started = time.perf_counter()
+        for collected_at, repos in runs:
+            history.record(repos, collected_at)
+        elapsed = time.perf_counter() - started
+
+        stats = history.stats()
+        print(f"⭐ {args.days}일, 레포 {stats['repos']:,}개, 기록 {stats['observations']:,}개 "
+              f"({stats['bytes'] / 1024:.0f}KB) - 기록 {elapsed / len(runs) * 1000:.2f}ms/실행\n")
+
+        for days in (7, 30):
+            numpy_time = timed(lambda: history.risers(days, 20), args.repeat)
+            dict_time = timed(lambda: risers_with_dicts(history, days, 20), max(1, args.repeat // 5))
+            print(f"  risers {days:>2}일  numpy {numpy_time * 1000:7.2f}ms   "
+                  f"dict {dict_time * 1000:8.2f}ms  (x{dict_time / numpy_time:.0f})")
+
+            expected = risers_with_dicts(history, days, 20)
+            if [riser['name'] for riser in history.risers(days, 20)] != expected:
+                print(f"❌ {days}일 결과가 dict 방식과 다름")
+                sys.exit(1)
+
+        until = (start + timedelta(days=args.days // 2)).date()
+        print(f"\n  과거 시점 ({until}): {timed(lambda: history.risers(7, 20, until), args.repeat) * 1000:.2f}ms")
+        print("\n✅ 상위 결과가 dict 방식과 동일")
+
+
+if __name__ == "__main__":
+    main()
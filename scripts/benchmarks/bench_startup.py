@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+콜드 스타트 import 시간 측정
+모듈마다 새 인터프리터에서 `python -X importtime`으로 import하고 누적 시간과
+가장 무거운 import를 보여줌
+
+실행:
+    cd scripts
+    python benchmarks/bench_startup.py [--max-ms 800] [--top 5]
+
+--max-ms를 주면 main import가 그보다 오래 걸릴 때 종료 코드 1 (CI 회귀 확인용)
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent.parent
+
+MODULES = [
+    'collectors.registry',
+    'collectors.github_trending',
+    'collectors.rss_collector',
+    'collectors.x_collector',
+    'main',
+]
+
+
+def import_times(module: str) -> list:
+    """
+    새 프로세스에서 import한 -X importtime 결과
+
+    Returns:
+        [(cumulative_us, package), ...] - 누적 시간 순
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        cwd=SCRIPTS_DIR, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, package = line[len('import time:'):].split('|')
+        rows.append((int(cumulative), package.strip()))
+
+    return sorted(rows, reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="콜드 스타트 import 시간 측정")
+    parser.add_argument('--max-ms', type=float, help="main import 허용 시간 (ms)")
+    parser.add_argument('--top', type=int, default=5, help="모듈별로 보여줄 무거운 import 수")
+    args = parser.parse_args()
+
+    main_ms = None
+    for module in MODULES:
+        try:
+            rows = import_times(module)
+        except RuntimeError as e:
+            print(f"⚠️ {module}: import 실패 ({e})")
+            continue
+
+        # 최상위 import = 측정 대상 모듈 자체
+        total_ms = next((us for us, package in rows if package == module), rows[0][0]) / 1000
+        if module == 'main':
+            main_ms = total_ms
+
+        print(f"\n📦 {module}: {total_ms:,.1f}ms")
+        nested = [(us, package) for us, package in rows if package != module and '.' not in package]
+        for us, package in nested[:args.top]:
+            print(f"   {us / 1000:8.1f}ms  {package}")
+
+    if args.max_ms is not None and main_ms is not None:
+        if main_ms > args.max_ms:
+            print(f"\n❌ main import {main_ms:,.1f}ms > {args.max_ms:,.0f}ms")
+            sys.exit(1)
+        print(f"\n✅ main import {main_ms:,.1f}ms ≤ {args.max_ms:,.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
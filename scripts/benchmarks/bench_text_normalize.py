@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+피드 설명 정리(utils.text) 벤치마크 + 예전 방식과 결과 비교
+저장된 피드(fixtures/feed_*.xml)의 모든 설명으로
+- 예전 방식 (항목마다 re.sub(r'<[^>]+>', '', ...)[:500])
+- html_to_text (항목별)
+의 처리량과 결과 길이(= 요약 프롬프트 크기)를 비교
+새 방식은 엔티티 디코딩/블록 공백/공백 합치기/경계 자르기까지 하므로 예전 방식보다 느리다
+(목적은 속도가 아니라 프롬프트 품질, 이 벤치는 그 비용이 얼마인지 보여줌)
+
+결과 비교: 공백을 모두 뺀 뒤 '예전 결과 + 엔티티 디코딩'과 새 결과가 같아야 한다
+(새 방식은 문단 사이에 공백을 넣고 공백을 합치므로 공백만 다를 수 있음).
+다르면 처음 몇 개를 보여주고 종료 코드 1.
+
+실행:
+    cd scripts
+    python benchmarks/bench_text_normalize.py [--repeat 50]
+"""
+
+import argparse
+import gc
+import html
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import fastfeedparser
+
+from utils.text import html_to_text
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+LIMIT = 500
+
+# 저장된 피드에는 없지만 실제 피드에서 보이는 경우들
+HARD_CASES = [
+    '<![CDATA[<p>Launch&nbsp;day &mdash; <em>finally</em></p>]]>',
+    '<p>Intro</p><script>var x = "<p>ad</p>";</script><style>p { color: red }</style><p>Body</p>',
+    '<!-- tracking --><div>Line one<br/>Line two</div><ul><li>a</li><li>b</li></ul>',
+    'Caf&eacute; &#8220;quoted&#8221; &amp;amp; &#x1F680; rocket',
+    '가족 이모지 👨‍👩‍👧‍👦 ' * 40,
+]
+
+
+def legacy(description: str) -> str:
+    """예전 build_articles의 설명 처리"""
+    if description:
+        import re
+        description = re.sub(r'<[^>]+>', '', description)[:500]
+    return description
+
+
+def load_descriptions() -> dict:
+    """피드 파일 이름 → 설명 목록"""
+    feeds = {}
+    for path in sorted(FIXTURES_DIR.glob('feed_*.xml')):
+        feed = fastfeedparser.parse(path.read_bytes())
+        feeds[path.stem] = [
+            entry.get('summary', entry.get('description', '')) for entry in (feed.get('entries') or [])
+        ]
+    return feeds
+
+
+def timed(fn, repeat: int) -> float:
+    """repeat회 중 최솟값 (timeit처럼 측정 중에는 GC를 끔)"""
+    times = []
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - started)
+    finally:
+        gc.enable()
+    return min(times)
+
+
+def squash(text: str) -> str:
+    return re.sub(r'\s+', '', text)
+
+
+def compare(descriptions: list) -> list:
+    """공백 말고 내용이 달라진 (원문, 예전, 새) 목록 - 자르기 전 전체 길이로 비교"""
+    mismatches = []
+    for description in descriptions:
+        new = html_to_text(description)
+        old = html.unescape(re.sub(r'<[^>]+>', '', description or ''))
+        if squash(old) != squash(new):
+            mismatches.append((description, old, new))
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="피드 설명 정리 벤치마크")
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    feeds = load_descriptions()
+    everything = [description for descriptions in feeds.values() for description in descriptions]
+    count = len(everything)
+    print(f"📄 저장된 피드 {len(feeds)}개, 설명 {count}개 ({sum(len(d or '') for d in everything) / 1024:.0f}KB)")
+
+    runs = {
+        'legacy': lambda: [legacy(d) for d in everything],
+        'html_to_text': lambda: [html_to_text(d, LIMIT) for d in everything],
+    }
+    baseline = None
+    for name, fn in runs.items():
+        seconds = timed(fn, args.repeat)
+        baseline = baseline or seconds
+        print(f"  {name:<20} {count / seconds:10.0f} items/s  ({seconds * 1000:.2f}ms, x{baseline / seconds:.1f})")
+
+    old_chars = sum(len(legacy(d) or '') for d in everything)
+    new_chars = sum(len(html_to_text(d, LIMIT)) for d in everything)
+    print(f"\n✂️ 결과 길이: {old_chars:,}자 → {new_chars:,}자 ({(new_chars - old_chars) / old_chars * 100:+.1f}%)")
+
+    print("\n🔎 어려운 입력:")
+    for case in HARD_CASES:
+        text = html_to_text(case, 120)
+        print(f"  {case[:60]!r}\n    → {text!r}")
+
+    mismatches = compare(everything)
+    if mismatches:
+        print(f"\n❌ 예전 결과와 내용이 다른 설명 {len(mismatches)}개")
+        for description, old, new in mismatches[:3]:
+            print(f"   원문: {description[:120]!r}\n   예전: {old[:120]!r}\n   새로: {new[:120]!r}")
+        sys.exit(1)
+    print(f"\n✅ 설명 {count}개 모두 예전 결과와 내용 동일 (공백만 정리)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+GitHub Trending 파서 엔진 비교
+- 동일성: 저장된 트렌딩 HTML(fixtures/github_trending_*.html)에서 모든 엔진이
+  bs4와 완전히 같은 repos를 반환하는지 확인 (다르면 종료 코드 1)
+- 처리량: 엔진별 초당 페이지 수
+
+실행:
+    cd scripts
+    python benchmarks/bench_trending_parsers.py [--repeat 50]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from collectors.trending_parsers import ENGINES, available_engines
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+def load_fixtures() -> dict:
+    return {
+        path.name: path.read_text(encoding='utf-8')
+        for path in sorted(FIXTURES_DIR.glob('github_trending_*.html'))
+    }
+
+
+def check_parity(fixtures: dict, engines: list) -> bool:
+    """모든 엔진 결과가 bs4와 같은지 확인"""
+    ok = True
+    reference = ENGINES['bs4'][0]
+
+    for name, html in fixtures.items():
+        expected = reference(html)
+        for engine in engines:
+            actual = ENGINES[engine][0](html)
+            if actual == expected:
+                continue
+
+            ok = False
+            print(f"❌ {engine} ≠ bs4: {name}")
+            for i, (a, e) in enumerate(zip(actual, expected)):
+                if a != e:
+                    a, e = a.to_dict(), e.to_dict()
+                    diff = {k: (a.get(k), e.get(k)) for k in e if a.get(k) != e.get(k)}
+                    print(f"   #{i + 1}: {diff}")
+                    break
+            if len(actual) != len(expected):
+                print(f"   레포 수: {len(actual)} vs {len(expected)}")
+
+    return ok
+
+
+def measure(fixtures: dict, engine: str, repeat: int) -> float:
+    """초당 파싱한 페이지 수"""
+    parse = ENGINES[engine][0]
+    pages = list(fixtures.values())
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            parse(html)
+    elapsed = time.perf_counter() - started
+
+    return repeat * len(pages) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GitHub Trending 파서 엔진 비교")
+    parser.add_argument('--repeat', type=int, default=20, help="픽스처 전체를 반복 파싱할 횟수")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures()
+    engines = available_engines()
+    if 'bs4' not in engines:
+        print("❌ 기준 엔진(bs4)이 필요합니다: pip install beautifulsoup4")
+        sys.exit(1)
+
+    total_kb = sum(len(html.encode('utf-8')) for html in fixtures.values()) / 1024
+    print(f"📄 픽스처 {len(fixtures)}개 ({total_kb:,.0f}KB), 엔진: {', '.join(engines)}")
+
+    if not check_parity(fixtures, engines):
+        sys.exit(1)
+    print("✅ 모든 엔진 결과 동일")
+
+    baseline = None
+    for engine in reversed(engines):  # bs4부터
+        pages_per_sec = measure(fixtures, engine, args.repeat)
+        baseline = baseline or pages_per_sec
+        print(f"  {engine:<11} {pages_per_sec:8.1f} pages/s  (x{pages_per_sec / baseline:.1f})")
+
+
+if __name__ == "__main__":
+    main()
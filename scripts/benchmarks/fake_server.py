@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Fake Server
+오프라인 벤치마크용 로컬 HTTP 서버 - github.com / RSS 피드 / Gemini / Telegram 대신 응답
+- 저장해둔 트렌딩 HTML과 RSS/Atom XML(fixtures/)을 그대로 돌려줌 (ETag, 304 지원)
+- 응답 지연과 실패(503)를 설정한 비율로 주입
+- 가짜 LLM: 설정한 시간만큼 기다렸다가 프롬프트의 항목 수만큼 요약을 JSON으로 반환
+- Telegram sendMessage는 항상 성공
+
+단독 실행 (브라우저/curl로 확인용):
+    python benchmarks/fake_server.py --port 8765 --latency 50
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import urlsplit, parse_qs
+
+import requests
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+# RSS_FEEDS 이름 → 저장된 피드
+FEED_FIXTURES = {
+    'GeekNews': 'feed_geeknews.xml',
+    'TechCrunch': 'feed_techcrunch.xml',
+    'The Verge': 'feed_theverge.xml',
+    'Ars Technica': 'feed_arstechnica.xml',
+    'Wired': 'feed_wired.xml',
+    'Hacker News': 'feed_hackernews.xml',
+    'MIT Tech Review': 'feed_mittechreview.xml',
+    'CNET': 'feed_cnet.xml',
+    'Engadget': 'feed_engadget.xml',
+}
+
+# 요약 프롬프트의 항목 번호 줄 (BatchSummarizer.build_prompt 형식)
+PROMPT_ITEM_RE = re.compile(r'^\[(\d+)\]$', re.MULTILINE)
+
+
+def trending_fixture(path: str, query: dict) -> str:
+    """트렌딩 URL → 픽스처 파일 (/trending, /trending/<언어>?since=...)"""
+    language = path[len('/trending'):].strip('/')
+    if language == 'empty':
+        return 'github_trending_empty.html'
+    if language or query.get('since', ['daily'])[0] != 'daily':
+        return 'github_trending_python_weekly.html'
+    return 'github_trending_daily.html'
+
+
+class FakeServer:
+    def __init__(self, latency: float = 0.05, jitter: float = 0.0, fail_rate: float = 0.0,
+                 llm_latency: float = 1.0, seed: int = 0, port: int = 0):
+        """
+        Args:
+            latency: GET 응답마다 추가할 지연 (초)
+            jitter: 지연에 더할 무작위 범위 (초, 0~jitter)
+            fail_rate: GET 요청을 503으로 실패시킬 확률 (0~1)
+            llm_latency: 가짜 LLM 응답 시간 (초)
+            seed: 지연/실패 난수 시드 (같으면 같은 분포)
+            port: 0이면 빈 포트 자동 선택
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.llm_latency = llm_latency
+        self.random = random.Random(seed)
+        self.port = port
+
+        self.fixtures = {path.name: path.read_bytes() for path in FIXTURES_DIR.glob('*.*')}
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> 'FakeServer':
+        self._server = ThreadingHTTPServer(('127.0.0.1', self.port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats.clear()
+
+    def count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def roll(self) -> tuple:
+        """(이번 요청 지연, 실패 여부)"""
+        with self._lock:
+            delay = self.latency + self.random.uniform(0, self.jitter)
+            failed = self.random.random() < self.fail_rate
+        return delay, failed
+
+    def feeds(self, feeds: dict) -> dict:
+        """RSS_FEEDS와 같은 형식, URL만 이 서버로"""
+        return {
+            name: {**info, 'url': f"{self.url}/feeds/{FEED_FIXTURES[name]}"}
+            for name, info in feeds.items() if name in FEED_FIXTURES
+        }
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def send_body(self, status: int, body: bytes, content_type: str, headers: dict = None):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def send_fixture(self, name: str, content_type: str):
+                body = server.fixtures.get(name)
+                if body is None:
+                    server.count('404')
+                    self.send_body(404, b'not found', 'text/plain')
+                    return
+
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+                if self.headers.get('If-None-Match') == etag:
+                    server.count('304')
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                server.count('200')
+                self.send_body(200, body, content_type, {'ETag': etag})
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                delay, failed = server.roll()
+                time.sleep(delay)
+
+                if url.path.startswith('/trending'):
+                    server.count('trending')
+                    if failed:
+                        server.count('injected_failures')
+                        self.send_body(503, b'unavailable', 'text/plain')
+                        return
+                    self.send_fixture(trending_fixture(url.path, parse_qs(url.query)), 'text/html; charset=utf-8')
+                elif url.path.startswith('/feeds/'):
+                    server.count('feed')
+                    if failed:
+                        server.count('injected_failures')
+                        self.send_body(503, b'unavailable', 'text/plain')
+                        return
+                    self.send_fixture(url.path[len('/feeds/'):], 'application/xml; charset=utf-8')
+                else:
+                    self.send_body(404, b'not found', 'text/plain')
+
+            def do_POST(self):
+                url = urlsplit(self.path)
+                payload = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+
+                if url.path == '/llm':
+                    server.count('llm')
+                    time.sleep(server.llm_latency)
+                    count = len(PROMPT_ITEM_RE.findall(payload.get('prompt', '')))
+                    summaries = [{'id': i, 'summary': f"가짜 요약 {i}"} for i in range(1, count + 1)]
+                    body = json.dumps({'text': json.dumps(summaries, ensure_ascii=False)}, ensure_ascii=False)
+                    self.send_body(200, body.encode('utf-8'), 'application/json')
+                elif url.path.endswith('/sendMessage'):
+                    server.count('telegram')
+                    self.send_body(200, b'{"ok": true, "result": {}}', 'application/json')
+                else:
+                    self.send_body(404, b'{"ok": false}', 'application/json')
+
+        return Handler
+
+
+class FakeLLMModel:
+    """Gemini 모델 대신 가짜 LLM 엔드포인트를 부르는 모델 (generate_content만 구현)"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.session = requests.Session()
+
+    def generate_content(self, prompt: str):
+        response = self.session.post(self.url, json={'prompt': prompt}, timeout=60)
+        response.raise_for_status()
+        return SimpleNamespace(text=response.json()['text'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 벤치마크용 가짜 서버")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=50, help="응답 지연 (ms)")
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="503 응답 비율 (0~1)")
+    parser.add_argument('--llm-latency', type=float, default=1000, help="가짜 LLM 응답 시간 (ms)")
+    args = parser.parse_args()
+
+    server = FakeServer(latency=args.latency / 1000, fail_rate=args.fail_rate,
+                        llm_latency=args.llm_latency / 1000, port=args.port).start()
+    print(f"🧪 가짜 서버 실행 중: {server.url}  (Ctrl+C로 종료)")
+    print(f"   {server.url}/trending?since=daily")
+    for name, fixture in FEED_FIXTURES.items():
+        print(f"   {server.url}/feeds/{fixture}  ({name})")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,185 +6,303 @@ GitHub Trending Collector
 """
 
 import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import os
+from urllib.parse import urlsplit
+import dataclasses
+import random
+import threading
+import time
 from dotenv import load_dotenv
 
+from collectors.trending_parsers import get_parser
+from models import Repo
+from renderers import Section, render_text
+from utils.gemini import create_model
+from utils.http_cache import HTTPCache
+from utils.llm_executor import LLMExecutor
+from utils.metrics import metrics
+from utils.seen_store import SeenStore
+from utils.source_health import CircuitOpenError, SourceHealth
+from utils.summarizer import BatchSummarizer
+from utils.summary_cache import SummaryCache
+
 # .env 로드 (Gemini API 키)
-env_path = Path(__file__).parent.parent.parent.parent / 'web-crawler-ocr' / 'scripts' / '.env'
-load_dotenv(env_path)
+load_dotenv(Path(__file__).parent.parent / '.env')
+
 
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
+SUMMARY_INSTRUCTION = """다음 GitHub 프로젝트들을 각각 한국어로 한 줄(20자 이내)로 요약해줘.
+이모지 없이, 핵심 기능만 간단히."""
+# 프롬프트를 바꾸면 버전도 올릴 것 (요약 캐시 무효화)
+SUMMARY_PROMPT_VERSION = "github-repo-v1"
 
 
 class GitHubTrendingCollector:
     BASE_URL = "https://github.com/trending"
+    PERIODS = ("daily", "weekly", "monthly")
 
-    def __init__(self, use_ai_summary: bool = True):
+    def __init__(self, use_ai_summary: bool = True, http_cache: HTTPCache = None,
+                 summary_batch_size: int = 10, summary_cache: SummaryCache = None,
+                 llm_executor: LLMExecutor = None, summary_timeout: float = 120.0,
+                 seen_store: SeenStore = None, parser_engine: str = 'auto',
+                 max_connections: int = 8, per_host_limit: int = 4, health: SourceHealth = None):
+        """
+        Args:
+            use_ai_summary: Gemini로 한글 요약 생성
+            http_cache: 조건부 GET 캐시 (None이면 기본 위치에 생성)
+            summary_batch_size: Gemini 요청 하나에 묶을 레포 수
+            summary_cache: 요약 캐시 (None이면 기본 위치에 생성)
+            llm_executor: Gemini 호출 실행기 (쿼터 공유를 위해 수집기끼리 같은 것 사용)
+            summary_timeout: 요약 단계 제한 시간 (초, 넘으면 끝난 요약만 사용)
+            seen_store: 이미 보낸 레포 기록 (있으면 처음 트렌딩에 오른 레포만 수집)
+            parser_engine: HTML 파서 ('auto', 'selectolax', 'lxml', 'bs4')
+            max_connections: 세션 커넥션 풀 크기 (여러 목록 동시 수집 시 재사용)
+            per_host_limit: 호스트 하나에 동시에 보낼 최대 요청 수
+            health: 트렌딩 페이지 성공/실패 기록 (있으면 계속 실패할 때 요청 없이 건너뜀, 소스 이름 'github')
+        """
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.per_host_limit = max(1, per_host_limit)
+        self._host_slots = {}
+        self._host_lock = threading.Lock()
         self.use_ai_summary = use_ai_summary
+        self.http_cache = http_cache or HTTPCache()
+        self.seen_store = seen_store
+        self.health = health
+        self.parser_engine, self._parse = get_parser(parser_engine)
         self.model = None
-
-        # Gemini 설정
-        if use_ai_summary and GEMINI_AVAILABLE:
-            api_key = os.getenv('GEMINI_API_KEY')
-            if api_key:
-                genai.configure(api_key=api_key)
-                self.model = genai.GenerativeModel('gemini-2.0-flash')
+        self.summarizer = None
+
+        # Gemini 설정 (google.generativeai는 첫 요약 요청 때 import)
+        if use_ai_summary:
+            self.model = create_model()
+            if self.model:
+                self.summarizer = BatchSummarizer(
+                    self.model, batch_size=summary_batch_size, cache=summary_cache or SummaryCache(),
+                    executor=llm_executor, timeout=summary_timeout, name='github',
+                )
                 print("✅ Gemini 요약 활성화")
             else:
                 print("⚠️ GEMINI_API_KEY 없음, 요약 비활성화")
 
+    @staticmethod
+    def summary_input(name: str, description: str) -> str:
+        """요약 프롬프트에 들어갈 레포 한 개 분량"""
+        return f"프로젝트명: {name}\n설명: {description[:200]}"
+
     def summarize_korean(self, name: str, description: str) -> str:
         """Gemini로 한글 한줄 요약"""
         if not self.model or not description:
             return ""
 
-        try:
-            prompt = f"""다음 GitHub 프로젝트를 한국어로 한 줄(20자 이내)로 요약해줘.
-이모지 없이, 핵심 기능만 간단히.
+        items = [self.summary_input(name, description)]
+        return self.summarizer.summarize(items, SUMMARY_INSTRUCTION, SUMMARY_PROMPT_VERSION)[0]
+
+    def summarize_repos(self, repos: list) -> list:
+        """레포 목록 일괄 요약 (설명 있는 레포만, summary 채움)"""
+        if not self.summarizer:
+            return repos
 
-프로젝트명: {name}
-설명: {description[:200]}
+        targets = [repo for repo in repos if repo.description]
+        for repo in repos:
+            repo.summary = ""
 
-한줄요약:"""
+        summaries = self.summarizer.summarize(
+            [self.summary_input(repo.name, repo.description) for repo in targets],
+            SUMMARY_INSTRUCTION,
+            SUMMARY_PROMPT_VERSION,
+        )
 
-            response = self.model.generate_content(prompt)
-            result = response.text.strip()
-            # 줄바꿈 제거
-            return result.split('\n')[0]
-        except Exception as e:
-            print(f"  ⚠️ 요약 실패 ({name}): {e}")
-            return ""
+        for repo, summary in zip(targets, summaries):
+            repo.summary = summary
+            if summary:
+                print(f"  ✓ {repo.name}: {summary}")
 
-    def get_trending(self, language: str = None, since: str = "daily") -> list:
+        return repos
+
+    def get_trending(self, language: str = None, since: str = "daily", summarize: bool = True) -> list:
         """
         GitHub Trending 레포 가져오기
 
         Args:
             language: 프로그래밍 언어 (예: "python", "javascript", None=전체)
             since: "daily", "weekly", "monthly"
+            summarize: 수집 직후 한글 요약까지 생성 (파이프라인에서는 False로 두고 따로 요약)
 
         Returns:
-            list of trending repos
+            list of Repo
         """
-        # URL 구성
-        url = self.BASE_URL
-        if language:
-            url += f"/{language}"
-        url += f"?since={since}"
-
+        url = self.trending_url(language, since)
         print(f"🔍 GitHub Trending 수집 중: {url}")
 
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            repos, cached = self.fetch_tracked(url)
+        except CircuitOpenError as e:
+            metrics.incr('circuit_skipped', source='github')
+            print(f"⛔ {e}")
+            return []
         except Exception as e:
             print(f"❌ 요청 실패: {e}")
             return []
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        repos = []
-
-        # 트렌딩 레포 파싱
-        articles = soup.select('article.Box-row')
-
-        for article in articles:
-            try:
-                # 레포 이름
-                h2 = article.select_one('h2 a')
-                if not h2:
-                    continue
-
-                full_name = h2.get('href', '').strip('/')
-                owner, name = full_name.split('/') if '/' in full_name else ('', full_name)
-
-                # 설명
-                desc_elem = article.select_one('p')
-                description = desc_elem.text.strip() if desc_elem else ''
-
-                # 언어
-                lang_elem = article.select_one('[itemprop="programmingLanguage"]')
-                lang = lang_elem.text.strip() if lang_elem else 'Unknown'
-
-                # 스타 수
-                star_elem = article.select_one('a[href$="/stargazers"]')
-                stars = star_elem.text.strip().replace(',', '') if star_elem else '0'
-
-                # 오늘의 스타
-                today_stars_elem = article.select_one('span.d-inline-block.float-sm-right')
-                today_stars = today_stars_elem.text.strip() if today_stars_elem else ''
-
-                # 포크 수
-                fork_elem = article.select_one('a[href$="/forks"]')
-                forks = fork_elem.text.strip().replace(',', '') if fork_elem else '0'
-
-                repos.append({
-                    'rank': len(repos) + 1,
-                    'owner': owner,
-                    'name': name,
-                    'full_name': full_name,
-                    'url': f"https://github.com/{full_name}",
-                    'description': description,
-                    'language': lang,
-                    'stars': int(stars) if stars.isdigit() else 0,
-                    'forks': int(forks) if forks.isdigit() else 0,
-                    'today_stars': today_stars,
-                })
+        if cached:
+            print("♻️ 변경 없음, 캐시된 목록 사용")
 
-            except Exception as e:
-                print(f"⚠️ 파싱 오류: {e}")
-                continue
+        if self.seen_store:
+            total = len(repos)
+            repos = self.seen_store.filter_new(repos)
+            print(f"💤 이미 보낸 레포 {total - len(repos)}개 제외")
 
         print(f"✅ {len(repos)}개 레포 수집 완료!")
 
         # 한글 요약 추가 (수집 후 일괄 처리)
-        if self.use_ai_summary and self.model:
+        if summarize and self.use_ai_summary and self.model:
             print(f"🤖 한글 요약 생성 중...")
-            for repo in repos[:10]:  # 상위 10개만 요약 (API 절약)
-                summary = self.summarize_korean(repo['name'], repo['description'])
-                repo['summary_kr'] = summary
-                if summary:
-                    print(f"  ✓ {repo['name']}: {summary}")
+            self.summarize_repos(repos[:10])  # 상위 10개만 요약 (API 절약)
 
         return repos
 
-    def format_markdown(self, repos: list, title: str = "GitHub Trending") -> str:
-        """마크다운 형식으로 변환"""
+    def collect(self, language: str = None, since: str = "daily", summarize: bool = True) -> list:
+        """공통 수집 인터페이스 (collectors.registry) - get_trending과 같음"""
+        return self.get_trending(language=language, since=since, summarize=summarize)
 
-        output = f"# {title}\n\n"
-        output += f"> 수집 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        output += "---\n\n"
+    def trending_url(self, language: str = None, since: str = "daily") -> str:
+        url = self.BASE_URL
+        if language:
+            url += f"/{language}"
+        return url + f"?since={since}"
 
-        for repo in repos:
-            output += f"## {repo['rank']}. [{repo['full_name']}]({repo['url']})\n\n"
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """호스트별 동시 요청 제한용 세마포어"""
+        host = urlsplit(url).netloc
+        with self._host_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_slots[host]
 
-            # 한글 요약 먼저
-            if repo.get('summary_kr'):
-                output += f"> 📌 **{repo['summary_kr']}**\n\n"
+    def fetch_tracked(self, url: str):
+        """
+        fetch_trending + 소스 상태 기록 (health가 있으면 'github'로)
 
-            if repo['description']:
-                output += f"{repo['description']}\n\n"
+        Raises:
+            CircuitOpenError: 'github' 회로가 열려 있으면 요청 없이 바로
+        """
+        if not self.health:
+            return self.fetch_trending(url)
+        with self.health.track('github'):
+            return self.fetch_trending(url)
 
-            output += f"- ⭐ **{repo['stars']:,}** stars"
-            if repo['today_stars']:
-                output += f" ({repo['today_stars']})"
-            output += "\n"
+    def fetch_trending(self, url: str):
+        """
+        트렌딩 페이지 하나 수집 (실패 시 예외)
 
-            output += f"- 🍴 {repo['forks']:,} forks\n"
-            output += f"- 💻 {repo['language']}\n\n"
-            output += "---\n\n"
+        Returns:
+            (repos, cached) - cached는 304로 캐시된 목록을 썼는지 여부
+        """
+        with self._host_slot(url):
+            with metrics.span('fetch', source='github', item=url):
+                response = self.session.get(url, headers=self.http_cache.conditional_headers(url), timeout=10)
+                if response.status_code == 304:
+                    metrics.incr('http_not_modified', source='github')
+                    repos = self.load_cached(url)
+                    if repos is not None:
+                        return repos, True
+                    # 검증자만 남고 캐시 파일이 사라진 경우 → 조건 없이 다시 받기
+                    response = self.session.get(url, timeout=10)
+                response.raise_for_status()
+            metrics.incr('bytes_fetched', len(response.content), source='github')
+
+        with metrics.span('parse', source='github', item=url):
+            repos = self.parse_trending(response.text)
+        metrics.incr('items_parsed', len(repos), source='github')
+        self.http_cache.store(url, response.headers, [repo.to_dict() for repo in repos], len(response.content))
+        return repos, False
+
+    def load_cached(self, url: str):
+        """캐시된 목록 → Repo 목록 (없거나 예전 형식이면 None → 다시 받기)"""
+        payload = self.http_cache.load(url)
+        if payload is None:
+            return None
+        try:
+            return [Repo.from_dict(data) for data in payload]
+        except (TypeError, AttributeError):
+            return None
 
-        return output
+    def get_trending_matrix(self, languages: list, periods: tuple = PERIODS,
+                            max_workers: int = 8, delay: tuple = (0.2, 1.0)) -> list:
+        """
+        여러 언어 × 기간 트렌딩을 한 세션으로 동시에 수집해 하나의 표로 합침
+
+        Args:
+            languages: 언어 목록 (None을 넣으면 전체 언어 목록 포함)
+            periods: "daily", "weekly", "monthly" 중 수집할 기간
+            max_workers: 동시 수집 스레드 수 (호스트별로는 per_host_limit까지만 동시 요청)
+            delay: 요청 전 임의 대기 범위 (초, 호스트 슬롯을 잡기 전에 쉬므로 다른 요청을 막지 않음)
+
+        Returns:
+            list of Repo (중복 없음) - 각 레포의 appearances에
+            [{'language', 'since', 'rank'}, ...]로 어느 목록 몇 위에 올랐는지 기록,
+            많은 목록에 오른 레포부터 정렬
+        """
+        combos = [(language, since) for language in languages for since in periods]
+        print(f"🔍 GitHub Trending 동시 수집: {len(languages)}개 언어 × {len(periods)}개 기간 = {len(combos)}개 목록")
+
+        def fetch(combo):
+            language, since = combo
+            if delay:
+                time.sleep(random.uniform(*delay))  # 서버 부담 분산 (소요 시간 기록에는 넣지 않음)
+            try:
+                return self.fetch_tracked(self.trending_url(language, since))[0]
+            except CircuitOpenError as e:
+                metrics.incr('circuit_skipped', source='github')
+                print(f"  ⛔ {language or 'all'}/{since}: {e}")
+                return []
+            except Exception as e:
+                print(f"  ❌ {language or 'all'}/{since} 실패: {e}")
+                return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            listings = list(executor.map(fetch, combos))
+
+        table = {}
+        for (language, since), repos in zip(combos, listings):
+            for repo in repos:
+                merged = table.get(repo.full_name)
+                if merged is None:
+                    merged = table[repo.full_name] = dataclasses.replace(repo, appearances=[])
+                merged.appearances.append({'language': language or 'all', 'since': since, 'rank': repo.rank})
+
+        merged_repos = sorted(
+            table.values(),
+            key=lambda r: (-len(r.appearances), min(a['rank'] for a in r.appearances)),
+        )
+        for rank, repo in enumerate(merged_repos, 1):
+            repo.rank = rank
+
+        if self.seen_store:
+            merged_repos = self.seen_store.filter_new(merged_repos)
+
+        print(f"✅ {sum(len(r) for r in listings)}개 항목 → 중복 제거 후 {len(merged_repos)}개 레포")
+        return merged_repos
+
+    def parse_trending(self, html: str) -> list:
+        """트렌딩 페이지 HTML → Repo 목록 (collectors/trending_parsers 엔진 사용)"""
+        return self._parse(html)
+
+    def mark_seen(self, repos: list):
+        """발송한 레포를 본 것으로 기록 (발송이 끝난 뒤 호출)"""
+        if self.seen_store:
+            self.seen_store.mark_seen(repos)
+
+    def format_markdown(self, repos: list, title: str = "GitHub Trending") -> str:
+        """마크다운 형식으로 변환"""
+        return render_text([Section(None, repos)], 'markdown', title)
 
 
 def main():
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Collector Registry
+수집기를 이름으로 찾아 처음 쓸 때 import
+- cron 콜드 스타트에서 쓰지 않는 수집기(twikit 등)의 import 비용을 내지 않음
+- 모든 수집기는 collect() 하나로 호출
+
+사용:
+    from collectors import registry
+    repos = registry.create('github', use_ai_summary=False).collect(since="weekly")
+"""
+
+import importlib
+
+# 이름 → (모듈, 클래스)
+COLLECTORS = {
+    'github': ('collectors.github_trending', 'GitHubTrendingCollector'),
+    'rss': ('collectors.rss_collector', 'RSSCollector'),
+    'x': ('collectors.x_collector', 'XCollector'),
+}
+
+_loaded = {}
+
+
+def names() -> list:
+    return list(COLLECTORS)
+
+
+def get_class(name: str):
+    """수집기 클래스 (처음 호출할 때 모듈 import)"""
+    if name not in COLLECTORS:
+        raise KeyError(f"알 수 없는 수집기: {name} (가능: {', '.join(COLLECTORS)})")
+
+    if name not in _loaded:
+        module_name, class_name = COLLECTORS[name]
+        _loaded[name] = getattr(importlib.import_module(module_name), class_name)
+    return _loaded[name]
+
+
+def create(name: str, **kwargs):
+    """수집기 인스턴스 생성"""
+    return get_class(name)(**kwargs)
+
+
+def collect(name: str, options: dict = None, **collect_kwargs):
+    """
+    수집기 생성 + collect() 한 번에
+
+    Args:
+        options: 생성자 인자
+        collect_kwargs: collect() 인자
+    """
+    return create(name, **(options or {})).collect(**collect_kwargs)
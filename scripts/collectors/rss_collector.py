@@ -3,14 +3,38 @@
 RSS Feed Collector
 다양한 Tech 뉴스 소스에서 RSS 피드 수집
 - fastfeedparser 사용 (feedparser보다 10배 빠름)
+- 다운로드(스레드 풀)와 파싱(큰 피드는 프로세스 풀)을 나눠서 실행
 """
 
+import multiprocessing
 import os
+import threading
+import time
+from concurrent.futures import (ThreadPoolExecutor, ProcessPoolExecutor, as_completed,
+                                TimeoutError as FuturesTimeout)
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+from models import Article
+from ranking import Ranker
+from renderers import Section, render_text
+from utils.dedup import Deduplicator
+from utils.gemini import create_model
+from utils.http_cache import HTTPCache
+from utils.llm_executor import LLMExecutor
+from utils.metrics import metrics
+from utils.seen_store import SeenStore
+from utils.source_health import CircuitOpenError, SourceHealth
+from utils.summarizer import BatchSummarizer
+from utils.summary_cache import SummaryCache
+from utils.text import html_to_text, truncate
+
 # .env 로드
 load_dotenv(Path(__file__).parent.parent / '.env')
 
@@ -21,12 +45,6 @@ except ImportError:
     PARSER_AVAILABLE = False
     print("⚠️ fastfeedparser 미설치: pip install fastfeedparser")
 
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
-
 
 # 피드 소스 정의
 RSS_FEEDS = {
@@ -85,48 +103,409 @@ RSS_FEEDS = {
 }
 
 
+SUMMARY_INSTRUCTION = """다음 뉴스 제목/내용들을 각각 한국어로 한 줄(25자 이내)로 요약해줘.
+이모지 없이, 핵심만 간단히."""
+# 프롬프트를 바꾸면 버전도 올릴 것 (요약 캐시 무효화)
+SUMMARY_PROMPT_VERSION = "rss-article-v1"
+
+
+def parse_feed(body: bytes) -> list:
+    """
+    피드 원문 → 항목 목록 (파싱 프로세스에서도 불리므로 모듈 함수)
+
+    Returns:
+        list of {'title', 'link', 'description', 'published'} (HTML 정리 전 원본)
+    """
+    feed = fastfeedparser.parse(body)
+    return [
+        {
+            'title': entry.get('title', 'No Title'),
+            'link': entry.get('link', ''),
+            'description': entry.get('summary', entry.get('description', '')),
+            'published': entry.get('published', entry.get('updated', '')),
+        }
+        for entry in (feed.get('entries') or [])
+    ]
+
+
+def default_parse_workers() -> int:
+    """코어 하나는 다운로드/요약 스레드에 남기고 나머지(최대 4개)로 파싱 (1코어면 0 = 풀 없음)"""
+    return max(0, min(4, (os.cpu_count() or 1) - 1))
+
+
 class RSSCollector:
-    def __init__(self, use_ai_summary: bool = True, max_per_source: int = 5):
+    FEEDS = RSS_FEEDS
+    USER_AGENT = 'Mozilla/5.0 (compatible; NewsAggregator/1.0; +https://github.com/cpuxp11/news-aggregator)'
+
+    def __init__(self, use_ai_summary: bool = True, max_per_source: int = 5,
+                 max_workers: int = 8, feed_timeout: float = 10.0, total_timeout: float = 30.0,
+                 http_cache: HTTPCache = None, summary_batch_size: int = 10,
+                 summary_cache: SummaryCache = None,
+                 llm_executor: LLMExecutor = None, summary_timeout: float = 120.0,
+                 max_summaries: int = 20, seen_store: SeenStore = None, description_limit: int = 500,
+                 health: SourceHealth = None, parse_workers: int = None,
+                 parse_inline_bytes: int = 128 * 1024):
         """
         Args:
             use_ai_summary: Gemini로 한글 요약 생성
             max_per_source: 소스당 최대 기사 수
+            max_workers: 동시에 수집할 최대 피드 수 (1이면 순차 수집)
+            feed_timeout: 피드 하나당 제한 시간 (초, 연결~다운로드 완료까지)
+            total_timeout: 전체 수집 제한 시간 (초, 초과한 피드는 버림)
+            http_cache: 조건부 GET 캐시 (None이면 기본 위치에 생성)
+            summary_batch_size: Gemini 요청 하나에 묶을 기사 수
+            summary_cache: 요약 캐시 (None이면 기본 위치에 생성)
+            llm_executor: Gemini 호출 실행기 (쿼터 공유를 위해 수집기끼리 같은 것 사용)
+            summary_timeout: 요약 단계 제한 시간 (초, 넘으면 끝난 요약만 사용)
+            max_summaries: 수집 한 번에 요약할 최대 기사 수 (API 절약)
+            seen_store: 지난 실행에서 본 기사 기록 (있으면 새 기사만 수집)
+            description_limit: 기사 설명 최대 길이 (평문 기준, 단어 경계에서 자름)
+            health: 피드별 성공/실패 기록 (있으면 계속 실패하는 피드는 요청 없이 건너뜀)
+            parse_workers: 피드 파싱 프로세스 수 (None이면 코어 수에 맞춤, 0이면 받은 스레드에서 바로 파싱)
+            parse_inline_bytes: 이보다 작은 피드는 프로세스로 넘기지 않고 받은 스레드에서 파싱
+                                (작은 피드는 프로세스 왕복 비용이 파싱보다 큼)
         """
         if not PARSER_AVAILABLE:
             raise ImportError("fastfeedparser가 필요합니다: pip install fastfeedparser")
 
         self.use_ai_summary = use_ai_summary
         self.max_per_source = max_per_source
+        self.description_limit = description_limit
+        self.max_workers = max(1, max_workers)
+        self.feed_timeout = feed_timeout
+        self.total_timeout = total_timeout
+        self.http_cache = http_cache or HTTPCache()
         self.model = None
-
-        # Gemini 설정
-        if use_ai_summary and GEMINI_AVAILABLE:
-            api_key = os.getenv('GEMINI_API_KEY')
-            if api_key:
-                genai.configure(api_key=api_key)
-                self.model = genai.GenerativeModel('gemini-2.0-flash')
+        self.summarizer = None
+        self.max_summaries = max_summaries
+        self.summary_budget = max_summaries
+        self._budget_lock = threading.Lock()
+        self.deduplicator = Deduplicator()
+        self.seen_store = seen_store
+        self.health = health
+        self.parse_workers = default_parse_workers() if parse_workers is None else max(0, parse_workers)
+        self.parse_inline_bytes = parse_inline_bytes
+        self._parse_pool = None
+        self._pool_lock = threading.Lock()
+        self.newest_keys = {}  # 소스별 이번에 본 가장 최신 항목 (mark_seen 때 하이워터마크 후보)
+        self.fresh_keys = {}  # 소스별 이번에 새로 읽은 항목 키 (최신순, max_per_source로 자르기 전)
+        self.sent_ids = set()  # 이번 회차에 보낸 기사 id() - 나중에 도착한 중복도 본 것으로 기록
+
+        # 피드 다운로드용 세션 (워커 수만큼 커넥션 풀 확보)
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': self.USER_AGENT})
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Gemini 설정 (google.generativeai는 첫 요약 요청 때 import)
+        if use_ai_summary:
+            self.model = create_model()
+            if self.model:
+                self.summarizer = BatchSummarizer(
+                    self.model, batch_size=summary_batch_size, cache=summary_cache or SummaryCache(),
+                    executor=llm_executor, timeout=summary_timeout, name='rss',
+                )
                 print("✅ Gemini 요약 활성화")
 
+    @staticmethod
+    def summary_input(title: str, description: str = "") -> str:
+        """요약 프롬프트에 들어갈 기사 한 개 분량"""
+        text = f"{title}. {truncate(description, 300)}" if description else title
+        return f"내용: {text}"
+
     def summarize_korean(self, title: str, description: str = "") -> str:
         """Gemini로 한글 한줄 요약"""
         if not self.model:
             return ""
 
-        try:
-            text = f"{title}. {description[:300]}" if description else title
-            prompt = f"""다음 뉴스 제목/내용을 한국어로 한 줄(25자 이내)로 요약해줘.
-이모지 없이, 핵심만 간단히.
+        items = [self.summary_input(title, description)]
+        return self.summarizer.summarize(items, SUMMARY_INSTRUCTION, SUMMARY_PROMPT_VERSION)[0]
+
+    def summarize_articles(self, articles: list):
+        """기사 목록 일괄 요약 (summary 채움)"""
+        summaries = self.summarizer.summarize(
+            [self.summary_input(article.title, article.description) for article in articles],
+            SUMMARY_INSTRUCTION,
+            SUMMARY_PROMPT_VERSION,
+        )
+
+        for article, summary in zip(articles, summaries):
+            article.summary = summary
+            if summary:
+                print(f"  ✓ {article.title[:30]}... → {summary}")
+
+    def take_summary_budget(self, articles: list) -> list:
+        """남은 요약 한도만큼 영문 기사 선택 (한글은 이미 읽기 쉬움)"""
+        targets = [article for article in articles if article.lang == 'en']
+        with self._budget_lock:
+            targets = targets[:self.summary_budget]
+            self.summary_budget -= len(targets)
+        return targets
+
+    def start_run(self):
+        """수집 한 회차 시작 (요약 한도와 중복 제거 기록 초기화)"""
+        self.summary_budget = self.max_summaries
+        self.deduplicator = Deduplicator()
+        self.sent_ids = set()
+
+    def dedupe_feed(self, articles: list) -> list:
+        """
+        이미 다른 피드에서 받은 기사를 걸러냄 (파이프라인에서 요약 전에 호출)
 
-내용: {text}
+        중복 기사는 먼저 도착한 기사의 sources에 출처만 추가된다. 대표 기사를 이미 보냈으면
+        (데몬에서 다른 피드가 늦게 실은 경우) 중복 기사도 바로 본 것으로 기록한다.
+        """
+        unique, late = [], []
+        for article in articles:
+            original = self.deduplicator.add(article)
+            if original is None:
+                unique.append(article)
+            elif id(original) in self.sent_ids:
+                late.append(article)
+        if late and self.seen_store:
+            self.seen_store.mark_seen(late)
+        metrics.incr('duplicates', len(articles) - len(unique))
+        return unique
+
+    def summarize_feed(self, articles: list) -> list:
+        """
+        피드 하나 분량 요약 (파이프라인에서 피드가 도착하는 대로 호출)
 
-한줄요약:"""
+        Returns:
+            articles (summary 채워짐)
+        """
+        if self.use_ai_summary and self.model:
+            targets = self.take_summary_budget(articles)
+            if targets:
+                self.summarize_articles(targets)
+        return articles
 
-            response = self.model.generate_content(prompt)
-            result = response.text.strip()
-            return result.split('\n')[0]
-        except Exception as e:
-            print(f"  ⚠️ 요약 실패: {e}")
-            return ""
+    def download(self, url: str, timeout: float = None, conditional: bool = True):
+        """
+        피드 원문 다운로드 (제한 시간 내에 끝나지 않으면 TimeoutError)
+
+        requests의 timeout은 소켓 단위라 느리게 흘러오는 응답은 막지 못하므로
+        청크를 읽으면서 전체 경과 시간도 함께 확인한다.
+
+        Returns:
+            (body, headers) - 304 Not Modified면 body는 None
+        """
+        timeout = self.feed_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        headers = self.http_cache.conditional_headers(url) if conditional else {}
+
+        with self.session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            if response.status_code == 304:
+                return None, response.headers
+            response.raise_for_status()
+            chunks = []
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"{timeout:.0f}초 초과")
+                chunks.append(chunk)
+
+        return b''.join(chunks), response.headers
+
+    def fetch_entries(self, url: str, source: str = None) -> list:
+        """
+        피드 항목 가져오기 (변경 없으면 캐시된 항목 재사용)
+
+        Args:
+            source: 메트릭에 남길 소스 이름 (없으면 URL)
+
+        Returns:
+            list of {'title', 'link', 'description', 'published'} (HTML 정리 전 원본)
+        """
+        return self.poll_entries(url, source)[0]
+
+    def poll_entries(self, url: str, source: str = None):
+        """
+        fetch_entries + 피드 변경 여부
+
+        health가 있으면 결과와 소요 시간을 기록하고, 회로가 열린 피드는 요청 없이 바로 실패한다.
+
+        Returns:
+            (entries, changed) - 304 Not Modified로 캐시를 재사용했으면 changed=False
+
+        Raises:
+            CircuitOpenError: 계속 실패해서 쉬는 중인 피드
+        """
+        source = source or url
+        if self.health:
+            try:
+                with self.health.track(source):
+                    return self._poll_entries(url, source)
+            except CircuitOpenError:
+                metrics.incr('circuit_skipped', source=source)
+                raise
+        return self._poll_entries(url, source)
+
+    def _poll_entries(self, url: str, source: str):
+        with metrics.span('fetch', source=source):
+            body, headers = self.download(url)
+            if body is None:
+                metrics.incr('http_not_modified', source=source)
+                entries = self.http_cache.load(url)
+                if entries is not None:
+                    return entries, False
+                # 검증자만 남고 캐시 파일이 사라진 경우 → 조건 없이 다시 받기
+                body, headers = self.download(url, conditional=False)
+        metrics.incr('bytes_fetched', len(body), source=source)
+
+        with metrics.span('parse', source=source):
+            entries = self.parse(body, source)
+        metrics.incr('items_parsed', len(entries), source=source)
+
+        self.http_cache.store(url, headers, entries, len(body))
+        return entries, True
+
+    def parser_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        파싱 프로세스 풀 (처음 필요할 때 생성, 만들 수 없으면 None → 스레드에서 파싱)
+
+        다운로드 스레드가 도는 중에 fork하지 않도록 forkserver(없으면 spawn)로 띄운다.
+        """
+        with self._pool_lock:
+            if self._parse_pool is None and self.parse_workers:
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                try:
+                    self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers, mp_context=context)
+                except (OSError, ValueError) as e:
+                    print(f"  ⚠️ 파싱 프로세스 풀 생성 실패, 스레드에서 파싱: {e}")
+                    self.parse_workers = 0
+            return self._parse_pool
+
+    def parse(self, body: bytes, source: str = None) -> list:
+        """
+        피드 원문 → 항목 목록
+
+        parse_inline_bytes 이상인 피드는 프로세스 풀에서 파싱하고, 그동안 이 스레드는
+        GIL을 놓고 결과만 기다린다. 받은 bytes는 그대로 넘긴다 (프로세스 경계에서 pickle 한 번).
+        """
+        if self.parse_workers and len(body) >= self.parse_inline_bytes:
+            pool = self.parser_pool()
+            if pool:
+                try:
+                    entries = pool.submit(parse_feed, body).result()
+                    metrics.incr('parsed_in_pool', source=source)
+                    return entries
+                except (BrokenProcessPool, RuntimeError) as e:
+                    # 워커가 죽었거나 close() 이후 → 이번 실행은 스레드에서 파싱
+                    print(f"  ⚠️ 파싱 프로세스 사용 불가, 스레드에서 파싱: {e}")
+                    self.parse_workers = 0
+        return parse_feed(body)
+
+    def close(self):
+        """파싱 프로세스 종료 (이후 파싱은 스레드에서)"""
+        with self._pool_lock:
+            self.parse_workers = 0
+            pool, self._parse_pool = self._parse_pool, None
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def select_new_entries(self, name: str, entries: list) -> list:
+        """
+        이미 본 항목 제외 (seen_store 없으면 그대로)
+
+        피드는 최신순이므로 지난번 가장 최신 항목(하이워터마크)에 닿으면 거기서 멈추고,
+        순서가 뒤섞인 피드를 위해 남은 항목도 본 기록과 한 번 더 대조한다.
+        """
+        if not self.seen_store or not entries:
+            return entries
+
+        high_water = self.seen_store.get_high_water(name)
+        self.newest_keys[name] = self.seen_store.make_key(entries[0]['link'])
+
+        fresh = []
+        for entry in entries:
+            if high_water and self.seen_store.make_key(entry['link']) == high_water:
+                break
+            fresh.append(entry)
+
+        fresh = self.seen_store.filter_new(fresh, url_of=lambda entry: entry['link'])
+        self.fresh_keys[name] = [self.seen_store.make_key(entry['link']) for entry in fresh]
+        metrics.incr('items_seen_skipped', len(entries) - len(fresh), source=name)
+        return fresh
+
+    def mark_seen(self, sent: dict):
+        """
+        발송한 기사를 본 것으로 기록 (발송이 끝난 뒤 호출)
+
+        메시지에 들어가지 못한 기사는 기록하지 않아 다음 실행에서 다시 후보가 된다.
+        보낸 기사에 합쳐진 중복 기사(다른 피드의 같은 기사)도 함께 기록한다.
+        하이워터마크(피드를 읽다 멈추는 위치) 아래에는 보내지 않은 새 항목이 남으면 안 되므로
+        이번에 새로 읽은 항목(max_per_source로 잘린 것 포함)을 가장 오래된 것부터 훑어
+        이어서 본 기록이 있는 데까지만 옮긴다 (가장 오래된 항목을 못 보냈으면 그대로).
+
+        Args:
+            sent: {source: [보낸 기사]} - 키에 있는 소스만 하이워터마크를 정리 (보낸 기사가 없어도)
+        """
+        if not self.seen_store:
+            return
+
+        for name, articles in sent.items():
+            self.sent_ids.update(id(article) for article in articles)
+            duplicates = [duplicate for article in articles for duplicate in self.deduplicator.duplicates_of(article)]
+            self.seen_store.mark_seen(articles + duplicates)
+            newest = self.newest_keys.pop(name, None)
+            fresh = self.fresh_keys.pop(name, [])
+            if not newest:
+                continue
+            seen = self.seen_store.seen_keys(fresh)
+            mark = newest
+            for index in range(len(fresh) - 1, -1, -1):
+                if fresh[index] not in seen:
+                    mark = fresh[index + 1] if index + 1 < len(fresh) else None
+                    break
+            if mark:
+                self.seen_store.set_high_water(name, mark)
+
+    def build_articles(self, name: str, feed_info: dict, entries: list) -> list:
+        """
+        피드 항목 → Article 목록 (소스당 max_per_source개)
+
+        제목/설명은 utils.text.html_to_text로 평문 정리 (태그/엔티티/공백, 설명은 길이 제한).
+        """
+        entries = entries[:self.max_per_source]
+        if not entries:
+            return []
+
+        with metrics.span('normalize', source=name):
+            titles = [html_to_text(entry['title']) for entry in entries]
+            raw = [entry['description'] for entry in entries]
+            descriptions = [html_to_text(text, limit=self.description_limit) for text in raw]
+        metrics.incr('normalize_bytes_in', sum(len(text or '') for text in raw), source=name)
+        metrics.incr('normalize_bytes_out', sum(len(text) for text in descriptions), source=name)
+
+        return [
+            Article(
+                source=name,
+                url=entry['link'],
+                title=title or 'No Title',
+                timestamp=entry['published'],
+                description=description,
+                lang=feed_info['lang'],
+                category=feed_info['category'],
+            )
+            for entry, title, description in zip(entries, titles, descriptions)
+        ]
+
+    def poll_feed(self, name: str, feed_info: dict) -> dict:
+        """
+        단일 피드 폴링 (데몬 스케줄러용, 오류는 그대로 올림 - 회로가 열린 피드는 CircuitOpenError)
+
+        Returns:
+            {'articles': 새 기사, 'entries': 피드 전체 항목, 'changed': 304가 아니었는지}
+        """
+        entries, changed = self.poll_entries(feed_info["url"], name)
+        fresh = self.select_new_entries(name, entries) if entries else []
+        return {
+            'articles': self.build_articles(name, feed_info, fresh),
+            'entries': entries,
+            'changed': changed,
+        }
 
     def fetch_feed(self, name: str, feed_info: dict) -> list:
         """단일 피드 수집"""
@@ -134,43 +513,25 @@ class RSSCollector:
         print(f"  📡 {name} 수집 중...")
 
         try:
-            feed = fastfeedparser.parse(url)
+            entries = self.fetch_entries(url, name)
 
-            if not feed or not feed.get('entries'):
+            if not entries:
                 print(f"  ⚠️ {name}: 항목 없음")
                 return []
 
-            articles = []
-            entries = feed['entries'][:self.max_per_source]
-
-            for entry in entries:
-                # 기본 정보 추출
-                title = entry.get('title', 'No Title')
-                link = entry.get('link', '')
-
-                # 설명 (HTML 태그 제거는 선택)
-                description = entry.get('summary', entry.get('description', ''))
-                if description:
-                    # 간단한 HTML 태그 제거
-                    import re
-                    description = re.sub(r'<[^>]+>', '', description)[:500]
-
-                # 발행일
-                published = entry.get('published', entry.get('updated', ''))
-
-                articles.append({
-                    'source': name,
-                    'lang': feed_info['lang'],
-                    'category': feed_info['category'],
-                    'title': title,
-                    'link': link,
-                    'description': description,
-                    'published': published,
-                })
+            entries = self.select_new_entries(name, entries)
+            if not entries:
+                print(f"  💤 {name}: 새 항목 없음")
+                return []
+
+            articles = self.build_articles(name, feed_info, entries)
 
             print(f"  ✅ {name}: {len(articles)}개 수집")
             return articles
 
+        except CircuitOpenError as e:
+            print(f"  ⛔ {e}")
+            return []
         except Exception as e:
             print(f"  ❌ {name} 오류: {e}")
             return []
@@ -179,6 +540,9 @@ class RSSCollector:
         """
         모든 RSS 피드 수집
 
+        seen_store가 있으면 새 기사만 수집한다. 발송 후 mark_seen(보낸 기사)을 호출해야
+        다음 실행에서 보낸 기사가 빠진다.
+
         Args:
             sources: 특정 소스만 수집 (예: ["GeekNews", "TechCrunch"])
             categories: 특정 카테고리만 (예: ["dev", "general"])
@@ -187,102 +551,107 @@ class RSSCollector:
             dict: {source_name: [articles]}
         """
         print(f"🚀 RSS 피드 수집 시작 - {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+        self.start_run()
 
-        results = {}
-        total_count = 0
+        feeds = {
+            name: feed_info for name, feed_info in self.FEEDS.items()
+            if (not sources or name in sources)
+            and (not categories or feed_info['category'] in categories)
+        }
 
-        for name, feed_info in RSS_FEEDS.items():
-            # 필터링
-            if sources and name not in sources:
-                continue
-            if categories and feed_info['category'] not in categories:
-                continue
+        return self.summarize_results(self.fetch_all(feeds), order=feeds)
 
-            articles = self.fetch_feed(name, feed_info)
-            if articles:
-                results[name] = articles
-                total_count += len(articles)
+    def summarize_results(self, fetched: dict, order: dict = None) -> dict:
+        """
+        fetch_all 결과 전체를 중복 제거하고 한 번에 요약
 
-        print(f"\n📊 총 {len(results)}개 소스에서 {total_count}개 기사 수집")
+        피드마다 따로 요약하면 피드 수만큼 Gemini 요청이 나가므로, 모든 피드의 기사를
+        모아서 요약기 배치(summary_batch_size개씩)로 보낸다.
+
+        Args:
+            fetched: {source_name: [articles]}
+            order: 결과 순서 기준 (None이면 FEEDS 순서, 여러 피드에 실린 기사는 앞 순서 피드에 합침)
+
+        Returns:
+            dict: {source_name: [articles]} (기사 없는 소스는 제외)
+        """
+        results = {name: fetched[name] for name in (order or self.FEEDS) if fetched.get(name)}
+        results = self.deduplicator.dedupe(results)
+        total_count = sum(len(articles) for articles in results.values())
+
+        print(f"\n📊 총 {len(results)}개 소스에서 {total_count}개 기사 수집 (중복 {self.deduplicator.duplicates}개 합침)")
 
         # 한글 요약 추가 (영문 기사만)
         if self.use_ai_summary and self.model:
             print("\n🤖 영문 기사 한글 요약 생성 중...")
-            summary_count = 0
-
-            for source, articles in results.items():
-                for article in articles:
-                    # 영문만 요약 (한글은 이미 읽기 쉬움)
-                    if article['lang'] == 'en' and summary_count < 20:  # API 절약
-                        summary = self.summarize_korean(article['title'], article['description'])
-                        article['summary_kr'] = summary
-                        if summary:
-                            summary_count += 1
-                            print(f"  ✓ {article['title'][:30]}... → {summary}")
+            targets = [article for articles in results.values() for article in articles]
+            self.summarize_articles(self.take_summary_budget(targets))
 
         return results
 
-    def format_markdown(self, results: dict, title: str = "Tech News Digest") -> str:
-        """마크다운 형식으로 변환"""
+    def collect(self, sources: list = None, categories: list = None) -> dict:
+        """공통 수집 인터페이스 (collectors.registry) - collect_all과 같음"""
+        return self.collect_all(sources=sources, categories=categories)
 
-        output = f"# {title}\n\n"
-        output += f"> 수집 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        output += "---\n\n"
+    def fetch_all(self, feeds: dict) -> dict:
+        """
+        여러 피드를 스레드 풀에서 동시에 수집
 
-        for source, articles in results.items():
-            output += f"## 📰 {source}\n\n"
+        전체 소요 시간은 가장 느린 피드 하나에 맞춰지며, total_timeout이 지나면
+        아직 끝나지 않은 피드는 기다리지 않고 버린다.
 
-            for i, article in enumerate(articles, 1):
-                output += f"### {i}. [{article['title']}]({article['link']})\n\n"
+        Returns:
+            dict: {source_name: [articles]} (완료된 피드만)
+        """
+        if not feeds:
+            return {}
 
-                # 한글 요약 먼저
-                if article.get('summary_kr'):
-                    output += f"> 📌 **{article['summary_kr']}**\n\n"
+        results = {}
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(feeds)))
+        futures = {
+            executor.submit(self.fetch_feed, name, feed_info): name
+            for name, feed_info in feeds.items()
+        }
 
-                if article['description']:
-                    output += f"{article['description'][:200]}...\n\n"
+        try:
+            for future in as_completed(futures, timeout=self.total_timeout):
+                results[futures[future]] = future.result()
+        except FuturesTimeout:
+            pending = [name for future, name in futures.items() if not future.done()]
+            print(f"  ⏱️ 전체 제한 시간({self.total_timeout:.0f}초) 초과, 건너뜀: {', '.join(pending)}")
+        finally:
+            # 남은 작업은 기다리지 않음 (다운로드 중인 스레드는 feed_timeout 안에 스스로 종료)
+            executor.shutdown(wait=False, cancel_futures=True)
 
-                if article['published']:
-                    output += f"🕐 {article['published']}\n\n"
+        return results
 
-            output += "---\n\n"
+    def format_markdown(self, results: dict, title: str = "Tech News Digest") -> str:
+        """마크다운 형식으로 변환"""
+        return render_text(self.sections(results, title_format="📰 {}"), 'markdown', title)
 
-        return output
+    @staticmethod
+    def sections(results: dict, title_format: str = "{}") -> list:
+        """{source: [articles]} → renderers.Section 목록 (title_format에 소스 이름이 들어감)"""
+        return [Section(title_format.format(source), articles) for source, articles in results.items() if articles]
 
-    def format_telegram(self, results: dict, max_items: int = 10) -> str:
-        """텔레그램용 포맷 (간결하게)"""
-
-        message = "📰 *Tech News Digest*\n\n"
-        count = 0
-
-        # 한국어 소스 먼저
-        for source in ["GeekNews"]:
-            if source in results:
-                message += f"*🇰🇷 {source}*\n"
-                for article in results[source][:3]:
-                    message += f"• [{article['title'][:40]}...]({article['link']})\n"
-                    count += 1
-                message += "\n"
-
-        # 영문 소스
-        for source, articles in results.items():
-            if source == "GeekNews" or count >= max_items:
-                continue
+    def telegram_sections(self, results: dict, max_items: int = 8, per_source: int = 3,
+                          ranker: Ranker = None) -> list:
+        """
+        텔레그램용 섹션 (🇰🇷 한국어 / 🌐 영문 소스별)
 
-            message += f"*🌐 {source}*\n"
-            for article in articles[:2]:
-                title = article['title'][:35]
-                if article.get('summary_kr'):
-                    message += f"• [{title}...]({article['link']})\n"
-                    message += f"  └ {article['summary_kr']}\n"
-                else:
-                    message += f"• [{title}...]({article['link']})\n"
-                count += 1
-                if count >= max_items:
-                    break
-            message += "\n"
+        모든 소스의 기사 중 점수 상위 max_items개를 고르고 (소스당 최대 per_source개)
+        고른 기사가 각 섹션의 preview가 된다 (ranking.Ranker).
+        """
+        return (ranker or Ranker()).sections(
+            {f"{'🇰🇷' if articles[0].lang == 'ko' else '🌐'} {source}": articles
+             for source, articles in results.items() if articles},
+            k=max_items, per_section=per_source,
+        )
 
-        return message
+    def format_telegram(self, results: dict, max_items: int = 10) -> str:
+        """텔레그램용 포맷 (간결하게, MarkdownV2 - renderers.TELEGRAM_PARSE_MODE로 발송)"""
+        return render_text(self.telegram_sections(results, max_items), 'telegram', "📰 Tech News Digest",
+                           max_items=max_items)
 
 
 def main():
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+GitHub Trending HTML Parsers
+트렌딩 페이지 파서 엔진 모음 - 모든 엔진이 완전히 같은 repos 목록을 반환
+- selectolax (lexbor): 가장 빠름, C 구현 CSS 셀렉터
+- lxml: 빠름, XPath
+- bs4: BeautifulSoup + html.parser (추가 설치 없이 동작하는 기본 경로)
+
+엔진별로 필드 원문(텍스트)만 뽑고, 정리/변환은 build_repo 하나로 통일한다.
+엔진 패키지는 실제로 파싱할 때 import (설치 여부만 미리 확인).
+"""
+
+import importlib.util
+
+from models import Repo
+
+
+def _installed(module: str) -> bool:
+    try:
+        return importlib.util.find_spec(module) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+SELECTOLAX_AVAILABLE = _installed('selectolax')
+LXML_AVAILABLE = _installed('lxml')
+BS4_AVAILABLE = _installed('bs4')
+
+
+def build_repo(rank: int, href: str, description, language, stars, today_stars, forks) -> Repo:
+    """
+    엔진에서 뽑은 원문 필드 → Repo
+
+    Args:
+        href: 'h2 a'의 href (예: "/owner/name")
+        description, language, stars, today_stars, forks: 요소 텍스트 (요소가 없으면 None)
+    """
+    full_name = href.strip('/')
+    owner, name = full_name.split('/') if '/' in full_name else ('', full_name)
+
+    stars = stars.strip().replace(',', '') if stars is not None else '0'
+    forks = forks.strip().replace(',', '') if forks is not None else '0'
+
+    return Repo(
+        source='github',
+        url=f"https://github.com/{full_name}",
+        title=full_name,
+        rank=rank,
+        owner=owner,
+        name=name,
+        description=description.strip() if description is not None else '',
+        language=language.strip() if language is not None else 'Unknown',
+        stars=int(stars) if stars.isdigit() else 0,
+        forks=int(forks) if forks.isdigit() else 0,
+        today_stars=today_stars.strip() if today_stars is not None else '',
+    )
+
+
+def parse_bs4(html: str) -> list:
+    """BeautifulSoup 엔진 (기준 구현)"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    repos = []
+
+    for article in soup.select('article.Box-row'):
+        try:
+            h2 = article.select_one('h2 a')
+            if not h2:
+                continue
+
+            def text(selector):
+                elem = article.select_one(selector)
+                return elem.text if elem else None
+
+            repos.append(build_repo(
+                len(repos) + 1,
+                h2.get('href', ''),
+                text('p'),
+                text('[itemprop="programmingLanguage"]'),
+                text('a[href$="/stargazers"]'),
+                text('span.d-inline-block.float-sm-right'),
+                text('a[href$="/forks"]'),
+            ))
+        except Exception as e:
+            print(f"⚠️ 파싱 오류: {e}")
+            continue
+
+    return repos
+
+
+def parse_selectolax(html: str) -> list:
+    """selectolax (lexbor) 엔진"""
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    repos = []
+
+    for article in tree.css('article.Box-row'):
+        try:
+            h2 = article.css_first('h2 a')
+            if not h2:
+                continue
+
+            def text(selector):
+                elem = article.css_first(selector)
+                return elem.text() if elem else None
+
+            repos.append(build_repo(
+                len(repos) + 1,
+                h2.attributes.get('href') or '',
+                text('p'),
+                text('[itemprop="programmingLanguage"]'),
+                text('a[href$="/stargazers"]'),
+                text('span.d-inline-block.float-sm-right'),
+                text('a[href$="/forks"]'),
+            ))
+        except Exception as e:
+            print(f"⚠️ 파싱 오류: {e}")
+            continue
+
+    return repos
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _href_endswith(suffix: str) -> str:
+    return f"substring(@href, string-length(@href) - {len(suffix) - 1}) = '{suffix}'"
+
+
+# bs4 셀렉터와 같은 의미의 XPath (첫 번째 일치 요소만 사용)
+LXML_ARTICLES = f"//article[{_has_class('Box-row')}]"
+LXML_FIELDS = {
+    'name': './/h2//a',
+    'description': './/p',
+    'language': ".//*[@itemprop='programmingLanguage']",
+    'stars': f".//a[{_href_endswith('/stargazers')}]",
+    'today_stars': f".//span[{_has_class('d-inline-block')} and {_has_class('float-sm-right')}]",
+    'forks': f".//a[{_href_endswith('/forks')}]",
+}
+
+
+def parse_lxml(html: str) -> list:
+    """lxml 엔진"""
+    import lxml.html
+
+    tree = lxml.html.fromstring(html)
+    repos = []
+
+    for article in tree.xpath(LXML_ARTICLES):
+        try:
+            h2 = article.xpath(LXML_FIELDS['name'])
+            if not h2:
+                continue
+
+            def text(field):
+                elems = article.xpath(LXML_FIELDS[field])
+                return elems[0].text_content() if elems else None
+
+            repos.append(build_repo(
+                len(repos) + 1,
+                h2[0].get('href', ''),
+                text('description'),
+                text('language'),
+                text('stars'),
+                text('today_stars'),
+                text('forks'),
+            ))
+        except Exception as e:
+            print(f"⚠️ 파싱 오류: {e}")
+            continue
+
+    return repos
+
+
+# 빠른 순서 (auto 선택 시 설치된 것 중 앞의 것 사용)
+ENGINES = {
+    'selectolax': (parse_selectolax, SELECTOLAX_AVAILABLE),
+    'lxml': (parse_lxml, LXML_AVAILABLE),
+    'bs4': (parse_bs4, BS4_AVAILABLE),
+}
+
+
+def available_engines() -> list:
+    return [name for name, (_, available) in ENGINES.items() if available]
+
+
+def get_parser(engine: str = 'auto'):
+    """
+    파서 함수 선택
+
+    Args:
+        engine: 'auto' | 'selectolax' | 'lxml' | 'bs4'
+            auto는 설치된 엔진 중 가장 빠른 것, 지정한 엔진이 없으면 bs4로 대체
+
+    Returns:
+        (engine_name, parse_fn)
+    """
+    if engine != 'auto':
+        if engine not in ENGINES:
+            raise ValueError(f"알 수 없는 파서 엔진: {engine} (가능: {', '.join(ENGINES)})")
+        if ENGINES[engine][1]:
+            return engine, ENGINES[engine][0]
+        print(f"⚠️ {engine} 미설치, bs4 파서로 대체")
+        engine = 'bs4'
+
+    for name in available_engines():
+        if engine in ('auto', name):
+            return name, ENGINES[name][0]
+
+    raise ImportError("HTML 파서가 필요합니다: pip install beautifulsoup4")
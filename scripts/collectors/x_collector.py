@@ -2,30 +2,115 @@
 """
 X (Twitter) Collector using Twikit
 2025년 작동 확인된 라이브러리 사용
+- 감시 목록(유저 + 검색어)을 한 Client로 동시에 수집 (세마포어로 동시 요청 수 제한)
+- 유저 이름 → id 조회 결과는 .cache/x_users.json에 저장 (다음 실행부터 조회 요청 생략)
+- rate limit(429)이면 리셋 시각까지 모든 요청을 멈췄다가 재시도, 그 밖의 일시 오류는 지수 백오프
+- 전체 제한 시간이 지나면 끝난 결과만 반환
+- 유저/검색어별 커서(since_id + 페이지 커서, utils.cursor_store)로 지난번 이후 트윗만 읽음
+- 읽었지만 다이제스트에 못 들어간 포스트는 커서에 보류해 두고 다음 실행에서 다시 후보로
+
+감시 목록 (.env, 쉼표로 구분):
+    X_WATCH_USERS=karpathy,sama
+    X_WATCH_QUERIES=gemini 2.5,"open source" llm
+
+CLI:
+    python -m collectors.x_collector                      # 감시 목록 테스트 수집 (커서 사용 안 함)
+    python -m collectors.x_collector --cursors            # 저장된 커서 목록
+    python -m collectors.x_collector --reset              # 커서 전부 초기화
+    python -m collectors.x_collector --reset @karpathy gemini   # 일부만 (@유저 / 검색어)
 """
 
+import argparse
 import asyncio
 import json
 import os
-from datetime import datetime
+import random
+import time
 from pathlib import Path
 from dotenv import load_dotenv
 
+from models import Post
+from renderers import Section, render_text
+from utils.cursor_store import CursorStore
+from utils.llm_executor import is_retryable
+from utils.metrics import metrics
+
 # .env 파일 로드
 load_dotenv(Path(__file__).parent.parent / '.env')
 
 # twikit import
 try:
     from twikit import Client
+    TWIKIT_AVAILABLE = True
 except ImportError:
-    print("twikit이 설치되지 않았습니다. pip install twikit 실행하세요.")
-    exit(1)
+    TWIKIT_AVAILABLE = False
+
+DEFAULT_USERS_CACHE = Path(__file__).parent.parent / '.cache' / 'x_users.json'
+
+
+def _env_list(name: str) -> list:
+    return [value.strip() for value in os.getenv(name, '').split(',') if value.strip()]
+
+
+def watchlist_from_env() -> tuple:
+    """X_WATCH_USERS / X_WATCH_QUERIES → (유저 목록, 검색어 목록)"""
+    return [username.lstrip('@') for username in _env_list('X_WATCH_USERS')], _env_list('X_WATCH_QUERIES')
+
+
+def build_post(tweet, author: str = None) -> Post:
+    """twikit Tweet → Post (author가 없으면 트윗 작성자)"""
+    if author is None:
+        author = tweet.user.screen_name if tweet.user else 'unknown'
+    text = tweet.text or ''
+    return Post(
+        source='x',
+        url=f"https://x.com/{author}/status/{tweet.id}" if author != 'unknown' else '',
+        title=text.split('\n', 1)[0][:100],
+        timestamp=str(tweet.created_at) if tweet.created_at else '',
+        id=str(tweet.id),
+        author=author,
+        text=text,
+        likes=tweet.favorite_count or 0,
+        retweets=tweet.retweet_count or 0,
+    )
 
 
 class XCollector:
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 4, max_retries: int = 3, base_delay: float = 2.0,
+                 max_delay: float = 60.0, users_cache_path: Path = None, cursor_store: CursorStore = None,
+                 max_pages: int = 5, max_gaps: int = 5, max_held: int = 20):
+        """
+        Args:
+            max_concurrency: 동시에 보낼 최대 요청 수
+            max_retries: rate limit / 일시 오류 재시도 횟수
+            base_delay: 첫 재시도 대기 시간 (초, 시도마다 두 배)
+            max_delay: 재시도 대기 최대 시간 (초, rate limit 리셋 대기는 제외)
+            users_cache_path: 유저 이름 → id 캐시 파일
+            cursor_store: 유저/검색어별 읽은 위치 (있으면 지난번 이후 트윗만 수집)
+            max_pages: 한 번에 since_id까지 넘길 최대 페이지 수 (넘으면 다음 실행에서 이어서)
+            max_gaps: 키 하나에 남겨둘 다 못 읽은 구간 수 (넘으면 가장 오래된 구간부터 포기)
+            max_held: 키 하나에 보류해 둘 보내지 못한 포스트 수 (넘으면 오래된 것부터 버림)
+        """
+        if not TWIKIT_AVAILABLE:
+            raise ImportError("twikit이 설치되지 않았습니다. pip install twikit 실행하세요.")
+
         self.client = Client('ko')  # 한국어 설정
         self.cookies_path = Path(__file__).parent.parent / 'cookies.json'
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.users_cache_path = Path(users_cache_path) if users_cache_path else DEFAULT_USERS_CACHE
+        self.user_ids = self._load_user_ids()
+        self._users_changed = False
+        self._semaphore = None
+        self._semaphore_loop = None
+        self._resume_at = 0.0  # rate limit 리셋 시각 (time.time() 기준) - 그 전에는 요청하지 않음
+        self.cursor_store = cursor_store
+        self.max_pages = max(1, max_pages)
+        self.max_gaps = max(1, max_gaps)
+        self.max_held = max(0, max_held)
+        self.pending_cursors = {}
 
     async def login(self):
         """X 계정 로그인 (쿠키 재사용)"""
@@ -62,85 +147,288 @@ class XCollector:
             print(f"로그인 실패: {e}")
             return False
 
-    async def get_user_tweets(self, username: str, count: int = 10):
-        """특정 유저의 최근 트윗 가져오기"""
+    # ---- 유저 id 캐시 ----
 
-        print(f"\n@{username}의 트윗 수집 중...")
+    def _load_user_ids(self) -> dict:
+        try:
+            return json.loads(self.users_cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def save_user_ids(self):
+        """새로 조회한 유저 id가 있으면 캐시 파일에 저장"""
+        if not self._users_changed:
+            return
+        try:
+            self.users_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.users_cache_path.with_suffix('.tmp')
+            tmp.write_text(json.dumps(self.user_ids, ensure_ascii=False, indent=1), encoding='utf-8')
+            os.replace(tmp, self.users_cache_path)
+            self._users_changed = False
+        except OSError as e:
+            print(f"⚠️ X 유저 캐시 저장 실패: {e}")
+
+    async def resolve_user_id(self, username: str) -> str:
+        """유저 이름 → id (캐시에 없을 때만 get_user_by_screen_name 요청)"""
+        key = username.lower()
+        if key not in self.user_ids:
+            user = await self._request(self.client.get_user_by_screen_name, username)
+            metrics.incr('x_user_lookups')
+            self.user_ids[key] = str(user.id)
+            self._users_changed = True
+        return self.user_ids[key]
+
+    # ---- 요청 (동시 실행 수 제한 + 재시도) ----
+
+    def _limiter(self) -> asyncio.Semaphore:
+        # 세마포어는 이벤트 루프에 묶이므로 asyncio.run()마다 새로 만듦
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """rate limit 리셋 시각을 알면 그때까지 (다른 요청도 함께 멈춤), 아니면 지수 백오프"""
+        reset = getattr(error, 'rate_limit_reset', None)
+        if reset:
+            self._resume_at = max(self._resume_at, float(reset) + 1)
+            return max(0.0, self._resume_at - time.time())
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return delay * random.uniform(0.5, 1.0)  # 동시에 재시도가 몰리지 않도록
+
+    async def _request(self, fn, *args, **kwargs):
+        """twikit 코루틴 함수 한 번 호출 (동시 실행 수 제한, rate limit 대기, 재시도)"""
+        semaphore = self._limiter()
+        for attempt in range(self.max_retries + 1):
+            async with semaphore:
+                pause = self._resume_at - time.time()
+                if pause > 0:
+                    await asyncio.sleep(pause)
+                try:
+                    metrics.incr('x_requests')
+                    return await fn(*args, **kwargs)
+                except Exception as e:
+                    if attempt >= self.max_retries or not is_retryable(e):
+                        raise
+                    delay = self._retry_delay(e, attempt)
+                    metrics.incr('x_retries')
+                    print(f"  ⏳ X 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후): {e}")
+
+            await asyncio.sleep(delay)
+
+    # ---- 수집 (커서가 있으면 지난번 이후 트윗만) ----
+
+    async def _paginate(self, fetch, stop_id: int, cursor: str = None, max_pages: int = 1) -> tuple:
+        """
+        최신 → 과거 순으로 페이지를 넘기며 stop_id보다 새 트윗만 모음
+
+        페이지 마지막 트윗(고정 트윗 제외 가장 오래된 것)이 stop_id 이하이면 거기서 멈춘다.
+
+        Returns:
+            (트윗 목록, 이어 읽을 커서 - stop_id에 닿기 전에 페이지 한도로 멈췄을 때만)
+        """
+        tweets = []
+        for _ in range(max_pages):
+            page = await self._request(fetch, cursor)
+            batch = list(page)
+            metrics.incr('x_pages')
+            tweets.extend(tweet for tweet in batch if int(tweet.id) > stop_id)
+            cursor = getattr(page, 'next_cursor', None)
+            if not batch or not cursor or (stop_id and int(batch[-1].id) <= stop_id):
+                return tweets, None
+        return tweets, cursor
+
+    async def _fetch_new(self, key: str, fetch) -> list:
+        """
+        키(유저/검색어) 하나의 새 트윗
+
+        - 커서가 없으면 (처음이거나 cursor_store 없음) 첫 페이지만
+        - 있으면 since_id에 닿을 때까지 최대 max_pages 페이지, 지난번들에 못 다 읽은 구간마다
+          이어서 최대 max_pages 페이지씩 (이번에 새로 생긴 구간은 목록 앞에 추가)
+        새 상태는 pending_cursors에 두고 commit_cursors()에서 저장 (지난번 보류 포스트는 _with_held가 붙임)
+        """
+        state = self.cursor_store.get(key) if self.cursor_store else None
+        if state is None or state['since_id'] is None:
+            tweets, _ = await self._paginate(fetch, 0)
+            since_id, gaps = 0, []
+        else:
+            since_id = state['since_id']
+            tweets, cursor = await self._paginate(fetch, since_id, max_pages=self.max_pages)
+            gaps = [(cursor, since_id)] if cursor else []
+            for gap_cursor, floor in state['gaps']:
+                older, older_cursor = await self._paginate(fetch, floor or 0, gap_cursor, self.max_pages)
+                tweets.extend(older)
+                if older_cursor:
+                    gaps.append((older_cursor, floor))
+            if len(gaps) > self.max_gaps:
+                print(f"  ⚠️ {key}: 못 다 읽은 구간 {len(gaps)}개 - 오래된 {len(gaps) - self.max_gaps}개는 포기")
+                gaps = gaps[:self.max_gaps]
+            if gaps:
+                print(f"  📑 {key}: {self.max_pages}페이지 한도 - 나머지 {len(gaps)}개 구간은 다음 실행에서 이어서")
+
+        if self.cursor_store:
+            newest = max((int(tweet.id) for tweet in tweets), default=0)
+            self.pending_cursors[key] = {
+                'since_id': max(since_id, newest) or None,
+                'gaps': gaps,
+                'held': state['held'] if state else [],
+            }
+        metrics.incr('x_new_tweets', len(tweets))
+        return tweets
+
+    def _with_held(self, key: str, posts: list) -> list:
+        """
+        새 포스트 + 지난번에 보류한 포스트 (이번 후보 전체를 pending_cursors에 기록)
+
+        since_id는 읽은 위치라 이미 가장 새 트윗까지 넘어가 있으므로, 다이제스트에 못 들어간
+        포스트는 다시 읽는 대신 commit_cursors()에서 커서에 보류해 둔다.
+        """
+        state = self.pending_cursors.get(key)
+        if state is None:
+            return posts
+        ids = {post.id for post in posts}
+        held = [Post.from_dict(data) for data in state['held'] if data.get('id') not in ids]
+        state['posts'] = posts + held
+        return state['posts']
 
+    async def get_user_tweets(self, username: str, count: int = 10):
+        """특정 유저의 새 트윗 (cursor_store가 없으면 최근 count개)"""
         try:
-            # 유저 정보 가져오기
-            user = await self.client.get_user_by_screen_name(username)
-            print(f"유저: {user.name} (@{user.screen_name})")
-            print(f"팔로워: {user.followers_count:,}")
-
-            # 트윗 가져오기
-            tweets = await user.get_tweets('Tweets', count=count)
-
-            results = []
-            for tweet in tweets:
-                results.append({
-                    'id': tweet.id,
-                    'text': tweet.text,
-                    'created_at': str(tweet.created_at) if tweet.created_at else None,
-                    'likes': tweet.favorite_count,
-                    'retweets': tweet.retweet_count,
-                    'url': f"https://x.com/{username}/status/{tweet.id}"
-                })
-
-            print(f"{len(results)}개 트윗 수집 완료!")
+            user_id = await self.resolve_user_id(username)
+            tweets = await self._fetch_new(
+                f"user:{username.lower()}",
+                lambda cursor: self.client.get_user_tweets(user_id, 'Tweets', count=count, cursor=cursor),
+            )
+
+            results = self._with_held(f"user:{username.lower()}",
+                                      [build_post(tweet, author=username) for tweet in tweets])
+
+            print(f"  🐦 @{username}: {len(results)}개 트윗")
             return results
 
         except Exception as e:
-            print(f"트윗 수집 실패: {e}")
+            print(f"  ❌ @{username} 트윗 수집 실패: {e}")
             return []
 
     async def search_tweets(self, query: str, count: int = 20):
-        """키워드로 트윗 검색"""
+        """키워드 검색의 새 트윗 (cursor_store가 없으면 최근 count개)"""
+        try:
+            tweets = await self._fetch_new(
+                f"search:{query}",
+                lambda cursor: self.client.search_tweet(query, 'Latest', count=count, cursor=cursor),
+            )
 
-        print(f"\n'{query}' 검색 중...")
+            results = self._with_held(f"search:{query}", [build_post(tweet) for tweet in tweets])
 
-        try:
-            tweets = await self.client.search_tweet(query, 'Latest', count=count)
-
-            results = []
-            for tweet in tweets:
-                results.append({
-                    'id': tweet.id,
-                    'text': tweet.text,
-                    'author': tweet.user.screen_name if tweet.user else 'unknown',
-                    'created_at': str(tweet.created_at) if tweet.created_at else None,
-                    'likes': tweet.favorite_count,
-                    'retweets': tweet.retweet_count,
-                    'url': f"https://x.com/{tweet.user.screen_name}/status/{tweet.id}" if tweet.user else None
-                })
-
-            print(f"{len(results)}개 트윗 검색 완료!")
+            print(f"  🔎 '{query}': {len(results)}개 트윗")
             return results
 
         except Exception as e:
-            print(f"검색 실패: {e}")
+            print(f"  ❌ '{query}' 검색 실패: {e}")
+            return []
+
+    def commit_cursors(self, sent: list = None):
+        """
+        이번에 읽은 위치를 저장 (발송 후 호출 - 발송에 실패하면 호출하지 않아 다음 실행에서 다시 읽음)
+
+        Args:
+            sent: 실제로 보낸 포스트 (나머지 후보는 키마다 최신 max_held개까지 보류, None이면 전부 보낸 것으로)
+        """
+        if not (self.cursor_store and self.pending_cursors):
+            return
+        sent_ids = None if sent is None else {post.id for post in sent}
+        for key, state in self.pending_cursors.items():
+            if 'posts' not in state:
+                continue  # 포스트를 만들기 전에 실패한 키 - 지난번 보류 목록 그대로
+            candidates = state.pop('posts')
+            held = [] if sent_ids is None else [post for post in candidates if post.id not in sent_ids]
+            if len(held) > self.max_held:
+                print(f"  ⚠️ {key}: 보내지 못한 포스트 {len(held)}개 - 오래된 {len(held) - self.max_held}개는 포기")
+                held = sorted(held, key=lambda post: int(post.id), reverse=True)[:self.max_held]
+            state['held'] = [post.to_dict() for post in held]
+        self.cursor_store.set_many(self.pending_cursors)
+        self.pending_cursors = {}
+
+    async def collect_watchlist(self, usernames: list = (), queries: list = (), count: int = 10,
+                                timeout: float = None) -> list:
+        """
+        감시 목록 전체를 동시에 수집
+
+        Args:
+            usernames: 유저 이름 목록 (대소문자 무시하고 중복 제거)
+            queries: 검색어 목록
+            count: 유저/검색어당 한 페이지 트윗 수
+            timeout: 전체 제한 시간 (초, 넘으면 끝난 결과만)
+
+        Returns:
+            Post 목록 (감시 목록 순서, 같은 트윗은 한 번만)
+        """
+        unique = {}
+        for username in usernames:
+            unique.setdefault(username.lower(), username)
+        usernames = list(unique.values())
+        jobs = ([self.get_user_tweets(username, count) for username in usernames]
+                + [self.search_tweets(query, count) for query in dict.fromkeys(queries)])
+        if not jobs:
             return []
 
+        tasks = [asyncio.ensure_future(job) for job in jobs]
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+            if pending:
+                print(f"  ⏱️ X 수집 제한 시간({timeout:g}초) 초과, {len(pending)}개 요청 취소")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            self.save_user_ids()
+
+        posts, seen = [], set()
+        for task in tasks:
+            if task.cancelled():
+                continue
+            for post in task.result():
+                if post.id not in seen:
+                    seen.add(post.id)
+                    posts.append(post)
+        return posts
+
+    def collect(self, usernames: list = None, queries: list = None, count: int = 10,
+                timeout: float = None) -> list:
+        """
+        공통 수집 인터페이스 (collectors.registry)
+
+        로그인 후 유저별 최근 트윗과 검색 결과를 Post 목록으로 반환 (동기 호출).
+        usernames / queries를 둘 다 생략하면 .env의 감시 목록(X_WATCH_USERS / X_WATCH_QUERIES).
+        cursor_store가 있으면 지난번 이후 트윗만 - 다 처리한 뒤 commit_cursors()를 호출할 것.
+        """
+        if usernames is None and queries is None:
+            usernames, queries = watchlist_from_env()
+
+        async def run():
+            if not await self.login():
+                return []
+            return await self.collect_watchlist(usernames or (), queries or (), count, timeout)
+
+        return asyncio.run(run())
+
     def format_tweets_markdown(self, tweets: list, title: str = "수집된 트윗") -> str:
         """트윗을 마크다운 형식으로 변환"""
+        return render_text([Section(None, tweets)], 'markdown', title)
 
-        output = f"# {title}\n\n"
-        output += f"> 수집 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        output += "---\n\n"
-
-        for i, tweet in enumerate(tweets, 1):
-            output += f"## {i}. @{tweet.get('author', 'unknown')}\n\n"
-            output += f"{tweet['text']}\n\n"
-            output += f"- Likes: {tweet.get('likes', 0):,} | "
-            output += f"RT: {tweet.get('retweets', 0):,}\n"
-            output += f"- [원문 보기]({tweet.get('url', '#')})\n\n"
-            output += "---\n\n"
 
-        return output
+def cursor_key(name: str) -> str:
+    """CLI 인자 → 커서 키 ('@유저' → user:유저, 'user:'/'search:'는 그대로, 나머지는 검색어)"""
+    if name.startswith(('user:', 'search:')):
+        return name
+    if name.startswith('@'):
+        return f"user:{name[1:].lower()}"
+    return f"search:{name}"
 
 
-async def main():
-    """테스트 실행"""
+async def collect_test():
+    """테스트 실행 (.env 감시 목록, 없으면 @elonmusk)"""
     collector = XCollector()
 
     # 로그인
@@ -148,12 +436,14 @@ async def main():
         print("로그인 실패. .env 파일을 확인하세요.")
         return
 
-    # 테스트: elonmusk 트윗 가져오기
-    tweets = await collector.get_user_tweets('elonmusk', count=5)
+    usernames, queries = watchlist_from_env()
+    if not usernames and not queries:
+        usernames = ['elonmusk']
+    tweets = await collector.collect_watchlist(usernames, queries, count=5, timeout=60)
 
     if tweets:
         # 마크다운으로 출력
-        md = collector.format_tweets_markdown(tweets, "@elonmusk 최근 트윗")
+        md = collector.format_tweets_markdown(tweets, "X 감시 목록 최근 트윗")
         print("\n" + "="*60)
         print(md)
 
@@ -164,5 +454,24 @@ async def main():
         print(f"\n저장됨: {output_path}")
 
 
+def main():
+    parser = argparse.ArgumentParser(description="X 감시 목록 수집 / 커서 관리")
+    parser.add_argument('--cursors', action='store_true', help="저장된 커서 목록")
+    parser.add_argument('--reset', nargs='*', metavar='KEY',
+                        help="커서 초기화 (@유저 / 검색어, 생략하면 전부)")
+    args = parser.parse_args()
+
+    if args.cursors:
+        for key, since_id, gaps, held, updated_at in CursorStore().all():
+            mark = f"  📑 이어 읽을 구간 {gaps}개" if gaps else ""
+            mark += f"  📥 보류 {held}개" if held else ""
+            print(f"{key:<40} since_id={since_id}  {time.strftime('%Y-%m-%d %H:%M', time.localtime(updated_at))}{mark}")
+    elif args.reset is not None:
+        keys = [cursor_key(name) for name in args.reset] or None
+        print(f"🧹 커서 {CursorStore().reset(keys)}개 초기화")
+    else:
+        asyncio.run(collect_test())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
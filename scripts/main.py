@@ -4,92 +4,430 @@ News Aggregator - Main Entry Point
 GitHub Actions에서 실행되는 메인 스크립트
 """
 
+import argparse
+import cProfile
+import io
 import os
+import pstats
 import sys
+import tracemalloc
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, date
 
 # 모듈 경로 추가
 sys.path.insert(0, str(Path(__file__).parent))
 
-from collectors.github_trending import GitHubTrendingCollector
-from collectors.rss_collector import RSSCollector
+from archive import Archive
+from collectors import registry
+from pipeline import Pipeline
+from ranking import Ranker
+from renderers import TELEGRAM_PARSE_MODE, open_outputs, preview_items, render, render_text
+from scheduler import AdaptiveScheduler
 from senders.telegram_sender import TelegramSender
+from utils.cursor_store import CursorStore
+from utils.http_cache import HTTPCache
+from utils.llm_executor import LLMExecutor
+from utils.metrics import metrics, DEFAULT_METRICS_DIR
+from utils.seen_store import SeenStore
+from utils.source_health import SourceHealth
+from utils.timestamps import parse_timestamp
+from utils.summary_cache import SummaryCache
 
+# 전체 수집+요약 마감 시간 (초) - 넘으면 끝난 것만으로 발송
+PIPELINE_TIMEOUT = 180
+
+# X 감시 목록 수집 제한 시간 (초) - 넘으면 끝난 계정/검색어만 사용
+X_TIMEOUT = 60
+
+# 텔레그램 다이제스트에 넣을 항목 수 (점수 순으로 고름)
+DIGEST_REPOS = 5
+DIGEST_ARTICLES = 8
+DIGEST_POSTS = 3
+DIGEST_ITEMS = DIGEST_REPOS + DIGEST_ARTICLES + DIGEST_POSTS
+
+# 데몬에서 피드 하나의 새 기사로 보내는 메시지의 항목 수
+DAEMON_ITEMS = 10
+
+# 실행 끝에 보여줄 소스 상태 수 (실패로 시간을 많이 쓴 소스부터)
+HEALTH_REPORT_LIMIT = 5
+
+# 회로가 열린 소스의 쿨다운 - 하루 한 번 도는 cron은 실행 횟수로 센다
+# (2회 = 다음 실행은 건너뛰고 그다음에 시험, 시험이 실패할 때마다 두 배, 최대 16회 ≈ 보름)
+# 데몬은 계속 돌므로 시간으로 (SourceHealth 기본값: 10분, 최대 12시간)
+HEALTH_COOLDOWN_RUNS = 2
+HEALTH_MAX_COOLDOWN_RUNS = 16
+
+
+def digest_sections(repos: list, rss_results: dict, rss_collector, posts: list = None) -> list:
+    """
+    다이제스트 섹션 - 텔레그램에는 점수 상위 GitHub 5개 + 전체 피드에서 뉴스 8개 + X 3개 (ranking.Ranker)
+
+    파일 출력에는 고르지 않은 항목도 섹션 뒤쪽에 그대로 들어간다.
+    """
+    ranker = Ranker()
+    sections = []
+    if repos:
+        sections.extend(ranker.sections({"🔥 오늘의 GitHub Trending": repos}, k=DIGEST_REPOS))
+    if rss_collector and rss_results:
+        sections.extend(rss_collector.telegram_sections(rss_results, DIGEST_ARTICLES, ranker=ranker))
+    if posts:
+        sections.extend(ranker.sections({"🐦 X": posts}, k=DIGEST_POSTS))
+    return sections
+
+
+def sent_articles(sections: list, results: dict, max_items: int) -> dict:
+    """
+    텔레그램 메시지에 실제로 들어간 기사(포스트)만 {source: [articles]}
+
+    섹션별 preview와 전체 max_items에 걸려 빠진 항목은 본 것으로 기록하지 않는다.
+    """
+    shown = {id(item) for item in preview_items(sections, max_items)}
+    return {name: [article for article in articles if id(article) in shown] for name, articles in results.items()}
+
+
+def render_digest(sections: list, collected_at: datetime = None) -> str:
+    """
+    다이제스트 렌더링 - output/digest.md, .html, .json 파일과 텔레그램 메시지
+
+    Returns:
+        텔레그램 메시지 (MarkdownV2)
+    """
+    collected_at = collected_at or datetime.now()
+    telegram = io.StringIO()
+    options = {
+        'telegram': {
+            'max_items': DIGEST_ITEMS,
+            'subtitle': f"📅 {collected_at.strftime('%Y년 %m월 %d일')}",
+            'footer': "🤖 Powered by News Aggregator",
+        },
+    }
+
+    try:
+        with open_outputs('digest') as (files, paths):
+            render(sections, {**files, 'telegram': telegram}, "🌅 Daily Tech Digest", collected_at, options)
+        print(f"💾 저장됨: {', '.join(str(path) for path in paths.values())}")
+    except OSError as e:
+        print(f"⚠️ 결과 파일 저장 실패: {e}")
+        telegram = io.StringIO()
+        render(sections, {'telegram': telegram}, "🌅 Daily Tech Digest", collected_at, options)
+
+    return telegram.getvalue()
 
-def main():
-    print(f"🚀 News Aggregator 시작 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 60)
 
-    results = {}
+def archive_run(archive: Archive, items: list, digest: str = None):
+    """수집 결과를 아카이브에 저장 (실패해도 실행은 계속)"""
+    if archive is None or not (items or digest):
+        return
+    try:
+        with metrics.span('archive'):
+            count = archive.add_run(items, digest)
+        print(f"📚 아카이브 저장: {count}개 항목")
+    except Exception as e:  # 아카이브 문제로 실행이 멈추면 안 됨
+        print(f"⚠️ 아카이브 저장 실패: {e}")
+
+
+def record_star_history(repos: list):
+    """트렌딩 레포의 스타/포크 수 기록 (star_history.py risers로 조회)"""
+    if not repos:
+        return
+    from star_history import StarHistory  # numpy 로딩(~50ms)은 기록할 때만
+    try:
+        with metrics.span('star_history'):
+            count = StarHistory().record(repos)
+        print(f"⭐ 스타 기록: {count}개 레포")
+    except (OSError, RuntimeError) as e:
+        print(f"⚠️ 스타 기록 실패: {e}")
+
 
-    # 1. GitHub Trending 수집
-    print("\n📊 GitHub Trending 수집 중...")
+def open_archive():
     try:
-        github_collector = GitHubTrendingCollector(use_ai_summary=True)
-        repos = github_collector.get_trending(since="daily")
-
-        if repos:
-            # 마크다운 생성
-            md = github_collector.format_markdown(repos, "GitHub Trending")
-
-            # 텔레그램용 요약 (상위 5개만)
-            summary = "🔥 *오늘의 GitHub Trending*\n\n"
-            for repo in repos[:5]:
-                summary += f"• [{repo['full_name']}]({repo['url']})\n"
-                if repo.get('summary_kr'):
-                    summary += f"  └ {repo['summary_kr']}\n"
-                summary += f"  ⭐ {repo['stars']:,} | {repo['today_stars']}\n\n"
-
-            results['github'] = summary
-            print(f"✅ {len(repos)}개 레포 수집 완료")
-        else:
-            print("⚠️ GitHub Trending 수집 실패")
+        return Archive()
+    except Exception as e:  # 색인 보충(catch_up) 중 오류 포함 - 아카이브 없이 계속
+        print(f"⚠️ 아카이브를 열 수 없음: {e}")
+        return None
+
+
+def open_health(daemon: bool = False) -> SourceHealth:
+    """소스 상태 기록 (cron 실행은 쿨다운을 실행 횟수로, 데몬은 시간으로)"""
+    if daemon:
+        return SourceHealth()
+    return SourceHealth(cooldown=HEALTH_COOLDOWN_RUNS, max_cooldown=HEALTH_MAX_COOLDOWN_RUNS, per_run=True)
+
+
+def build_pipeline(http_cache: HTTPCache, summary_cache: SummaryCache, llm_executor: LLMExecutor,
+                   seen_store: SeenStore, health: SourceHealth = None):
+    """
+    수집기별 소스 등록
+
+    GitHub Trending과 RSS가 각각 독립된 소스라서 먼저 끝난 쪽은 다른 쪽을 기다리지 않고
+    바로 요약에 들어간다. RSS 피드들은 스레드 풀에서 동시에 받은 뒤 기사를 모아서 한 번에
+    요약한다 (피드마다 따로 요약하면 배치가 쪼개져 요청 수와 분당 쿼터 대기가 늘어남).
+    RSS는 지난 실행에서 보낸 기사를 빼고 새 기사만 수집한다. 트렌딩은 며칠씩
+    머무는 레포가 많아 매번 전체 목록을 보낸다 (요약은 요약 캐시가 재사용).
+    X는 .env에 감시 목록(X_WATCH_USERS / X_WATCH_QUERIES)이 있을 때만 X_TIMEOUT 안에서 수집한다.
+    계정/검색어별 커서로 지난번에 보낸 트윗 이후만 읽는다.
+    health가 있으면 트렌딩/피드별로 성공·실패를 기록하고, 계속 실패하는 소스는
+    제한 시간까지 기다리지 않고 바로 건너뛴다 (쿨다운 뒤 한 번씩 다시 시험).
+
+    Returns:
+        (pipeline, rss_collector, x_collector) - 만들지 못한(X는 감시 목록이 없는) 수집기는 None
+    """
+    pipeline = Pipeline(timeout=PIPELINE_TIMEOUT)
+
+    try:
+        github_collector = registry.create('github', use_ai_summary=True, http_cache=http_cache,
+                                           summary_cache=summary_cache, llm_executor=llm_executor,
+                                           health=health)
+
+        def summarize_top(repos: list) -> list:
+            github_collector.summarize_repos(repos[:10])  # 상위 10개만 요약 (API 절약)
+            return repos
+
+        pipeline.add_source(
+            'github',
+            lambda: github_collector.get_trending(since="daily", summarize=False),
+            summarize_top,
+        )
     except Exception as e:
-        print(f"❌ GitHub 수집 오류: {e}")
+        print(f"❌ GitHub 수집기 초기화 오류: {e}")
 
-    # 2. RSS 뉴스 수집
-    print("\n📰 Tech 뉴스 수집 중...")
+    rss_collector = None
     try:
-        rss_collector = RSSCollector(use_ai_summary=True, max_per_source=3)
-        rss_results = rss_collector.collect_all()
-
-        if rss_results:
-            # 텔레그램용 포맷
-            results['rss'] = rss_collector.format_telegram(rss_results, max_items=8)
-            print(f"✅ RSS 뉴스 수집 완료")
-        else:
-            print("⚠️ RSS 뉴스 수집 실패")
+        rss_collector = registry.create('rss', use_ai_summary=True, max_per_source=3, http_cache=http_cache,
+                                        summary_cache=summary_cache, llm_executor=llm_executor,
+                                        seen_store=seen_store, health=health)
+        pipeline.add_source(
+            'rss',
+            lambda: rss_collector.fetch_all(rss_collector.FEEDS),
+            # 피드 간 중복 제거 후 전체를 요약 배치로
+            rss_collector.summarize_results,
+        )
     except Exception as e:
-        print(f"❌ RSS 수집 오류: {e}")
+        print(f"❌ RSS 수집기 초기화 오류: {e}")
 
-    # 3. 텔레그램 발송
-    print("\n📤 텔레그램 발송 중...")
-    sender = TelegramSender()
+    # X는 감시 목록이 있을 때만 (twikit import 비용도 그때만)
+    x_collector = None
+    if os.getenv('X_WATCH_USERS') or os.getenv('X_WATCH_QUERIES'):
+        try:
+            x_collector = registry.create('x', cursor_store=CursorStore())
+            pipeline.add_source('x', lambda: x_collector.collect(timeout=X_TIMEOUT))
+        except Exception as e:
+            x_collector = None
+            print(f"❌ X 수집기 초기화 오류: {e}")
+
+    return pipeline, rss_collector, x_collector
 
-    if sender.enabled and (results.get('github') or results.get('rss')):
-        message = f"🌅 *Daily Tech Digest*\n"
-        message += f"📅 {datetime.now().strftime('%Y년 %m월 %d일')}\n\n"
 
-        # GitHub Trending
-        if results.get('github'):
-            message += results['github']
-            message += "\n"
+def main(metrics_json: Path = None, prometheus_path: Path = None):
+    """
+    Args:
+        metrics_json: 실행 리포트 저장 위치 (None이면 .cache/metrics/run.json)
+        prometheus_path: Prometheus textfile 저장 위치 (None이면 .cache/metrics/news_aggregator.prom)
+    """
+    print(f"🚀 News Aggregator 시작 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 60)
+    metrics.reset()
+    metrics.take_snapshot('start')
 
-        # RSS 뉴스
-        if results.get('rss'):
-            message += results['rss']
+    http_cache = HTTPCache()
+    summary_cache = SummaryCache()
+    llm_executor = LLMExecutor()  # Gemini 쿼터는 두 수집기가 함께 사용
+    seen_store = SeenStore()
+    health = open_health()
+    health.start_run()
 
-        message += "---\n"
-        message += "_🤖 Powered by News Aggregator_"
+    # 1. GitHub Trending + RSS 뉴스 동시 수집 (도착하는 대로 요약)
+    print("\n📡 GitHub Trending + Tech 뉴스 수집 중...")
+    pipeline, rss_collector, x_collector = build_pipeline(http_cache, summary_cache, llm_executor, seen_store,
+                                                         health)
+    collected = pipeline.run()
+    if rss_collector:
+        rss_collector.close()  # 파싱 프로세스 정리
+    metrics.take_snapshot('collect')
 
-        sender.send_message(message)
+    # 2. 결과 정리 (파일 + 텔레그램 메시지 렌더링)
+    repos = collected.get('github')
+    if repos:
+        print(f"✅ {len(repos)}개 레포 수집 완료")
+    else:
+        print("⚠️ GitHub Trending 수집 실패")
+
+    # 요약이 마감까지 안 끝났으면 수집 결과(fetch_all) 그대로 - 기사 없는 피드는 뺌
+    rss_results = {name: articles for name, articles in (collected.get('rss') or {}).items() if articles}
+    if rss_collector and rss_results:
+        print(f"✅ RSS 뉴스 수집 완료 ({len(rss_results)}개 소스)")
+    else:
+        print("⚠️ RSS 뉴스 수집 실패")
+
+    posts = collected.get('x') or []
+    if posts:
+        print(f"✅ X 트윗 {len(posts)}개 수집 완료")
+
+    sections = digest_sections(repos, rss_results, rss_collector, posts)
+    message = None
+    if sections:
+        with metrics.span('format'):
+            message = render_digest(sections)
+
+    print(pipeline.report())
+    metrics.take_snapshot('format')
+
+    # 3. 텔레그램 발송
+    print("\n📤 텔레그램 발송 중...")
+    sender = TelegramSender()
+
+    if sender.enabled and message:
+        if sender.send_message(message, parse_mode=TELEGRAM_PARSE_MODE):
+            # 보낸 기사/트윗은 다음 실행에서 제외 (다이제스트에 못 들어간 기사는 다음에 다시 후보)
+            if rss_results:
+                rss_collector.mark_seen(sent_articles(sections, rss_results, DIGEST_ITEMS))
+            if x_collector:
+                x_collector.commit_cursors(sent_articles(sections, {'x': posts}, DIGEST_ITEMS)['x'])
     else:
         print("⚠️ 텔레그램 미설정 또는 수집 결과 없음")
+    metrics.take_snapshot('send')
+
+    # 4. 아카이브, 스타 기록 (발송 여부와 관계없이 수집한 항목 전부)
+    items = (list(repos or []) + [article for articles in rss_results.values() for article in articles]
+             + posts)
+    archive_run(open_archive(), items, message)
+    record_star_history(repos)
 
     print("\n" + "=" * 60)
+    print(f"📦 {http_cache.summary()}")
+    print(f"📦 {summary_cache.summary()}")
+    print(health.report(limit=HEALTH_REPORT_LIMIT))
+    print(metrics.summary())
+    json_path, prom_path = metrics.write(metrics_json, prometheus_path)
+    print(f"📝 실행 리포트: {json_path}, {prom_path}")
     print("✅ 완료!")
 
 
+def run_daemon(min_interval: float, max_interval: float, max_polls: int = None):
+    """
+    데몬 모드 - 피드마다 갱신 주기에 맞춰 폴링하고 새 기사가 생기면 바로 발송
+
+    자주 바뀌는 피드(Hacker News 등)는 짧게, 하루 몇 번 바뀌는 피드는 길게 폴링한다.
+    피드별 간격 범위는 RSS_FEEDS 항목의 'min_interval' / 'max_interval'(초)로 조정 가능.
+    """
+    print(f"🚀 News Aggregator 데몬 시작 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 60)
+
+    http_cache = HTTPCache()
+    summary_cache = SummaryCache()
+    seen_store = SeenStore()
+    health = open_health(daemon=True)
+    rss_collector = registry.create('rss', use_ai_summary=True, max_per_source=3, http_cache=http_cache,
+                                    summary_cache=summary_cache, llm_executor=LLMExecutor(),
+                                    seen_store=seen_store, health=health)
+    sender = TelegramSender()
+    if not sender.enabled:
+        print("⚠️ 텔레그램 미설정 - 새 기사를 출력만 함 (본 기록도 남기지 않음)")
+    archive = open_archive()
+
+    scheduler = AdaptiveScheduler(min_interval=min_interval, max_interval=max_interval)
+    run_day = date.today()
+
+    def poll(name: str, feed_info: dict) -> dict:
+        nonlocal run_day
+        if date.today() != run_day:
+            # 피드 간 중복 제거 기록은 하루 단위로 유지
+            run_day = date.today()
+            rss_collector.start_run()
+        rss_collector.summary_budget = rss_collector.max_summaries
+
+        polled = rss_collector.poll_feed(name, feed_info)
+        articles = rss_collector.summarize_feed(rss_collector.dedupe_feed(polled['articles']))
+        if articles:
+            print(f"  🆕 {name}: 새 기사 {len(articles)}개")
+            results = {name: articles}
+            sections = rss_collector.telegram_sections(results, DAEMON_ITEMS)
+            message = render_text(sections, 'telegram', "📰 Tech News Digest", max_items=DAEMON_ITEMS)
+            if sender.enabled and sender.send_message(message, parse_mode=TELEGRAM_PARSE_MODE):
+                rss_collector.mark_seen(sent_articles(sections, results, DAEMON_ITEMS))
+            archive_run(archive, articles, message)
+
+        metrics.write()  # 데몬에서는 누적 카운터
+        return {
+            'timestamps': [parse_timestamp(entry['published']) for entry in polled['entries']],
+            'changed': polled['changed'],
+        }
+
+    for name, feed_info in rss_collector.FEEDS.items():
+        scheduler.add_job(
+            name,
+            lambda name=name, feed_info=feed_info: poll(name, feed_info),
+            min_interval=feed_info.get('min_interval'),
+            max_interval=feed_info.get('max_interval'),
+        )
+
+    try:
+        scheduler.run(max_polls=max_polls)
+    except KeyboardInterrupt:
+        print("\n🛑 데몬 종료")
+    finally:
+        scheduler.save_state()
+        rss_collector.close()
+        print(scheduler.report())
+        print(health.report(limit=HEALTH_REPORT_LIMIT))
+        print(f"📦 {http_cache.summary()}")
+        print(f"📦 {summary_cache.summary()}")
+
+
+def run_profiled(run, top: int = 25):
+    """
+    cProfile + tracemalloc으로 실행 (--profile)
+
+    함수별 CPU 시간은 .cache/metrics/profile.prof (snakeviz 등으로 열기)와 콘솔 상위 목록으로,
+    스테이지별 메모리 증가 상위 위치는 실행 리포트의 'memory'로 남는다.
+    """
+    tracemalloc.start(10)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        run()
+    finally:
+        profiler.disable()
+        tracemalloc.stop()
+
+        profile_path = DEFAULT_METRICS_DIR / 'profile.prof'
+        profile_path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(profile_path)
+
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(top)
+        print(stream.getvalue())
+        print(f"🔬 프로파일 저장: {profile_path}")
+
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="News Aggregator")
+    parser.add_argument('--daemon', action='store_true', help="상주하며 피드별 갱신 주기에 맞춰 폴링")
+    parser.add_argument('--min-interval', type=float, default=300, help="데몬 폴링 간격 하한 (초)")
+    parser.add_argument('--max-interval', type=float, default=6 * 3600, help="데몬 폴링 간격 상한 (초)")
+    parser.add_argument('--max-polls', type=int, help="데몬을 이 횟수만큼 폴링하고 종료 (점검용)")
+    parser.add_argument('--metrics-json', type=Path, help="실행 리포트(JSON) 저장 위치")
+    parser.add_argument('--prometheus', type=Path, help="Prometheus textfile 저장 위치 (*.prom)")
+    parser.add_argument('--profile', action='store_true', help="cProfile + 스테이지별 tracemalloc 스냅샷")
+    parser.add_argument('--health', action='store_true',
+                        help="소스별 상태(회로, 지연 시간, 실패에 쓴 시간) 출력 후 종료 (--daemon과 함께면 데몬 기준 쿨다운)")
+    parser.add_argument('--reset-health', nargs='*', metavar='SOURCE',
+                        help="소스 상태 초기화 후 종료 (회로도 닫힘, 생략하면 전부)")
+    args = parser.parse_args()
+
+    if args.health or args.reset_health is not None:
+        health = open_health(daemon=args.daemon)
+        if args.reset_health is not None:
+            print(f"🧹 소스 {health.reset(args.reset_health or None)}개 초기화")
+        print(health.report())
+        sys.exit(0)
+
+    if args.daemon:
+        run = lambda: run_daemon(args.min_interval, args.max_interval, args.max_polls)
+    else:
+        run = lambda: main(args.metrics_json, args.prometheus)
+
+    if args.profile:
+        run_profiled(run)
+    else:
+        run()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Item Models
+수집기/포매터가 함께 쓰는 항목 타입 (GitHub 레포, 기사, X 포스트)
+- 공통 필드(source, url, title, summary, timestamp)는 Item에, 나머지는 타입별로
+- __slots__ 데이터클래스라 dict보다 메모리가 적고, 필드 이름이 틀리면 바로 AttributeError
+- to_dict / from_dict로 JSON(캐시, 리포트)과 오감 ('kind'로 타입 구분)
+
+필드 이름 (예전 dict 키와 다른 것):
+    link → url, published / created_at → timestamp, summary_kr → summary
+"""
+
+import json
+from dataclasses import dataclass, field, fields
+from typing import ClassVar
+
+ITEM_TYPES = {}
+
+
+@dataclass(slots=True)
+class Item:
+    source: str                 # 수집 소스 ('github', 피드 이름, 'x')
+    url: str
+    title: str
+    summary: str = ""           # 한글 요약
+    timestamp: str = ""         # 발행/작성 시각 (원문 문자열, 대부분 ISO 8601)
+
+    KIND: ClassVar[str] = 'item'
+    FIELDS: ClassVar[tuple] = ()  # 필드 이름 (정의 순서, 모듈 끝에서 채움)
+
+    def to_dict(self) -> dict:
+        """JSON 직렬화용 dict ('kind' 포함)"""
+        data = {name: getattr(self, name) for name in self.FIELDS}
+        data['kind'] = self.KIND
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Item':
+        """
+        to_dict 결과 → 항목 ('kind'로 타입 선택, 모르는 키는 무시)
+
+        필수 필드(source, url, title)가 없으면 TypeError
+        """
+        item_type = ITEM_TYPES.get(data.get('kind'), cls) if cls is Item else cls
+        return item_type(**{name: data[name] for name in item_type.FIELDS if name in data})
+
+
+def items_to_json(items: list) -> str:
+    return json.dumps([item.to_dict() for item in items], ensure_ascii=False)
+
+
+def items_from_json(text: str) -> list:
+    return [Item.from_dict(data) for data in json.loads(text)]
+
+
+@dataclass(slots=True)
+class Repo(Item):
+    """GitHub Trending 레포 (title = "owner/name")"""
+    owner: str = ""
+    name: str = ""
+    description: str = ""
+    language: str = "Unknown"
+    stars: int = 0
+    forks: int = 0
+    today_stars: str = ""       # "1,234 stars today"
+    rank: int = 0
+    appearances: list = field(default_factory=list)  # 여러 언어/기간 목록에 오른 기록
+
+    KIND: ClassVar[str] = 'repo'
+
+    @property
+    def full_name(self) -> str:
+        return self.title
+
+
+@dataclass(slots=True)
+class Article(Item):
+    """RSS 기사"""
+    description: str = ""
+    lang: str = "en"
+    category: str = "general"
+    sources: list = field(default_factory=list)  # 같은 기사를 실은 소스들 (중복 제거 시 합쳐짐)
+
+    KIND: ClassVar[str] = 'article'
+
+
+@dataclass(slots=True)
+class Post(Item):
+    """X(Twitter) 포스트 (title = 본문 첫 줄)"""
+    id: str = ""
+    author: str = "unknown"
+    text: str = ""
+    likes: int = 0
+    retweets: int = 0
+
+    KIND: ClassVar[str] = 'post'
+
+
+# slots=True는 클래스를 새로 만들므로 필드 목록/등록은 정의가 끝난 뒤에
+for _item_type in (Item, Repo, Article, Post):
+    _item_type.FIELDS = tuple(f.name for f in fields(_item_type))
+    ITEM_TYPES[_item_type.KIND] = _item_type
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Pipeline
+수집 → 요약 단계를 소스별로 겹쳐서 실행하는 파이프라인
+- 모든 소스의 수집은 동시에 시작
+- 소스 하나가 도착하면 다른 소스를 기다리지 않고 바로 요약 단계로 넘김
+- 마감 시간이 지나면 그때까지 끝난 결과로 마무리 (요약이 덜 끝난 소스는 수집 결과 그대로)
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from utils.metrics import metrics
+
+
+class Pipeline:
+    def __init__(self, max_workers: int = 12, timeout: float = None):
+        """
+        Args:
+            max_workers: 수집/요약 작업을 함께 돌릴 스레드 수
+            timeout: 전체 마감 시간 (초, None이면 모두 끝날 때까지)
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.sources = {}
+        self.timings = {}
+        self.elapsed = 0.0
+
+    def add_source(self, name: str, fetch, process=None):
+        """
+        소스 등록
+
+        Args:
+            name: 결과 dict의 키
+            fetch: 인자 없이 호출하면 수집 결과를 반환하는 함수
+            process: 수집 결과를 받아 가공(요약)한 결과를 반환하는 함수 (선택)
+        """
+        self.sources[name] = (fetch, process)
+
+    def _timed(self, name: str, stage: str, fn, *args):
+        started = time.monotonic()
+        try:
+            with metrics.span(f"pipeline.{stage}", source=name):
+                return fn(*args)
+        finally:
+            self.timings[(name, stage)] = time.monotonic() - started
+
+    def run(self) -> dict:
+        """
+        파이프라인 실행
+
+        Returns:
+            dict: {name: 결과} (등록 순서, 수집에 실패했거나 마감까지 못 끝낸 소스는 제외)
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout if self.timeout else None
+
+        fetched = {}
+        results = {}
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = {
+            pool.submit(self._timed, name, 'fetch', fetch): (name, 'fetch')
+            for name, (fetch, _) in self.sources.items()
+        }
+
+        try:
+            while futures:
+                remaining = deadline - time.monotonic() if deadline else None
+                if remaining is not None and remaining <= 0:
+                    pending = sorted({name for name, _ in futures.values()})
+                    print(f"⏱️ 파이프라인 마감({self.timeout:g}초), 미완료: {', '.join(pending)}")
+                    break
+
+                done, _ = wait(futures, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, stage = futures.pop(future)
+                    try:
+                        value = future.result()
+                    except Exception as e:
+                        print(f"❌ {name} {stage} 오류: {e}")
+                        continue
+
+                    if stage == 'fetch':
+                        fetched[name] = value
+                        process = self.sources[name][1]
+                        if process and value:
+                            futures[pool.submit(self._timed, name, 'process', process, value)] = (name, 'process')
+                        else:
+                            results[name] = value
+                    else:
+                        results[name] = value
+        finally:
+            # 마감 후 남은 작업은 기다리지 않음
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        # 요약이 덜 끝난 소스는 수집 결과 그대로 사용
+        for name, value in fetched.items():
+            results.setdefault(name, value)
+
+        self.elapsed = time.monotonic() - started
+        return {name: results[name] for name in self.sources if name in results}
+
+    def report(self) -> str:
+        """단계별 소요 시간 요약"""
+        lines = [f"⏱️ 파이프라인 {self.elapsed:.1f}초 (단계 합계 {sum(self.timings.values()):.1f}초)"]
+        for (name, stage), seconds in sorted(self.timings.items(), key=lambda kv: -kv[1]):
+            lines.append(f"  - {name} {stage}: {seconds:.2f}초")
+        return "\n".join(lines)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Ranking
+수집한 항목 전체에서 다이제스트에 넣을 항목 고르기
+- 점수 = 소스 가중치 × 카테고리 가중치 × (최신성 + 인기도 + 여러 곳에 실린 정도 + 기본점)
+  - 최신성: 발행 후 half_life_hours마다 절반 (시간이 없으면 중간값)
+  - 인기도: HN 점수, 레포 오늘 스타 수(star velocity), 트윗 좋아요/RT (로그 스케일)
+  - 중복: 기사는 함께 보도한 소스 수, 레포는 여러 언어/기간 목록에 오른 횟수
+- 선택: 힙으로 상위 k개만 꺼냄 (전체 정렬 없이 O(n + k log n)), 섹션당 최대 개수 제한
+
+예시:
+    ranker = Ranker()
+    picks = ranker.top_k(articles, 8, per_source=3)
+    sections = ranker.sections({"🌐 TechCrunch": [...], "🇰🇷 GeekNews": [...]}, k=8, per_section=3)
+"""
+
+import heapq
+import math
+import operator
+import re
+from datetime import datetime, timezone
+
+from renderers import Section
+from utils.timestamps import parse_timestamp
+
+# 소스별 가중치 (없으면 1.0) - 한국어 소스와 개발자 커뮤니티를 조금 우선
+SOURCE_WEIGHTS = {
+    "GeekNews": 1.3,
+    "Hacker News": 1.1,
+    "MIT Tech Review": 1.05,
+    "CNET": 0.85,
+    "Engadget": 0.9,
+}
+
+# 카테고리 선호 (RSS_FEEDS의 category, 없으면 1.0)
+CATEGORY_WEIGHTS = {
+    "dev": 1.1,
+    "research": 1.05,
+    "general": 1.0,
+}
+
+# 점수 구성 비율
+WEIGHTS = {
+    'recency': 1.0,
+    'popularity': 1.0,
+    'duplicates': 0.6,
+    'base': 0.2,
+}
+
+# 인기도가 1이 되는 값 (로그 스케일, 넘으면 1로 자름)
+POPULARITY_SCALE = {
+    'points': 1000,     # HN 점수
+    'velocity': 3000,   # 오늘 받은 스타
+    'engagement': 5000,  # 좋아요 + RT×2
+}
+# 인기도 정보가 없는 소스(HN 말고 대부분의 피드)의 인기도 - 정보 없다고 꼴찌가 되지 않게
+NEUTRAL_POPULARITY = 0.5
+MAX_DUPLICATES = 3
+DUPLICATE_SCORES = [count / MAX_DUPLICATES for count in range(MAX_DUPLICATES + 1)]
+
+POINTS_RE = re.compile(r'\bPoints:\s*(\d+)')
+NUMBER_RE = re.compile(r'\d[\d,]*')
+
+
+def hn_points(article):
+    """hnrss 설명의 'Points: N' (없으면 None)"""
+    match = POINTS_RE.search(article.description) if 'Points' in article.description else None
+    return int(match.group(1)) if match else None
+
+
+def star_velocity(repo) -> int:
+    """'1,234 stars today' → 1234"""
+    match = NUMBER_RE.search(repo.today_stars)
+    return int(match.group().replace(',', '')) if match else 0
+
+
+def _log_scale(value: int, scale: int) -> float:
+    return min(1.0, math.log1p(value) / math.log1p(scale)) if value > 0 else 0.0
+
+
+class Ranker:
+    def __init__(self, now: datetime = None, half_life_hours: float = 24.0,
+                 source_weights: dict = None, category_weights: dict = None, weights: dict = None):
+        """
+        Args:
+            now: 최신성 기준 시각 (기본: 지금)
+            half_life_hours: 최신성 점수가 절반이 되는 시간
+            source_weights: 소스 가중치 (기본: SOURCE_WEIGHTS)
+            category_weights: 카테고리 선호 (기본: CATEGORY_WEIGHTS)
+            weights: 점수 구성 비율 (기본: WEIGHTS, 일부만 바꿔도 됨)
+        """
+        self.now = (now or datetime.now(timezone.utc)).timestamp()
+        self.decay = math.log(2) / (half_life_hours * 3600)
+        self.source_weights = SOURCE_WEIGHTS if source_weights is None else source_weights
+        self.category_weights = CATEGORY_WEIGHTS if category_weights is None else category_weights
+        self.weights = {**WEIGHTS, **(weights or {})}
+
+    def score(self, item) -> float:
+        """
+        항목 점수 (클수록 우선)
+
+        항목 수천 개를 매번 다시 매기므로 구성 요소를 메서드로 나누지 않고 한 번에 계산한다.
+        """
+        weights = self.weights
+        kind = item.KIND
+
+        published = parse_timestamp(item.timestamp)
+        recency = 0.5 if published is None else math.exp(-self.decay * max(0.0, self.now - published))
+
+        popularity = NEUTRAL_POPULARITY
+        duplicates = 0
+        if kind == 'article':
+            points = hn_points(item)
+            if points is not None:
+                popularity = _log_scale(points, POPULARITY_SCALE['points'])
+            duplicates = len(item.sources) - 1
+        elif kind == 'repo':
+            popularity = _log_scale(star_velocity(item), POPULARITY_SCALE['velocity'])
+            duplicates = len(item.appearances) - 1
+        elif kind == 'post':
+            popularity = _log_scale(item.likes + item.retweets * 2, POPULARITY_SCALE['engagement'])
+
+        multiplier = self.source_weights.get(item.source, 1.0)
+        if kind == 'article':
+            multiplier *= self.category_weights.get(item.category, 1.0)
+        return multiplier * (
+            weights['recency'] * recency
+            + weights['popularity'] * popularity
+            + weights['duplicates'] * DUPLICATE_SCORES[min(max(duplicates, 0), MAX_DUPLICATES)]
+            + weights['base']
+        )
+
+    def top_k(self, items: list, k: int, per_source: int = None) -> list:
+        """
+        점수 상위 k개 (점수 높은 순, 같으면 원래 순서)
+
+        Args:
+            per_source: 소스 하나에서 최대 몇 개까지 (None이면 제한 없음)
+        """
+        score = self.score
+        groups = [item.source for item in items] if per_source is not None else None
+        return [items[index] for index in select_top([score(item) for item in items], k, groups, per_source)]
+
+    def sections(self, groups: dict, k: int, per_section: int = None) -> list:
+        """
+        {섹션 제목: 항목 목록} 전체에서 상위 k개를 골라 renderers.Section 목록으로
+
+        섹션 안에서는 고른 항목이 점수 순으로 앞에 오고 (preview = 고른 개수)
+        나머지는 원래 순서로 뒤에 붙는다 (파일 출력용). 섹션 순서는 가장 높은 점수 순,
+        하나도 뽑히지 않은 섹션은 원래 순서대로 뒤에.
+        """
+        score = self.score
+        titles, items = [], []
+        for title, group in groups.items():
+            titles.extend([title] * len(group))
+            items.extend(group)
+
+        picks = {}
+        for index in select_top([score(item) for item in items], k, titles, per_section):
+            picks.setdefault(titles[index], []).append(items[index])
+
+        sections = []
+        for title in [*picks, *(title for title in groups if title not in picks)]:
+            chosen = picks.get(title, [])
+            chosen_ids = {id(item) for item in chosen}
+            rest = [item for item in groups[title] if id(item) not in chosen_ids]
+            if chosen or rest:
+                sections.append(Section(title, chosen + rest, preview=len(chosen)))
+        return sections
+
+
+def select_top(scores: list, k: int, groups: list = None, per_group: int = None) -> list:
+    """
+    점수 상위 k개의 위치 (점수 순, 같으면 앞 위치 먼저)
+
+    그룹 제한이 없으면 heapq.nlargest (O(n log k)). 있으면 (-점수, 위치) 힙을 만들고
+    제한을 넘는 항목은 건너뛰며 k개가 찰 때까지만 꺼낸다 (O(n + k' log n)).
+
+    Args:
+        scores: 항목별 점수
+        groups: 항목별 그룹 키 (per_group이 있을 때만 사용)
+        per_group: 그룹 하나에서 최대 몇 개까지
+    """
+    if k <= 0 or not scores:
+        return []
+    if per_group is None:
+        return heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+
+    heap = list(zip(map(operator.neg, scores), range(len(scores))))
+    heapq.heapify(heap)
+    picks, taken = [], {}
+    while heap and len(picks) < k:
+        index = heapq.heappop(heap)[1]
+        group = groups[index]
+        count = taken.get(group, 0)
+        if count < per_group:
+            taken[group] = count + 1
+            picks.append(index)
+    return picks
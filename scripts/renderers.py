@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Renderers
+수집 결과(models.Item)를 여러 형식으로 출력
+- markdown: Obsidian용 마크다운 (output/*.md)
+- telegram: 텔레그램 MarkdownV2 (특수문자 이스케이프, 섹션별 미리보기 개수 제한)
+- html: 단독으로 열리는 HTML 문서
+- json: {'title', 'collected_at', 'sections': [{'title', 'items': [...]}]}
+
+렌더러는 받은 스트림(StringIO 또는 파일)에 바로 쓴다. 문자열을 += 로 이어 붙이지 않으므로
+항목이 많아도 출력 크기에 비례하는 비용만 든다. 형식마다 항목 목록을 따로 돈다
+(항목은 이미 메모리에 있어서 여러 형식을 한 순회에 섞어도 빨라지지 않음).
+
+    sections = [Section("📰 TechCrunch", articles, preview=2), ...]
+    text = render_text(sections, 'telegram', title="Tech News Digest")
+    paths = render_files(sections, 'digest', title="Daily Tech Digest")  # output/digest.md, .html, .json
+
+새 형식은 Renderer를 상속해 render_repo / render_article / render_post를 구현하고
+FORMATS에 등록하면 된다.
+"""
+
+import html
+import io
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+from utils.text import truncate
+
+OUTPUT_DIR = Path(__file__).parent / 'output'
+FILE_FORMATS = ('markdown', 'html', 'json')
+TELEGRAM_PARSE_MODE = 'MarkdownV2'
+
+# MarkdownV2에서 엔티티 밖에 그대로 쓰면 안 되는 문자
+# (https://core.telegram.org/bots/api#markdownv2-style)
+_MARKDOWN_V2_ESCAPES = str.maketrans({ch: '\\' + ch for ch in '\\_*[]()~`>#+-=|{}.!'})
+_MARKDOWN_V2_URL_ESCAPES = str.maketrans({')': '\\)', '\\': '\\\\'})
+_json_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def escape_markdown_v2(text) -> str:
+    return str(text).translate(_MARKDOWN_V2_ESCAPES)
+
+
+def escape_markdown_v2_url(url: str) -> str:
+    """[text](url)의 url 부분 (')'와 '\\'만 이스케이프)"""
+    return url.translate(_MARKDOWN_V2_URL_ESCAPES)
+
+
+def shorten(text: str, width: int) -> str:
+    """width자보다 길면 단어/글자 경계에서 잘라서 '…' 붙임"""
+    return truncate(text, width, suffix="…")
+
+
+class Section(NamedTuple):
+    title: str                  # 섹션 제목 (None이면 제목 없이 항목만)
+    items: list                 # models.Item 목록
+    preview: int = None         # 요약 형식(텔레그램)에서 보여줄 최대 항목 수 (None이면 전부)
+
+
+class Renderer:
+    """형식 하나 - begin → (section → item... → end_section)... → end 순서로 호출됨"""
+    extension = ''
+
+    def __init__(self, out, title: str = '', collected_at: datetime = None):
+        self.write = out.write
+        self.title = title
+        self.collected_at = collected_at or datetime.now()
+        self.section_title = None
+
+    def begin(self):
+        pass
+
+    def section(self, section: Section):
+        self.section_title = section.title
+
+    def item(self, index: int, item):
+        getattr(self, f"render_{item.KIND}")(index, item)
+
+    def end_section(self):
+        pass
+
+    def end(self):
+        pass
+
+
+class MarkdownRenderer(Renderer):
+    extension = '.md'
+
+    def begin(self):
+        self.write(f"# {self.title}\n\n"
+                   f"> 수집 시간: {self.collected_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                   "---\n\n")
+
+    def section(self, section: Section):
+        super().section(section)
+        if section.title:
+            self.write(f"## {section.title}\n\n")
+
+    def heading(self) -> str:
+        # 섹션 제목이 있으면 항목은 한 단계 아래
+        return '###' if self.section_title else '##'
+
+    def item_end(self):
+        # 제목 없는 섹션은 항목마다 구분선, 제목 있는 섹션은 섹션 끝에 한 번
+        if not self.section_title:
+            self.write("---\n\n")
+
+    def end_section(self):
+        if self.section_title:
+            self.write("---\n\n")
+
+    def render_repo(self, index: int, repo):
+        write = self.write
+        write(f"{self.heading()} {repo.rank}. [{repo.full_name}]({repo.url})\n\n")
+        if repo.summary:
+            write(f"> 📌 **{repo.summary}**\n\n")
+        if repo.description:
+            write(f"{repo.description}\n\n")
+        today = f" ({repo.today_stars})" if repo.today_stars else ""
+        write(f"- ⭐ **{repo.stars:,}** stars{today}\n"
+              f"- 🍴 {repo.forks:,} forks\n"
+              f"- 💻 {repo.language}\n\n")
+        self.item_end()
+
+    def render_article(self, index: int, article):
+        write = self.write
+        write(f"{self.heading()} {index}. [{article.title}]({article.url})\n\n")
+        if article.summary:
+            write(f"> 📌 **{article.summary}**\n\n")
+        if article.description:
+            write(f"{article.description[:200]}...\n\n")
+        if article.timestamp:
+            write(f"🕐 {article.timestamp}\n\n")
+        if len(article.sources) > 1:
+            write(f"🔗 함께 보도: {', '.join(article.sources[1:])}\n\n")
+        self.item_end()
+
+    def render_post(self, index: int, post):
+        self.write(f"{self.heading()} {index}. @{post.author}\n\n"
+                   f"{post.text}\n\n"
+                   f"- Likes: {post.likes:,} | RT: {post.retweets:,}\n"
+                   f"- [원문 보기]({post.url or '#'})\n\n")
+        self.item_end()
+
+
+class TelegramRenderer(Renderer):
+    """텔레그램 MarkdownV2 - 섹션별 preview개, 전체 max_items개까지만"""
+    extension = '.tg.txt'
+
+    def __init__(self, out, title: str = '', collected_at: datetime = None,
+                 max_items: int = None, subtitle: str = None, footer: str = None):
+        """
+        Args:
+            max_items: 전체 항목 수 제한 (넘으면 나머지 섹션은 건너뜀)
+            subtitle: 제목 아래 한 줄 (예: 날짜)
+            footer: 마지막 줄 (기울임)
+        """
+        super().__init__(out, title, collected_at)
+        self.max_items = max_items
+        self.subtitle = subtitle
+        self.footer = footer
+        self.count = 0
+        self.section_limit = None
+        self.section_count = 0
+
+    def full(self) -> bool:
+        return self.max_items is not None and self.count >= self.max_items
+
+    def begin(self):
+        if self.title:
+            self.write(f"*{escape_markdown_v2(self.title)}*\n")
+            if self.subtitle:
+                self.write(f"{escape_markdown_v2(self.subtitle)}\n")
+            self.write("\n")
+
+    def section(self, section: Section):
+        super().section(section)
+        self.section_limit = section.preview
+        self.section_count = 0
+
+    def item(self, index: int, item):
+        if self.full() or (self.section_limit is not None and self.section_count >= self.section_limit):
+            return
+        if self.section_count == 0 and self.section_title:
+            self.write(f"*{escape_markdown_v2(self.section_title)}*\n")
+        self.section_count += 1
+        self.count += 1
+        super().item(index, item)
+
+    def end_section(self):
+        if self.section_count:
+            self.write("\n")
+
+    def end(self):
+        if self.footer:
+            self.write(f"\\-\\-\\-\n_{escape_markdown_v2(self.footer)}_")
+
+    @staticmethod
+    def link(text: str, url: str) -> str:
+        if not url:
+            return escape_markdown_v2(text)
+        return f"[{escape_markdown_v2(text)}]({escape_markdown_v2_url(url)})"
+
+    def render_repo(self, index: int, repo):
+        self.write(f"• {self.link(repo.full_name, repo.url)}\n")
+        if repo.summary:
+            self.write(f"  └ {escape_markdown_v2(repo.summary)}\n")
+        self.write(f"  ⭐ {escape_markdown_v2(f'{repo.stars:,} | {repo.today_stars}')}\n\n")
+
+    def render_article(self, index: int, article):
+        self.write(f"• {self.link(shorten(article.title, 40), article.url)}\n")
+        if article.summary:
+            self.write(f"  └ {escape_markdown_v2(article.summary)}\n")
+
+    def render_post(self, index: int, post):
+        self.write(f"• *@{escape_markdown_v2(post.author)}* {self.link(shorten(post.text, 100), post.url)}\n"
+                   f"  {escape_markdown_v2(f'❤️ {post.likes:,} | 🔁 {post.retweets:,}')}\n")
+
+
+class HTMLRenderer(Renderer):
+    extension = '.html'
+
+    def begin(self):
+        title = html.escape(self.title)
+        self.write('<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="utf-8">\n'
+                   f'<title>{title}</title>\n</head>\n<body>\n'
+                   f'<h1>{title}</h1>\n'
+                   f'<p class="collected">수집 시간: {self.collected_at.strftime("%Y-%m-%d %H:%M:%S")}</p>\n')
+
+    def section(self, section: Section):
+        super().section(section)
+        self.write('<section>\n')
+        if section.title:
+            self.write(f'<h2>{html.escape(section.title)}</h2>\n')
+        self.write('<ol>\n')
+
+    def end_section(self):
+        self.write('</ol>\n</section>\n')
+
+    def end(self):
+        self.write('</body>\n</html>\n')
+
+    @staticmethod
+    def link(text: str, url: str) -> str:
+        if not url:
+            return html.escape(text)
+        return f'<a href="{html.escape(url)}">{html.escape(text)}</a>'
+
+    def summary(self, item):
+        if item.summary:
+            self.write(f'<p class="summary">📌 <strong>{html.escape(item.summary)}</strong></p>\n')
+
+    def render_repo(self, index: int, repo):
+        self.write(f'<li class="repo" value="{repo.rank}">{self.link(repo.full_name, repo.url)}\n')
+        self.summary(repo)
+        if repo.description:
+            self.write(f'<p>{html.escape(repo.description)}</p>\n')
+        today = f" ({html.escape(repo.today_stars)})" if repo.today_stars else ""
+        self.write(f'<p class="meta">⭐ {repo.stars:,}{today} · 🍴 {repo.forks:,} · 💻 {html.escape(repo.language)}</p>\n'
+                   '</li>\n')
+
+    def render_article(self, index: int, article):
+        self.write(f'<li class="article">{self.link(article.title, article.url)}\n')
+        self.summary(article)
+        if article.description:
+            self.write(f'<p>{html.escape(article.description[:200])}...</p>\n')
+        meta = [html.escape(article.timestamp)] if article.timestamp else []
+        if len(article.sources) > 1:
+            meta.append(f"함께 보도: {html.escape(', '.join(article.sources[1:]))}")
+        if meta:
+            self.write(f'<p class="meta">{" · ".join(meta)}</p>\n')
+        self.write('</li>\n')
+
+    def render_post(self, index: int, post):
+        self.write(f'<li class="post"><strong>@{html.escape(post.author)}</strong>\n'
+                   f'<p>{html.escape(post.text)}</p>\n'
+                   f'<p class="meta">❤️ {post.likes:,} · 🔁 {post.retweets:,} · {self.link("원문 보기", post.url)}</p>\n'
+                   '</li>\n')
+
+
+class JSONRenderer(Renderer):
+    """항목을 받는 대로 JSON 배열에 이어 씀 (전체를 메모리에 모으지 않음)"""
+    extension = '.json'
+
+    def __init__(self, out, title: str = '', collected_at: datetime = None):
+        super().__init__(out, title, collected_at)
+        self.first_section = True
+        self.first_item = True
+
+    def begin(self):
+        self.write('{"title": %s, "collected_at": %s, "sections": [' % (
+            _json_encode(self.title), _json_encode(self.collected_at.isoformat())))
+
+    def section(self, section: Section):
+        super().section(section)
+        self.write('%s\n{"title": %s, "items": [' % (
+            '' if self.first_section else ',', _json_encode(section.title)))
+        self.first_section = False
+        self.first_item = True
+
+    def item(self, index: int, item):
+        self.write(('\n' if self.first_item else ',\n') + _json_encode(item.to_dict()))
+        self.first_item = False
+
+    def end_section(self):
+        self.write(']}')
+
+    def end(self):
+        self.write(']}\n')
+
+
+FORMATS = {
+    'markdown': MarkdownRenderer,
+    'telegram': TelegramRenderer,
+    'html': HTMLRenderer,
+    'json': JSONRenderer,
+}
+
+
+def render(sections: list, outputs: dict, title: str = '', collected_at: datetime = None,
+           options: dict = None):
+    """
+    여러 형식 출력 (형식마다 차례로)
+
+    Args:
+        sections: Section 목록
+        outputs: {형식 이름: 쓰기 가능한 텍스트 스트림}
+        options: {형식 이름: 렌더러 추가 인자} (예: {'telegram': {'max_items': 8}})
+    """
+    collected_at = collected_at or datetime.now()
+    options = options or {}
+    for fmt, out in outputs.items():
+        renderer = FORMATS[fmt](out, title, collected_at, **options.get(fmt, {}))
+        renderer.begin()
+        for section in sections:
+            renderer.section(section)
+            for index, item in enumerate(section.items, 1):
+                renderer.item(index, item)
+            renderer.end_section()
+        renderer.end()
+
+
+def preview_items(sections: list, max_items: int = None) -> list:
+    """요약 형식(텔레그램)에 실제로 들어가는 항목 - 섹션별 preview개, 전체 max_items개까지 (TelegramRenderer와 같은 규칙)"""
+    shown = []
+    for section in sections:
+        shown.extend(section.items if section.preview is None else section.items[:section.preview])
+    return shown if max_items is None else shown[:max_items]
+
+
+def render_text(sections: list, fmt: str = 'markdown', title: str = '', **options) -> str:
+    """형식 하나를 문자열로"""
+    out = io.StringIO()
+    render(sections, {fmt: out}, title, options={fmt: options})
+    return out.getvalue()
+
+
+@contextmanager
+def open_outputs(name: str, formats: tuple = FILE_FORMATS, output_dir: Path = None):
+    """
+    output_dir/name.<확장자> 파일들을 열어 {형식: 파일} 반환
+
+    임시 파일에 쓰고 블록이 정상적으로 끝났을 때만 교체하므로 중간에 실패해도
+    이전 결과 파일이 그대로 남는다.
+
+    Yields:
+        ({형식: 파일 객체}, {형식: 최종 경로})
+    """
+    output_dir = Path(output_dir) if output_dir else OUTPUT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = {fmt: output_dir / f"{name}{FORMATS[fmt].extension}" for fmt in formats}
+    files = {fmt: open(path.with_suffix(path.suffix + '.tmp'), 'w', encoding='utf-8') for fmt, path in paths.items()}
+
+    try:
+        yield files, paths
+    except BaseException:
+        for out in files.values():
+            out.close()
+            os.unlink(out.name)
+        raise
+
+    for fmt, out in files.items():
+        out.close()
+        os.replace(out.name, paths[fmt])
+
+
+def render_files(sections: list, name: str, formats: tuple = FILE_FORMATS, title: str = '',
+                 output_dir: Path = None, options: dict = None) -> dict:
+    """
+    여러 형식을 output_dir/name.<확장자> 파일로 바로 출력
+
+    Returns:
+        {형식: 경로}
+    """
+    with open_outputs(name, formats, output_dir) as (files, paths):
+        render(sections, files, title, options=options)
+    return paths
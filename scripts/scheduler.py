@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Adaptive Scheduler
+데몬 모드용 피드별 폴링 스케줄러
+- 피드마다 항목 발행 간격(타임스탬프)과 실제 변경 여부(304/ETag, 최신 항목)로 갱신 주기를 추정
+- 추정한 주기로 폴링 간격을 조절 (설정한 최소~최대 범위 안에서, 급변하지 않게 평활)
+- 우선순위 큐(다음 실행 시각 순)로 돌면서 가장 먼저 돌아온 피드부터 실행
+- 오류가 난 피드는 지수적으로 간격을 늘림 (성공하면 원래대로)
+- 학습한 간격은 파일로 저장해 재시작해도 유지
+"""
+
+import heapq
+import json
+import os
+import random
+import statistics
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_STATE_PATH = Path(__file__).parent / '.cache' / 'schedule.json'
+
+
+def estimate_interval(timestamps: list, window: int = 10) -> Optional[float]:
+    """
+    최근 항목 발행 간격의 중앙값 (초)
+
+    몰아서 올라온 항목이나 오래된 항목 하나에 휘둘리지 않도록 평균 대신 중앙값 사용.
+    간격을 계산할 항목이 3개 미만이면 None.
+    """
+    stamps = sorted({ts for ts in timestamps if ts}, reverse=True)[:window + 1]
+    if len(stamps) < 3:
+        return None
+    return statistics.median(newer - older for newer, older in zip(stamps, stamps[1:]))
+
+
+class AdaptiveScheduler:
+    def __init__(self, min_interval: float = 300, max_interval: float = 6 * 3600,
+                 default_interval: float = 1800, max_backoff: float = 24 * 3600,
+                 smoothing: float = 0.5, jitter: float = 0.1, state_path: Path = None):
+        """
+        Args:
+            min_interval: 폴링 간격 하한 (초)
+            max_interval: 폴링 간격 상한 (초)
+            default_interval: 처음 보는 피드의 폴링 간격 (초)
+            max_backoff: 오류가 계속될 때 최대 대기 (초)
+            smoothing: 새 추정치 반영 비율 (0~1, 클수록 빨리 따라감)
+            jitter: 실행 시각을 흔드는 비율 (여러 피드가 한꺼번에 몰리지 않게)
+            state_path: 학습한 간격 저장 위치
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = default_interval
+        self.max_backoff = max_backoff
+        self.smoothing = smoothing
+        self.jitter = jitter
+        self.state_path = Path(state_path) if state_path else DEFAULT_STATE_PATH
+
+        self.jobs = {}
+        self.bounds = {}
+        self.state = self.load_state()
+        self._queue = []
+        self._stop = threading.Event()
+        self.polls = 0
+        self.errors = 0
+
+    def load_state(self) -> dict:
+        try:
+            return json.loads(self.state_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix('.tmp')
+        try:
+            tmp_path.write_text(json.dumps(self.state, ensure_ascii=False, indent=2), encoding='utf-8')
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            print(f"  ⚠️ 스케줄 상태 저장 실패: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def add_job(self, name: str, job, min_interval: float = None, max_interval: float = None):
+        """
+        폴링 작업 등록
+
+        Args:
+            job: 인자 없이 호출하면 {'timestamps': [epoch 초...], 'changed': bool}을 반환하는 함수
+                 (예외가 나면 오류로 보고 백오프)
+            min_interval, max_interval: 이 피드만의 간격 범위 (없으면 전체 설정)
+        """
+        self.jobs[name] = job
+        self.bounds[name] = (min_interval or self.min_interval, max_interval or self.max_interval)
+        self.state.setdefault(name, {
+            'interval': self.clamp(name, self.default_interval),
+            'newest': None,
+            'failures': 0,
+            'polls': 0,
+            'changes': 0,
+            'next_run': None,
+        })
+
+    def clamp(self, name: str, interval: float) -> float:
+        low, high = self.bounds.get(name, (self.min_interval, self.max_interval))
+        return min(high, max(low, interval))
+
+    def record_success(self, name: str, timestamps: list, changed: bool) -> float:
+        """
+        폴링 결과로 간격 조절
+
+        Args:
+            timestamps: 피드 항목 발행 시각들 (epoch 초)
+            changed: 피드 본문이 바뀌었는지 (304면 False)
+
+        Returns:
+            다음 폴링까지 간격 (초)
+        """
+        state = self.state[name]
+        timestamps = [ts for ts in timestamps if ts]
+        newest = max(timestamps) if timestamps else None
+
+        # 본문이 바뀌었어도(ETag 없는 피드 등) 최신 항목이 그대로면 새 글은 없는 것
+        if changed and newest and state['newest']:
+            changed = newest > state['newest']
+        if newest:
+            state['newest'] = max(newest, state['newest'] or 0)
+
+        interval = state['interval']
+        estimate = estimate_interval(timestamps)
+        if changed:
+            # 새 글 있음 → 발행 간격 추정치로 (추정 불가면 절반으로)
+            target = estimate or interval / 2
+        else:
+            # 새 글 없음 → 늘림 (발행 간격보다 짧아지지는 않게)
+            target = max(interval * 2, estimate or 0)
+
+        state['interval'] = self.clamp(name, interval + self.smoothing * (target - interval))
+        state['failures'] = 0
+        state['polls'] += 1
+        state['changes'] += int(changed)
+        return state['interval']
+
+    def record_failure(self, name: str, error: Exception) -> float:
+        """
+        오류 기록 → 지수 백오프
+
+        Returns:
+            다음 시도까지 대기 (초) - 평소 간격 x 2^연속 실패 수 (max_backoff 상한)
+        """
+        state = self.state[name]
+        state['failures'] += 1
+        state['last_error'] = str(error)[:200]
+        self.errors += 1
+        return min(self.max_backoff, state['interval'] * 2 ** state['failures'])
+
+    def schedule(self, name: str, delay: float):
+        delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        heapq.heappush(self._queue, (time.monotonic() + delay, name))
+        self.state[name]['next_run'] = time.time() + delay
+
+    def run_job(self, name: str) -> float:
+        """작업 하나 실행 + 결과 반영, 다음 실행까지 간격 반환"""
+        try:
+            result = self.jobs[name]()
+        except Exception as e:
+            delay = self.record_failure(name, e)
+            print(f"  ❌ {name} 오류 ({self.state[name]['failures']}회 연속): {e} → {delay / 60:.0f}분 뒤 재시도")
+            return delay
+
+        delay = self.record_success(name, result.get('timestamps') or [], result.get('changed', True))
+        print(f"  ⏱️ {name}: 다음 폴링 {delay / 60:.0f}분 뒤")
+        return delay
+
+    def run(self, max_polls: int = None):
+        """
+        실행 루프 (stop() 또는 max_polls회 폴링까지)
+
+        저장된 다음 실행 시각이 있으면 그 시각에, 없으면 바로 첫 폴링.
+        """
+        self._queue = []
+        now = time.time()
+        for name in self.jobs:
+            next_run = self.state[name].get('next_run')
+            delay = max(0.0, next_run - now) if next_run else 0.0
+            heapq.heappush(self._queue, (time.monotonic() + delay, name))
+
+        while self._queue and not self._stop.is_set():
+            due, name = self._queue[0]
+            wait = due - time.monotonic()
+            if wait > 0:
+                self._stop.wait(wait)
+                continue
+
+            heapq.heappop(self._queue)
+            self.schedule(name, self.run_job(name))
+            self.save_state()
+
+            self.polls += 1
+            if max_polls and self.polls >= max_polls:
+                break
+
+    def stop(self):
+        self._stop.set()
+
+    def report(self) -> str:
+        """피드별 학습 결과"""
+        lines = ["📅 폴링 스케줄:"]
+        for name in self.jobs:
+            state = self.state[name]
+            line = f"  {name:<20} {state['interval'] / 60:6.0f}분  (변경 {state['changes']}/{state['polls']}회)"
+            if state['failures']:
+                line += f"  ❌ 연속 오류 {state['failures']}회"
+            lines.append(line)
+        return "\n".join(lines)
@@ -2,60 +2,320 @@
 """
 Telegram Sender
 수집된 정보를 텔레그램으로 발송
+- 4096자를 넘는 메시지는 항목(빈 줄) 경계에서 나눠 여러 개로 발송 (Markdown/MarkdownV2 엔티티가 깨지지 않게)
+- 세션 재사용 (커넥션 풀)
+- 채팅별 / 전체 발송 속도 제한을 지키면서 여러 채팅에 동시에 발송
+- 429 응답은 retry_after만큼 기다린 뒤 재시도
 """
 
 import os
+import re
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+from utils.metrics import metrics
+from utils.rate_limit import TokenBucket
+
 # .env 로드
 load_dotenv(Path(__file__).parent.parent / '.env')
 
+# 텔레그램 제한 (https://core.telegram.org/bots/faq#my-bot-is-hitting-limits-how-do-i-avoid-this)
+MESSAGE_LIMIT = 4096            # 메시지 길이 (UTF-16 코드 단위)
+GLOBAL_PER_SECOND = 30          # 봇 전체 초당 메시지
+PRIVATE_PER_MINUTE = 60         # 개인 채팅 하나에 초당 1개
+GROUP_PER_MINUTE = 20           # 그룹 채팅 하나에 분당 20개
+
+# parse_mode별 서식 기호와 \ 이스케이프 대상 문자
+ENTITY_MARKERS = {
+    'Markdown': ('*', '_'),
+    'MarkdownV2': ('||', '__', '*', '_', '~'),  # 두 글자 기호를 먼저 확인
+}
+ESCAPE_PATTERNS = {
+    'Markdown': re.compile(r'\\([_*`\[])'),
+    'MarkdownV2': re.compile(r'\\([\\_*\[\]()~`>#+\-=|{}.!])'),
+}
+
+
+def telegram_length(text: str) -> int:
+    """텔레그램 기준 길이 (UTF-16 코드 단위, 이모지는 2)"""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def safe_cuts(text: str, parse_mode: str = "Markdown") -> list:
+    """
+    서식 엔티티 밖에 있는 공백 위치들
+
+    굵게/기울임 등 서식 기호(parse_mode별 ENTITY_MARKERS), `코드`, ```블록```, [링크](url)
+    안에서 자르면 짝이 맞지 않아 텔레그램이 메시지를 거부하므로 엔티티 밖의 공백에서만 자른다.
+    MarkdownV2는 엔티티끼리 겹칠 수 있어(*굵게 _기울임_*) 열린 기호를 모두 추적하고,
+    \ 뒤의 문자(링크 URL 안의 \) 포함)는 기호로 보지 않는다.
+    """
+    markers = ENTITY_MARKERS.get(parse_mode, ENTITY_MARKERS['Markdown'])
+    cuts = []
+    code = None     # 열린 코드 표시 (` / ```)
+    link = None     # 링크 텍스트 '[' / URL '('
+    opened = set()  # 열린 서식 기호
+    i = 0
+
+    while i < len(text):
+        ch = text[i]
+
+        if code:
+            if text.startswith(code, i):
+                i += len(code)
+                code = None
+                continue
+            if ch == '\\' and parse_mode == 'MarkdownV2':
+                i += 2
+                continue
+        elif ch == '\\':
+            i += 2
+            continue
+        elif link == '(':
+            if ch == ')':
+                link = None
+        elif text.startswith('```', i):
+            code = '```'
+            i += 3
+            continue
+        elif ch == '`':
+            code = '`'
+        elif ch == '[' and link is None:
+            link = '['
+        elif ch == ']' and link == '[':
+            link = '(' if text.startswith('(', i + 1) else None
+        elif ch.isspace():
+            if link is None and not opened:
+                cuts.append(i)
+        else:
+            marker = next((marker for marker in markers if text.startswith(marker, i)), None)
+            # Markdown(legacy)는 엔티티가 겹치지 않으므로 열린 기호 안의 다른 기호는 글자
+            if marker and (parse_mode == 'MarkdownV2' or not opened or marker in opened):
+                opened ^= {marker}
+                i += len(marker)
+                continue
+
+        i += 1
+
+    return cuts
+
+
+def ends_with_escape(text: str) -> bool:
+    """끝이 짝 없는 \ 인지 (여기서 자르면 이스케이프가 다음 조각 첫 글자와 떨어짐)"""
+    return (len(text) - len(text.rstrip('\\'))) % 2 == 1
+
+
+def split_line(text: str, limit: int, parse_mode: str = "Markdown") -> list:
+    """
+    한 줄이 limit보다 길 때 엔티티 밖 공백에서 자르기
+
+    자를 곳이 없으면 limit에서 자르되, 짝 없는 \ 바로 뒤에서는 자르지 않는다.
+    """
+    parts = []
+
+    while telegram_length(text) > limit:
+        cuts = [cut for cut in safe_cuts(text, parse_mode) if 0 < cut and telegram_length(text[:cut]) <= limit]
+        cut = cuts[-1] if cuts else limit
+        while cut > 1 and (telegram_length(text[:cut]) > limit  # 이모지(2단위)가 섞인 경우
+                           or ends_with_escape(text[:cut])):
+            cut -= 1
+        parts.append(text[:cut])
+        text = text[cut:].lstrip()
+
+    parts.append(text)
+    return parts
+
+
+def plain_text(text: str, parse_mode: str) -> str:
+    """서식 오류로 일반 텍스트로 다시 보낼 때 \ 이스케이프 제거"""
+    pattern = ESCAPE_PATTERNS.get(parse_mode)
+    return pattern.sub(r'\1', text) if pattern else text
+
+
+def split_message(text: str, limit: int = MESSAGE_LIMIT, separators: tuple = ('\n\n', '\n'),
+                  parse_mode: str = "Markdown") -> list:
+    """
+    긴 메시지를 limit 이하 조각들로 나눔
+
+    항목 경계(빈 줄) → 줄 → 줄 안의 공백 순서로 자를 곳을 찾고, 나눈 조각은
+    다시 limit을 넘지 않는 만큼 이어 붙여 메시지 수를 최소로 한다.
+    """
+    if telegram_length(text) <= limit:
+        return [text]
+    if not separators:
+        return split_line(text, limit, parse_mode)
+
+    sep, rest = separators[0], separators[1:]
+    chunks = []
+    for piece in text.split(sep):
+        chunks.extend(split_message(piece, limit, rest, parse_mode))
+
+    parts = []
+    current = None
+    for chunk in chunks:
+        if current is None:
+            current = chunk
+        elif telegram_length(current) + len(sep) + telegram_length(chunk) <= limit:
+            current += sep + chunk
+        else:
+            parts.append(current)
+            current = chunk
+    parts.append(current)
+
+    return [part for part in parts if part.strip()]
+
 
 class TelegramSender:
-    def __init__(self):
+    API_URL = "https://api.telegram.org/bot{token}/sendMessage"
+
+    def __init__(self, chat_ids: list = None, max_workers: int = GLOBAL_PER_SECOND,
+                 max_retries: int = 3, timeout: float = 10.0):
+        """
+        Args:
+            chat_ids: 받을 채팅 목록 (없으면 TELEGRAM_CHAT_ID, 쉼표로 여러 개 가능)
+            max_workers: 동시에 발송할 채팅 수
+            max_retries: 429 / 5xx / 네트워크 오류 재시도 횟수
+            timeout: 요청 하나당 제한 시간 (초)
+        """
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
-        self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
+        if chat_ids is None:
+            chat_ids = [chat.strip() for chat in os.getenv('TELEGRAM_CHAT_ID', '').split(',') if chat.strip()]
+        self.chat_ids = list(chat_ids)
+        self.chat_id = self.chat_ids[0] if self.chat_ids else None
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+        self.timeout = timeout
 
-        if not self.bot_token or not self.chat_id:
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+
+        self.global_bucket = TokenBucket(GLOBAL_PER_SECOND * 60, burst=GLOBAL_PER_SECOND)
+        self.chat_buckets = {}
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.retries = 0
+
+        if not self.bot_token or not self.chat_ids:
             print("⚠️ TELEGRAM_BOT_TOKEN 또는 TELEGRAM_CHAT_ID가 설정되지 않았습니다.")
             self.enabled = False
         else:
             self.enabled = True
             print("✅ Telegram 발송 준비 완료")
 
-    def send_message(self, text: str, parse_mode: str = "Markdown") -> bool:
-        """텔레그램 메시지 발송"""
-        if not self.enabled:
-            print("❌ Telegram이 설정되지 않았습니다.")
-            return False
-
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+        # 채팅별 버킷은 발송 스레드들이 함께 쓰므로 미리 만들어 둠
+        for chat_id in self.chat_ids:
+            self.chat_bucket(chat_id)
 
-        # 메시지 길이 제한 (4096자)
-        if len(text) > 4096:
-            text = text[:4000] + "\n\n... (더보기: 전체 내용은 GitHub에서 확인)"
+    def chat_bucket(self, chat_id) -> TokenBucket:
+        """채팅별 속도 제한 (그룹/채널 id는 음수)"""
+        chat_id = str(chat_id)
+        if chat_id not in self.chat_buckets:
+            rate = GROUP_PER_MINUTE if chat_id.startswith('-') else PRIVATE_PER_MINUTE
+            self.chat_buckets[chat_id] = TokenBucket(rate, burst=1)
+        return self.chat_buckets[chat_id]
 
+    def post(self, chat_id, text: str, parse_mode: str = "Markdown") -> bool:
+        """메시지 하나 발송 (속도 제한 + 재시도)"""
+        url = self.API_URL.format(token=self.bot_token)
         payload = {
-            "chat_id": self.chat_id,
+            "chat_id": chat_id,
             "text": text,
-            "parse_mode": parse_mode,
             "disable_web_page_preview": True
         }
+        if parse_mode:
+            payload["parse_mode"] = parse_mode
 
-        try:
-            response = requests.post(url, json=payload, timeout=10)
-            if response.status_code == 200:
-                print("✅ 텔레그램 발송 성공!")
-                return True
+        reason = None
+        for attempt in range(self.max_retries + 1):
+            self.chat_bucket(chat_id).wait()
+            self.global_bucket.wait()
+
+            try:
+                with metrics.span('send', source=str(chat_id)):
+                    response = self.session.post(url, json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                reason, delay = e, min(30, 2 ** attempt)
             else:
-                print(f"❌ 발송 실패: {response.text}")
-                return False
-        except Exception as e:
-            print(f"❌ 발송 오류: {e}")
+                if response.status_code == 200:
+                    with self._lock:
+                        self.sent += 1
+                    metrics.incr('telegram_messages', source=str(chat_id))
+                    return True
+
+                try:
+                    data = response.json()
+                except ValueError:
+                    data = {}
+                description = data.get('description', response.text[:200])
+
+                if response.status_code == 429:
+                    reason = description
+                    delay = (data.get('parameters') or {}).get('retry_after', 2 ** attempt)
+                elif response.status_code >= 500:
+                    reason, delay = description, min(30, 2 ** attempt)
+                elif response.status_code == 400 and "parse entities" in description and "parse_mode" in payload:
+                    # 서식이 깨진 메시지는 일반 텍스트로라도 보냄
+                    print(f"  ⚠️ {parse_mode} 오류, 일반 텍스트로 재발송: {description}")
+                    payload.pop("parse_mode")
+                    payload["text"] = plain_text(text, parse_mode)
+                    continue
+                else:
+                    print(f"❌ 발송 실패: {description}")
+                    metrics.incr('failures', stage='send', source=str(chat_id))
+                    return False
+
+            if attempt >= self.max_retries:
+                break
+            with self._lock:
+                self.retries += 1
+            metrics.incr('telegram_retries', source=str(chat_id))
+            print(f"  ⏳ 텔레그램 재시도 {attempt + 1}/{self.max_retries} ({delay}초 후): {reason}")
+            time.sleep(delay)
+
+        print(f"❌ 발송 실패 (재시도 초과): {reason}")
+        metrics.incr('failures', stage='send', source=str(chat_id))
+        return False
+
+    def deliver(self, chat_id, parts: list, parse_mode: str) -> int:
+        """채팅 하나에 조각들을 순서대로 발송, 보낸 조각 수 반환 (실패하면 거기서 멈춤)"""
+        for i, part in enumerate(parts):
+            if not self.post(chat_id, part, parse_mode):
+                return i
+        return len(parts)
+
+    def send_message(self, text: str, parse_mode: str = "Markdown", chat_ids: list = None) -> bool:
+        """
+        텔레그램 메시지 발송 (길면 나눠서, 여러 채팅이면 동시에)
+
+        Returns:
+            모든 채팅에 모든 조각을 보냈으면 True
+        """
+        if not self.enabled:
+            print("❌ Telegram이 설정되지 않았습니다.")
+            return False
+
+        chats = chat_ids or self.chat_ids
+        parts = split_message(text, parse_mode=parse_mode)
+        started = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chats))) as pool:
+            delivered = list(pool.map(lambda chat_id: self.deliver(chat_id, parts, parse_mode), chats))
+
+        failed = sum(1 for count in delivered if count < len(parts))
+        elapsed = time.monotonic() - started
+        if failed:
+            print(f"❌ {len(chats)}개 채팅 중 {failed}개 발송 실패")
             return False
 
+        print(f"✅ 텔레그램 발송 성공! ({len(parts)}개 메시지 × {len(chats)}개 채팅, {elapsed:.1f}초)")
+        return True
+
     def send_daily_digest(self, github_trending: str = None, x_digest: str = None) -> bool:
         """일일 다이제스트 발송"""
         from datetime import datetime
@@ -64,12 +324,12 @@ class TelegramSender:
 
         if github_trending:
             message += "📊 *GitHub Trending*\n"
-            message += github_trending[:2000]  # 길이 제한
+            message += github_trending
             message += "\n\n"
 
         if x_digest:
             message += "🐦 *X Highlights*\n"
-            message += x_digest[:1500]
+            message += x_digest
 
         return self.send_message(message)
 
@@ -87,7 +347,7 @@ def main():
         print("2. @userinfobot에서 chat_id 확인")
         print("3. .env 파일에 추가:")
         print("   TELEGRAM_BOT_TOKEN=your_token")
-        print("   TELEGRAM_CHAT_ID=your_chat_id")
+        print("   TELEGRAM_CHAT_ID=your_chat_id  (여러 채팅은 쉼표로 구분)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Star History
+트렌딩 레포의 스타/포크 수를 실행마다 기록하는 시계열 저장소
+- 저장: .cache/stars/
+  - repos.txt: 레포 이름 한 줄에 하나 (줄 번호 = 레포 id, 추가만 함)
+  - observations.bin: 고정 길이 레코드 (day, repo, stars, forks, today) 배열, 파일 끝에 이어 붙임
+    → numpy.memmap으로 그대로 열어서 열(column) 단위로 계산 (기록을 dict로 풀지 않음)
+- 신호 (전부 벡터 연산):
+  - velocity: 직전 기록 대비 하루 평균 스타 증가 (첫 기록은 트렌딩 페이지의 "stars today")
+  - acceleration: velocity의 하루 평균 변화
+  - days on list: 기간 안에 트렌딩에 오른 날 수, new entrant: 기간 안에 처음 오른 레포
+
+CLI:
+    python star_history.py risers --days 7 --limit 20   # 이번 주 가장 빨리 오른 레포
+    python star_history.py repo owner/name              # 레포 하나의 기록
+    python star_history.py stats
+"""
+
+import argparse
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# 모듈 경로 추가 (python star_history.py로 직접 실행할 때)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ranking import star_velocity
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+DEFAULT_STARS_DIR = Path(__file__).parent / '.cache' / 'stars'
+EPOCH = date(1970, 1, 1)
+
+# 레코드 하나 20바이트 (하루 레포 100개씩 1년 ≈ 730KB)
+RECORD_FIELDS = [('day', '<i4'), ('repo', '<u4'), ('stars', '<u4'), ('forks', '<u4'), ('today', '<u4')]
+
+
+def day_number(day: date) -> int:
+    return (day - EPOCH).days
+
+
+def day_from_number(number: int) -> date:
+    return EPOCH + timedelta(days=int(number))
+
+
+class StarHistory:
+    def __init__(self, stars_dir: Path = None):
+        """
+        Args:
+            stars_dir: repos.txt와 observations.bin을 둘 디렉토리
+
+        Raises:
+            RuntimeError: numpy 미설치
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy 미설치: pip install numpy")
+
+        self.stars_dir = Path(stars_dir) if stars_dir else DEFAULT_STARS_DIR
+        self.stars_dir.mkdir(parents=True, exist_ok=True)
+        self.names_path = self.stars_dir / 'repos.txt'
+        self.observations_path = self.stars_dir / 'observations.bin'
+        self.dtype = np.dtype(RECORD_FIELDS)
+        self._lock = threading.Lock()
+
+        self.names = self.names_path.read_text(encoding='utf-8').splitlines() if self.names_path.exists() else []
+        self.ids = {name: index for index, name in enumerate(self.names)}
+
+    # ---- 기록 ----
+
+    def record(self, repos: list, collected_at: datetime = None) -> int:
+        """
+        레포 목록의 현재 스타/포크 수를 이어 붙임 (같은 날 여러 번 기록하면 마지막 값을 사용)
+
+        Returns:
+            기록한 레포 수
+        """
+        if not repos:
+            return 0
+        day = day_number((collected_at or datetime.now()).date())
+
+        with self._lock:
+            new_names = []
+            records = []
+            for repo in repos:
+                repo_id = self.ids.get(repo.full_name)
+                if repo_id is None:
+                    repo_id = self.ids[repo.full_name] = len(self.names)
+                    self.names.append(repo.full_name)
+                    new_names.append(repo.full_name)
+                records.append((day, repo_id, repo.stars, repo.forks, star_velocity(repo)))
+            rows = np.array(records, dtype=self.dtype)
+
+            # 이름 먼저 (레코드가 가리키는 id가 항상 repos.txt에 있도록)
+            if new_names:
+                with open(self.names_path, 'a', encoding='utf-8') as f:
+                    f.write(''.join(f"{name}\n" for name in new_names))
+            with open(self.observations_path, 'ab') as f:
+                rows.tofile(f)
+        return len(rows)
+
+    # ---- 조회 ----
+
+    def observations(self):
+        """전체 기록 (memmap, 중간에 끊긴 마지막 레코드는 무시)"""
+        size = self.observations_path.stat().st_size if self.observations_path.exists() else 0
+        count = size // self.dtype.itemsize
+        if count == 0:
+            return np.empty(0, dtype=self.dtype)
+        return np.memmap(self.observations_path, dtype=self.dtype, mode='r', shape=(count,))
+
+    def timeline(self, until: date = None) -> dict:
+        """
+        (레포, 날짜) 순으로 정렬하고 하루 한 기록만 남긴 열 배열 + 행별 velocity/acceleration
+
+        Returns:
+            {'day', 'repo', 'stars', 'forks', 'today', 'velocity', 'acceleration', 'group_start'}
+            group_start: 각 행이 속한 레포의 첫 행 위치
+        """
+        records = self.observations()
+        if until is not None and len(records):
+            records = records[records['day'] <= day_number(until)]
+
+        day, repo = np.asarray(records['day']), np.asarray(records['repo'])
+        order = np.lexsort((day, repo))  # 안정 정렬 → 같은 날 기록은 쓴 순서대로
+        day, repo = day[order], repo[order]
+        # 같은 (레포, 날짜)는 마지막 기록만
+        keep = np.ones(len(order), dtype=bool)
+        keep[:-1] = (repo[1:] != repo[:-1]) | (day[1:] != day[:-1])
+        order, day, repo = order[keep], day[keep], repo[keep]
+
+        stars = np.asarray(records['stars'])[order].astype(np.int64)
+        forks = np.asarray(records['forks'])[order].astype(np.int64)
+        today = np.asarray(records['today'])[order].astype(np.int64)
+
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = repo[1:] != repo[:-1]
+        group_start = np.maximum.accumulate(np.where(first, np.arange(len(order)), 0))
+
+        # 직전 기록 대비 하루 평균 증가, 레포의 첫 기록은 페이지에 나온 오늘 스타 수
+        gap = np.maximum(np.diff(day, prepend=day[:1]), 1)
+        velocity = np.where(first, today, np.diff(stars, prepend=stars[:1]) / gap).astype(np.float64)
+        acceleration = np.diff(velocity, prepend=velocity[:1]) / gap
+        second = np.zeros(len(order), dtype=bool)
+        second[1:] = first[:-1]
+        acceleration[first | second] = 0.0  # 비교할 velocity가 둘 이상일 때부터
+
+        return {
+            'day': day, 'repo': repo, 'stars': stars, 'forks': forks, 'today': today,
+            'velocity': velocity, 'acceleration': acceleration, 'group_start': group_start,
+        }
+
+    def risers(self, days: int = 7, limit: int = 10, until: date = None) -> list:
+        """
+        기간(until까지 days일) 동안 스타가 가장 많이 늘어난 레포
+
+        증가량 = 기간 마지막 기록 - 기간 직전 기록
+        (기간 전 기록이 없으면 기간 첫 기록 + 그날의 "stars today")
+
+        Returns:
+            list of {'name', 'gained', 'velocity', 'acceleration', 'forks_gained',
+                     'stars', 'days_on_list', 'first_seen', 'last_seen', 'new'}
+        """
+        columns = self.timeline(until)
+        day, repo, stars = columns['day'], columns['repo'], columns['stars']
+        if len(day) == 0 or limit <= 0:
+            return []
+
+        end = day_number(until) if until else int(day.max())
+        rows = np.flatnonzero(day >= end - days + 1)
+        if len(rows) == 0:
+            return []
+
+        # 기간 안 행은 레포별로 연속 → 레포별 첫/마지막 행
+        starts = np.flatnonzero(np.r_[True, repo[rows][1:] != repo[rows][:-1]])
+        first = rows[starts]
+        last = rows[np.r_[starts[1:], len(rows)] - 1]
+        on_list = np.diff(np.r_[starts, len(rows)])
+
+        group_start = columns['group_start'][first]
+        has_prior = first > group_start
+        base = np.where(has_prior, first - 1, first)
+        gained = stars[last] - stars[base] + np.where(has_prior, 0, columns['today'][first])
+        forks_gained = columns['forks'][last] - columns['forks'][base]
+        span = day[last] - day[base] + np.where(has_prior, 0, 1)
+
+        # 상위 limit개만 부분 정렬
+        if len(gained) > limit:
+            top = np.argpartition(-gained, limit - 1)[:limit]
+        else:
+            top = np.arange(len(gained))
+        top = top[np.lexsort((repo[first][top], -gained[top]))]
+
+        return [
+            {
+                'name': self.names[repo[last[i]]],
+                'gained': int(gained[i]),
+                'velocity': float(gained[i] / span[i]),
+                'acceleration': float(columns['acceleration'][last[i]]),
+                'forks_gained': int(forks_gained[i]),
+                'stars': int(stars[last[i]]),
+                'days_on_list': int(on_list[i]),
+                'first_seen': day_from_number(day[group_start[i]]).isoformat(),
+                'last_seen': day_from_number(day[last[i]]).isoformat(),
+                'new': not has_prior[i],
+            }
+            for i in top
+        ]
+
+    def history(self, name: str) -> list:
+        """레포 하나의 하루 단위 기록 [{'day', 'stars', 'forks', 'velocity', 'acceleration'}]"""
+        repo_id = self.ids.get(name)
+        if repo_id is None:
+            return []
+        columns = self.timeline()
+        rows = np.flatnonzero(columns['repo'] == repo_id)
+        return [
+            {
+                'day': day_from_number(columns['day'][row]).isoformat(),
+                'stars': int(columns['stars'][row]),
+                'forks': int(columns['forks'][row]),
+                'velocity': float(columns['velocity'][row]),
+                'acceleration': float(columns['acceleration'][row]),
+            }
+            for row in rows
+        ]
+
+    def stats(self) -> dict:
+        records = self.observations()
+        days = np.asarray(records['day'])
+        return {
+            'repos': len(self.names),
+            'observations': len(records),
+            'first_day': day_from_number(days.min()).isoformat() if len(days) else None,
+            'last_day': day_from_number(days.max()).isoformat() if len(days) else None,
+            'bytes': self.observations_path.stat().st_size if self.observations_path.exists() else 0,
+        }
+
+
+def format_riser(rank: int, riser: dict) -> str:
+    badge = " 🆕" if riser['new'] else ""
+    trend = "📈" if riser['acceleration'] > 0 else "📉" if riser['acceleration'] < 0 else "➖"
+    return (f"{rank:>2}. {riser['name']}{badge}  +{riser['gained']:,}⭐ ({riser['velocity']:,.0f}/일 {trend})"
+            f"  🍴+{riser['forks_gained']:,}  {riser['days_on_list']}일 트렌딩, 총 {riser['stars']:,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="트렌딩 레포 스타 기록")
+    parser.add_argument('--dir', type=Path, help="저장 위치 (기본 .cache/stars)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    risers = commands.add_parser('risers', help="기간 동안 스타가 가장 많이 늘어난 레포")
+    risers.add_argument('--days', type=int, default=7)
+    risers.add_argument('--limit', type=int, default=20)
+    risers.add_argument('--until', type=date.fromisoformat, help="기간 마지막 날 (기본: 마지막 기록)")
+
+    repo = commands.add_parser('repo', help="레포 하나의 기록")
+    repo.add_argument('name', help="owner/name")
+
+    commands.add_parser('stats', help="저장소 통계")
+    args = parser.parse_args()
+
+    try:
+        history = StarHistory(args.dir)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.command == 'risers':
+        started = time.perf_counter()
+        results = history.risers(args.days, args.limit, args.until)
+        elapsed = (time.perf_counter() - started) * 1000
+        for rank, riser in enumerate(results, 1):
+            print(format_riser(rank, riser))
+        print(f"\n🚀 최근 {args.days}일 상위 {len(results)}개 ({elapsed:.1f}ms)")
+
+    elif args.command == 'repo':
+        rows = history.history(args.name)
+        if not rows:
+            print(f"❌ 기록 없음: {args.name}")
+            sys.exit(1)
+        for row in rows:
+            print(f"{row['day']}  ⭐{row['stars']:,}  🍴{row['forks']:,}  "
+                  f"{row['velocity']:+,.0f}/일  가속 {row['acceleration']:+,.1f}")
+
+    elif args.command == 'stats':
+        stats = history.stats()
+        print(f"⭐ 레포 {stats['repos']:,}개, 기록 {stats['observations']:,}개 ({stats['bytes'] / 1024:.0f}KB), "
+              f"{stats['first_day']} ~ {stats['last_day']}")
+
+
+if __name__ == "__main__":
+    main()
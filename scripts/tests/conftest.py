@@ -0,0 +1,12 @@
+"""
+pytest 설정: scripts/를 import 경로에 (benchmarks/와 같은 방식)
+
+실행:
+    cd scripts
+    python -m pytest -q tests
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+utils.text.html_to_text / truncate 테스트
+엔티티, 중첩 태그, 길이 제한, 입력 속 NUL(\x00)
+"""
+
+import pytest
+
+from utils.text import html_to_text, truncate
+
+
+@pytest.mark.parametrize('source, expected', [
+    ('Caf&eacute; &#8220;quoted&#8221; &#x1F680; rocket', 'Café “quoted” 🚀 rocket'),
+    ('Tom &amp; Jerry', 'Tom & Jerry'),
+    ('&amp;amp; stays once-decoded', '&amp; stays once-decoded'),
+    ('a&nbsp;&nbsp;b', 'a b'),
+    ('<![CDATA[<p>Launch&nbsp;day &mdash; <em>finally</em></p>]]>', 'Launch day — finally'),
+])
+def test_entities(source, expected):
+    assert html_to_text(source) == expected
+
+
+def test_nested_tags():
+    source = (
+        '<div class="post"><p>Intro <a href="/x"><strong>bold <em>link</em></strong></a></p>'
+        '<ul><li>one</li><li><span>two</span></li></ul></div>'
+    )
+    assert html_to_text(source) == 'Intro bold link one two'
+
+
+def test_block_tags_keep_words_apart():
+    assert html_to_text('<p>first</p><p>second</p>line<br/>break') == 'first second line break'
+
+
+def test_script_style_comment_dropped_with_content():
+    source = (
+        '<p>Intro</p><script>var x = "<p>ad</p>";</script>'
+        '<STYLE>p { color: red }</STYLE><!-- tracking\n pixel --><p>Body</p>'
+    )
+    assert html_to_text(source) == 'Intro Body'
+
+
+def test_unclosed_tag_does_not_eat_everything():
+    assert html_to_text('before <b>bold') == 'before bold'
+
+
+@pytest.mark.parametrize('source', [None, '', '   ', '<p></p>'])
+def test_empty(source):
+    assert html_to_text(source) == ''
+
+
+def test_nul_in_input():
+    assert html_to_text('left\x00right') == 'left right'
+    assert html_to_text('<p>a\x00</p>\x00<b>b</b>') == 'a b'
+    assert '\x00' not in html_to_text('\x00' * 10 + 'x', limit=5)
+
+
+def test_limit_cuts_at_word_boundary():
+    text = html_to_text('<p>' + 'word ' * 200 + '</p>', limit=500)
+    assert len(text) <= 500
+    assert text.endswith('word')
+
+
+def test_limit_counts_text_not_markup():
+    source = '<a href="https://example.com/' + 'x' * 600 + '">short</a>'
+    assert html_to_text(source, limit=10) == 'short'
+
+
+def test_limit_exact_length_untouched():
+    assert html_to_text('a' * 500, limit=500) == 'a' * 500
+    assert len(html_to_text('a' * 501, limit=500)) == 500
+
+
+def test_limit_never_splits_grapheme():
+    family = '👨‍👩‍👧‍👦'
+    text = ('가족 ' + family + ' ') * 40
+    for limit in range(1, 80):
+        result = html_to_text(text, limit=limit)
+        assert len(result) <= limit
+        assert not result.endswith('‍')
+        # 잘린 결과 끝에 남은 이모지는 조합 전체여야 함
+        if result.endswith(('👨', '👩', '👧', '👦')):
+            assert result.endswith(family)
+
+
+def test_truncate_suffix_counts_toward_limit():
+    result = truncate('alpha beta gamma delta', 12, suffix='…')
+    assert len(result) <= 12
+    assert result == 'alpha beta…'
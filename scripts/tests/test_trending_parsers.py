@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+collectors.trending_parsers 테스트
+저장된 트렌딩 페이지(benchmarks/fixtures/github_trending_*.html)를 설치된 모든 엔진으로 파싱해
+Repo 목록이 완전히 같은지 확인 (설치 안 된 엔진은 건너뜀)
+"""
+
+from pathlib import Path
+
+import pytest
+
+from collectors.trending_parsers import ENGINES, available_engines
+
+FIXTURES_DIR = Path(__file__).parent.parent / 'benchmarks' / 'fixtures'
+FIXTURES = sorted(FIXTURES_DIR.glob('github_trending_*.html'))
+
+
+def parse_all(path: Path) -> dict:
+    """설치된 엔진 이름 → 파싱 결과"""
+    html = path.read_text(encoding='utf-8')
+    return {engine: ENGINES[engine][0](html) for engine in available_engines()}
+
+
+def test_fixtures_present():
+    assert FIXTURES, f"트렌딩 fixture 없음: {FIXTURES_DIR}"
+
+
+@pytest.mark.parametrize('path', FIXTURES, ids=lambda path: path.stem)
+def test_engines_agree(path):
+    results = parse_all(path)
+    if len(results) < 2:
+        pytest.skip(f"비교할 엔진이 부족함 (설치됨: {', '.join(results) or '없음'})")
+
+    (reference, expected), *others = results.items()
+    for engine, repos in others:
+        assert [repo.to_dict() for repo in repos] == [repo.to_dict() for repo in expected], \
+            f"{engine} ≠ {reference}: {path.name}"
+
+
+@pytest.mark.parametrize('path', FIXTURES, ids=lambda path: path.stem)
+def test_repos_well_formed(path):
+    for engine, repos in parse_all(path).items():
+        assert [repo.rank for repo in repos] == list(range(1, len(repos) + 1)), engine
+        for repo in repos:
+            assert repo.title == f"{repo.owner}/{repo.name}", engine
+            assert repo.url == f"https://github.com/{repo.title}", engine
+            assert repo.owner and repo.name, engine
+
+
+def test_daily_page_not_empty():
+    for engine, repos in parse_all(FIXTURES_DIR / 'github_trending_daily.html').items():
+        assert repos, engine
+        assert any(repo.stars > 0 for repo in repos), engine
+
+
+def test_empty_page():
+    for engine, repos in parse_all(FIXTURES_DIR / 'github_trending_empty.html').items():
+        assert repos == [], engine
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Cursor Store
+타임라인/검색 결과를 어디까지 읽었는지 키별로 기억 (X 감시 목록용)
+- since_id: 지금까지 처리한 가장 최신 트윗 id (다음 실행은 이보다 새 트윗만)
+- gaps: 페이지 한도에 걸려 다 못 읽은 구간들 [(이어 읽을 페이지 커서, 구간의 끝 = 그때의 since_id)]
+  최신 구간부터 - 다음 실행들에서 각 구간의 floor에 닿을 때까지 이어서 읽음
+  (새 구간이 생겨도 아직 다 못 읽은 예전 구간은 그대로 남음)
+- held: 읽었지만 다이제스트에 못 들어간 포스트 (Item.to_dict 목록) - 다음 실행에서 다시 후보
+- 키: 'user:<이름 소문자>' / 'search:<검색어>'
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent / '.cache' / 'x_cursors.sqlite3'
+
+
+class CursorStore:
+    def __init__(self, db_path: Path = None):
+        """
+        Args:
+            db_path: SQLite 파일 위치
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS cursors (
+                key TEXT PRIMARY KEY,
+                since_id INTEGER,
+                gaps TEXT,
+                held TEXT,
+                updated_at REAL NOT NULL
+            );
+        """)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(cursors)")}
+        if 'gaps' not in columns:
+            # 예전 형식 (구간 하나: cursor, floor 열) → gaps 목록으로 옮김
+            self.conn.execute("ALTER TABLE cursors ADD COLUMN gaps TEXT")
+            self.conn.execute("UPDATE cursors SET gaps = json_array(json_array(cursor, floor)) "
+                              "WHERE cursor IS NOT NULL")
+            self.conn.commit()
+        if 'held' not in columns:
+            self.conn.execute("ALTER TABLE cursors ADD COLUMN held TEXT")
+            self.conn.commit()
+
+    def get(self, key: str):
+        """키의 상태 {'since_id', 'gaps': [(cursor, floor), ...], 'held': [dict, ...]} (처음 보는 키면 None)"""
+        with self._lock:
+            row = self.conn.execute("SELECT since_id, gaps, held FROM cursors WHERE key = ?", (key,)).fetchone()
+        if not row:
+            return None
+        return {
+            'since_id': row[0],
+            'gaps': [tuple(gap) for gap in json.loads(row[1])] if row[1] else [],
+            'held': json.loads(row[2]) if row[2] else [],
+        }
+
+    def set_many(self, states: dict):
+        """{키: {'since_id', 'gaps', 'held'(생략 가능)}} 한 번에 저장"""
+        now = time.time()
+        rows = [
+            (key, state['since_id'], json.dumps(state['gaps']) if state['gaps'] else None,
+             json.dumps(state['held'], ensure_ascii=False) if state.get('held') else None, now)
+            for key, state in states.items()
+        ]
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO cursors (key, since_id, gaps, held, updated_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.commit()
+
+    def all(self) -> list:
+        """[(키, since_id, 이어 읽을 구간 수, 보류 포스트 수, 갱신 시각)] 키 순서"""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT key, since_id, coalesce(json_array_length(gaps), 0), coalesce(json_array_length(held), 0), "
+                "updated_at FROM cursors ORDER BY key"
+            ).fetchall()
+
+    def reset(self, keys: list = None) -> int:
+        """
+        커서 삭제 (다음 실행에서 처음부터 한 페이지만 다시 읽음)
+
+        Args:
+            keys: 지울 키 목록 (None이면 전부)
+
+        Returns:
+            지운 개수
+        """
+        with self._lock:
+            if keys is None:
+                deleted = self.conn.execute("DELETE FROM cursors").rowcount
+            else:
+                deleted = sum(
+                    self.conn.execute("DELETE FROM cursors WHERE key = ?", (key,)).rowcount for key in keys
+                )
+            self.conn.commit()
+        return deleted
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Cross-source Dedup
+같은 기사가 여러 피드(TechCrunch, The Verge, Hacker News...)에 동시에 올라온 경우 하나로 합침
+- 링크 정규화: utm_* 등 추적 파라미터 제거, 리다이렉터 풀기, 호스트 정규화
+- 제목 유사도: MinHash + LSH 밴드로 후보만 뽑고 Jaccard로 확인 (비교 한 번이 거의 O(1))
+  (SimHash는 10단어 안팎의 짧은 제목에서는 비슷한 제목끼리도 비트 차이가 커서 MinHash 사용)
+- 중복은 먼저 들어온 항목에 합쳐지고, 그 항목의 sources에 출처가 추가됨
+  (합쳐진 항목은 duplicates_of로 돌려받음 - 대표 항목을 보낼 때 함께 본 것으로 기록)
+"""
+
+import hashlib
+import re
+import threading
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+# 제거할 추적용 쿼리 파라미터 - 광고/공유 추적으로 알려진 것만
+# (ref, source, src 같은 일반적인 이름은 사이트에 따라 내용을 고르는 데 쓰여서 남김)
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid',
+    'ref_src', 'ref_url', 'cmpid', 'ncid',
+    'guccounter', 'guce_referrer', 'guce_referrer_sig', 'taid', 'sr_share', 'smid',
+}
+TRACKING_PREFIXES = ('utm_', 'hmb_', 'at_', 'oly_')
+
+# 목적지 URL을 쿼리 파라미터로 들고 있는 리다이렉터 → 파라미터 이름
+REDIRECTORS = {
+    'www.google.com': 'url',
+    'google.com': 'url',
+    'l.facebook.com': 'u',
+    'lm.facebook.com': 'u',
+    'out.reddit.com': 'url',
+    'href.li': None,  # https://href.li/?https://target
+    'news.google.com': 'url',
+    'www.linkedin.com': 'url',
+}
+
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+STOPWORDS = {
+    'a', 'an', 'the', 'to', 'of', 'in', 'on', 'for', 'with', 'and', 'or', 'is', 'are', 'was',
+    'be', 'at', 'by', 'from', 'as', 'it', 'its', 'this', 'that', 'will', 'has', 'have',
+}
+
+# MinHash 해시 함수: (a * x + b) mod p, 고정 시드라 실행마다 같은 서명
+MERSENNE_PRIME = (1 << 61) - 1
+_PERMUTATIONS = [
+    (int.from_bytes(hashlib.blake2b(f"a{i}".encode(), digest_size=8).digest(), 'big') % MERSENNE_PRIME | 1,
+     int.from_bytes(hashlib.blake2b(f"b{i}".encode(), digest_size=8).digest(), 'big') % MERSENNE_PRIME)
+    for i in range(128)
+]
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    비교용 정규화 URL
+
+    - 알려진 리다이렉터는 목적지 URL로 교체
+    - scheme은 https, 호스트는 소문자 + www./m./amp. 제거, 기본 포트 제거
+    - 추적 파라미터와 fragment 제거, 나머지 파라미터는 정렬
+    - 끝의 '/'와 '/amp' 제거
+    """
+    if not url:
+        return ''
+
+    for _ in range(3):  # 리다이렉터가 중첩된 경우까지
+        parts = urlsplit(url.strip())
+        host = parts.netloc.lower()
+        if host not in REDIRECTORS:
+            break
+        param = REDIRECTORS[host]
+        if param is None:
+            target = unquote(parts.query)
+        else:
+            target = dict(parse_qsl(parts.query)).get(param, '')
+        if not target.startswith(('http://', 'https://')):
+            break
+        url = target
+
+    parts = urlsplit(url.strip())
+    host = parts.hostname or ''
+    for prefix in ('www.', 'm.', 'amp.', 'mobile.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+
+    path = re.sub(r'/+', '/', parts.path)
+    if path.endswith('/amp'):
+        path = path[:-len('/amp')]
+    path = path.rstrip('/')
+
+    return urlunsplit(('https', host, path, urlencode(query), ''))
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def title_tokens(title: str) -> set:
+    """제목 → 소문자 단어 집합 (불용어 제외)"""
+    return {word for word in WORD_RE.findall(title.lower()) if word not in STOPWORDS}
+
+
+def minhash(tokens: set, num_perm: int = 32) -> tuple:
+    """단어 집합의 MinHash 서명 (같은 값 비율 ≈ Jaccard 유사도)"""
+    hashes = [_token_hash(token) for token in tokens]
+    return tuple(
+        min((a * h + b) % MERSENNE_PRIME for h in hashes)
+        for a, b in _PERMUTATIONS[:num_perm]
+    )
+
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+class Deduplicator:
+    def __init__(self, threshold: float = 0.6, num_perm: int = 32, bands: int = 8, min_tokens: int = 3):
+        """
+        Args:
+            threshold: 같은 기사로 볼 제목 단어 Jaccard 유사도
+            num_perm: MinHash 서명 길이
+            bands: LSH 밴드 수 (num_perm의 약수, 많을수록 후보를 넓게 잡음)
+            min_tokens: 이보다 짧은 제목은 제목 비교 없이 링크로만 판단 (오탐 방지)
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.min_tokens = min_tokens
+
+        self._lock = threading.Lock()
+        self.by_url = {}
+        self.buckets = {}
+        self.merged = {}  # id(대표 항목) → 합쳐진 중복 항목들
+        self.duplicates = 0
+
+    def _band_keys(self, signature: tuple) -> list:
+        return [(band, signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+    def _find_similar(self, tokens: set, signature: tuple):
+        # 밴드 하나라도 완전히 같은 항목만 후보 → 실제 Jaccard로 확인
+        for key in self._band_keys(signature):
+            for other_tokens, item in self.buckets.get(key, ()):
+                if jaccard(tokens, other_tokens) >= self.threshold:
+                    return item
+        return None
+
+    def add(self, item):
+        """
+        항목 등록 (models.Article)
+
+        Returns:
+            처음 본 항목이면 None, 중복이면 합쳐진 기존 항목
+        """
+        if not item.sources:
+            item.sources = [item.source]
+        url = canonicalize_url(item.url)
+        tokens = title_tokens(item.title)
+        signature = minhash(tokens, self.num_perm) if len(tokens) >= self.min_tokens else None
+
+        with self._lock:
+            original = self.by_url.get(url) if url else None
+            if original is None and signature is not None:
+                original = self._find_similar(tokens, signature)
+
+            if original is not None:
+                self.duplicates += 1
+                self.merged.setdefault(id(original), []).append(item)
+                for source in item.sources:
+                    if source not in original.sources:
+                        original.sources.append(source)
+                return original
+
+            if url:
+                self.by_url[url] = item
+            if signature is not None:
+                for key in self._band_keys(signature):
+                    self.buckets.setdefault(key, []).append((tokens, item))
+            return None
+
+    def duplicates_of(self, item) -> list:
+        """item에 합쳐진 중복 항목들 (대표 항목과 함께 본 것으로 기록할 때)"""
+        return self.merged.get(id(item), [])
+
+    def filter(self, items: list) -> list:
+        """중복을 기존 항목에 합치고 처음 본 항목만 반환"""
+        return [item for item in items if self.add(item) is None]
+
+    def dedupe(self, results: dict) -> dict:
+        """
+        {source: [articles]} 전체 중복 제거 (앞 순서 소스가 대표가 됨)
+
+        Returns:
+            dict: 중복이 빠진 {source: [articles]} (전부 중복인 소스는 제외)
+        """
+        deduped = {}
+        for source, items in results.items():
+            kept = self.filter(items)
+            if kept:
+                deduped[source] = kept
+        return deduped
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Gemini Client
+google.generativeai는 import만으로도 무거워서(grpc, protobuf...) 실제로 요약을 요청하는
+순간까지 import를 미룸
+"""
+
+import importlib.util
+import os
+import threading
+
+DEFAULT_MODEL = 'gemini-2.0-flash'
+
+
+def gemini_available() -> bool:
+    """google-generativeai 설치 여부 (import 없이 확인)"""
+    try:
+        return importlib.util.find_spec('google.generativeai') is not None
+    except ModuleNotFoundError:
+        return False
+
+
+GEMINI_AVAILABLE = gemini_available()
+
+# Gemini 대신 쓸 모델 생성 함수 (오프라인 벤치마크의 가짜 LLM 등, None이면 Gemini)
+model_factory = None
+
+
+class LazyGeminiModel:
+    """generate_content()를 처음 호출할 때 google.generativeai를 import하고 모델 생성"""
+
+    def __init__(self, api_key: str, model_name: str = DEFAULT_MODEL):
+        self.api_key = api_key
+        self.model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        with self._lock:
+            if self._model is None:
+                import google.generativeai as genai
+                genai.configure(api_key=self.api_key)
+                self._model = genai.GenerativeModel(self.model_name)
+            return self._model
+
+    def generate_content(self, prompt: str):
+        return self.model.generate_content(prompt)
+
+
+def create_model(model_name: str = DEFAULT_MODEL):
+    """
+    Gemini 모델 (지연 로딩)
+
+    Returns:
+        LazyGeminiModel, 패키지나 GEMINI_API_KEY가 없으면 None
+        (model_factory가 지정돼 있으면 그 결과)
+    """
+    if model_factory:
+        return model_factory(model_name)
+
+    if not GEMINI_AVAILABLE:
+        return None
+
+    api_key = os.getenv('GEMINI_API_KEY')
+    if not api_key:
+        return None
+
+    return LazyGeminiModel(api_key, model_name)
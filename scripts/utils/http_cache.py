@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+HTTP Validator Cache
+ETag / Last-Modified 기반 조건부 GET 캐시
+- 304 응답이면 이전에 파싱해둔 결과를 그대로 재사용 (재다운로드/재파싱 없음)
+- URL마다 파일 하나 (여러 인스턴스/스레드가 같은 디렉토리를 써도 안전)
+- 용량 초과 시 가장 오래 안 쓴 항목부터 삭제 (LRU)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from utils.metrics import metrics
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / '.cache' / 'http'
+
+
+class HTTPCache:
+    def __init__(self, cache_dir: Path = None, max_bytes: int = 20 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: 캐시 파일 저장 위치
+            max_bytes: 캐시 디렉토리 최대 용량 (초과 시 LRU 삭제)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.bytes_fetched = 0
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def _read(self, url: str):
+        try:
+            record = json.loads(self._path(url).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return record if record.get('url') == url else None
+
+    def conditional_headers(self, url: str) -> dict:
+        """저장된 검증자로 If-None-Match / If-Modified-Since 헤더 생성"""
+        record = self._read(url)
+        if not record:
+            return {}
+
+        headers = {}
+        if record.get('etag'):
+            headers['If-None-Match'] = record['etag']
+        if record.get('last_modified'):
+            headers['If-Modified-Since'] = record['last_modified']
+        return headers
+
+    def load(self, url: str):
+        """
+        304 응답을 받았을 때 호출: 저장된 파싱 결과 반환
+
+        Returns:
+            저장된 payload, 캐시가 없어졌으면 None (이 경우 조건 없이 다시 받아야 함)
+        """
+        record = self._read(url)
+        if record is None:
+            return None
+
+        # 최근 사용 시각 갱신 (LRU 기준)
+        try:
+            os.utime(self._path(url))
+        except OSError:
+            pass
+
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += record.get('size', 0)
+        metrics.incr('http_cache_hits')
+        metrics.incr('bytes_saved', record.get('size', 0))
+        return record['payload']
+
+    def store(self, url: str, headers, payload, size: int):
+        """
+        200 응답을 파싱한 뒤 호출: 검증자와 파싱 결과 저장
+
+        Args:
+            headers: 응답 헤더 (ETag, Last-Modified 추출)
+            payload: JSON 직렬화 가능한 파싱 결과
+            size: 원본 응답 크기 (bytes, 절약량 통계용)
+        """
+        with self._lock:
+            self.misses += 1
+            self.bytes_fetched += size
+        metrics.incr('http_cache_misses')
+
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return  # 검증자가 없으면 304를 받을 수 없으므로 저장하지 않음
+
+        record = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'size': size,
+            'stored_at': time.time(),
+            'payload': payload,
+        }
+
+        path = self._path(url)
+        tmp_path = path.with_suffix(f'.{threading.get_ident()}.tmp')
+        try:
+            tmp_path.write_text(json.dumps(record, ensure_ascii=False), encoding='utf-8')
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"  ⚠️ HTTP 캐시 저장 실패: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self.evict()
+
+    def evict(self):
+        """최대 용량을 넘으면 가장 오래 안 쓴 항목부터 삭제"""
+        files = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(files):
+            path.unlink(missing_ok=True)
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / requests if requests else 0.0,
+                'bytes_saved': self.bytes_saved,
+                'bytes_fetched': self.bytes_fetched,
+            }
+
+    def summary(self) -> str:
+        """통계 한 줄 요약"""
+        s = self.stats()
+        return (f"HTTP 캐시: 적중 {s['hits']} / 미스 {s['misses']} "
+                f"(적중률 {s['hit_rate']:.0%}), 절약 {s['bytes_saved'] / 1024:,.1f}KB")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+LLM Executor
+Gemini 호출을 동시에 실행하되 무료 티어 쿼터(분당 요청 수)를 넘지 않도록 제어
+- 토큰 버킷으로 요청 속도 제한 (스레드/이벤트 루프 간 공유)
+- 동시 실행 수 제한 (실행기 하나에 세마포어 하나 - 파이프라인의 여러 소스가 함께 사용)
+- 429 / 5xx 응답은 지수 백오프 후 재시도
+- 마감 시간이 지나면 남은 호출은 취소하고 끝난 결과만 반환
+"""
+
+import asyncio
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.metrics import metrics
+from utils.rate_limit import TokenBucket
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# 상태 코드가 없는 예외는 종류로 판별 (google.api_core / twikit 예외 이름)
+RETRYABLE_ERRORS = {'ResourceExhausted', 'TooManyRequests', 'ServiceUnavailable',
+                    'InternalServerError', 'DeadlineExceeded', 'ServerError'}
+
+
+def status_code(error: Exception):
+    """예외에 실린 HTTP 상태 코드 (없으면 None)"""
+    response = getattr(error, 'response', None)
+    for source, attr in ((error, 'code'), (error, 'status_code'), (response, 'status_code')):
+        code = getattr(source, attr, None)
+        code = code() if callable(code) else code
+        try:
+            return int(code)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """재시도할 만한 오류인지 (rate limit / 일시적인 서버 오류 / 연결 끊김)"""
+    code = status_code(error)
+    if code is not None:
+        return code in RETRYABLE_STATUS
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    return any(cls.__name__ in RETRYABLE_ERRORS for cls in type(error).__mro__)
+
+
+class LLMExecutor:
+    def __init__(self, rate_per_minute: float = 15, burst: int = 3, max_concurrency: int = 4,
+                 max_retries: int = 3, base_delay: float = 2.0, max_delay: float = 30.0):
+        """
+        Args:
+            rate_per_minute: 분당 최대 요청 수 (gemini-2.0-flash 무료 티어: 15)
+            burst: 한꺼번에 보낼 수 있는 요청 수
+            max_concurrency: 동시에 진행할 최대 요청 수 (이 실행기를 쓰는 모든 map 호출 합계)
+            max_retries: 429/5xx 재시도 횟수
+            base_delay: 첫 재시도 대기 시간 (초, 이후 2배씩)
+            max_delay: 재시도 대기 시간 상한 (초)
+        """
+        self.bucket = TokenBucket(rate_per_minute, burst)
+        self.max_concurrency = max(1, max_concurrency)
+        self.slots = threading.BoundedSemaphore(self.max_concurrency)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def run_slot(self, fn, arg, cancelled: threading.Event):
+        """
+        워커 스레드에서 fn(arg) 실행 - 실행기 공용 슬롯을 잡고 토큰을 받은 뒤
+
+        슬롯이나 토큰을 기다리는 사이 마감 시간이 지났으면(cancelled) 요청하지 않는다 (쿼터 낭비 방지).
+        토큰 대기는 cancelled로 깨어나므로 마감 뒤에 슬롯을 잡은 채 잠들어 있지 않는다.
+        """
+        with self.slots:
+            if cancelled.is_set():
+                raise asyncio.CancelledError()
+            delay = self.bucket.reserve()
+            if delay > 0 and cancelled.wait(delay):
+                raise asyncio.CancelledError()
+            return fn(arg)
+
+    async def call(self, fn, arg, pool: ThreadPoolExecutor, cancelled: threading.Event):
+        """fn(arg) 한 번 실행 (동시 실행 제한 + 속도 제한 + 재시도)"""
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await loop.run_in_executor(pool, self.run_slot, fn, arg, cancelled)
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+                delay *= random.uniform(0.5, 1.0)  # 동시에 재시도가 몰리지 않도록
+                metrics.incr('llm_retries')
+                print(f"  ⏳ LLM 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후): {e}")
+
+            await asyncio.sleep(delay)
+
+    async def map_async(self, fn, args: list, timeout: float = None) -> list:
+        """
+        args 각각에 fn 실행 (동시 실행)
+
+        Returns:
+            args와 같은 순서의 결과 목록 (실패/시간 초과는 None)
+        """
+        if not args:
+            return []
+
+        cancelled = threading.Event()
+        # 기본 executor를 쓰면 asyncio.run()이 끝날 때 남은 스레드를 기다리므로 별도 풀 사용
+        # (동시 실행 수는 풀 크기가 아니라 실행기 공용 슬롯이 제한)
+        pool = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        tasks = [asyncio.ensure_future(self.call(fn, arg, pool, cancelled)) for arg in args]
+
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+            if pending:
+                cancelled.set()
+                print(f"  ⏱️ LLM 마감 시간({timeout:g}초) 초과, {len(pending)}개 요청 취소")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        results = []
+        for task in tasks:
+            if task.cancelled():
+                results.append(None)
+            elif task.exception() is not None:
+                print(f"  ⚠️ LLM 요청 실패: {task.exception()}")
+                results.append(None)
+            else:
+                results.append(task.result())
+        return results
+
+    def map(self, fn, args: list, timeout: float = None) -> list:
+        """map_async의 동기 버전 (이벤트 루프 밖에서 호출)"""
+        return asyncio.run(self.map_async(fn, args, timeout))
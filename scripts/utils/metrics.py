@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Run Metrics
+단계별 소요 시간(span)과 카운터를 모아 실행 리포트로 저장
+- span: fetch / parse / summarize / format / send ... 소스별, 항목별 소요 시간
+- 카운터: 받은 바이트, 파싱한 항목, LLM 호출, 캐시 적중, 실패 ...
+- 출력: JSON 실행 리포트 + Prometheus textfile (node_exporter textfile collector용)
+- 프로파일 모드(tracemalloc 실행 중): 스테이지가 끝날 때마다 스냅샷을 떠서 늘어난 메모리 상위 위치 기록
+
+모든 모듈이 같은 `metrics` 인스턴스에 기록한다.
+    from utils.metrics import metrics
+    with metrics.span('fetch', source=name):
+        ...
+    metrics.incr('bytes_fetched', len(body), source=name)
+"""
+
+import json
+import os
+import re
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_METRICS_DIR = Path(__file__).parent.parent / '.cache' / 'metrics'
+PROMETHEUS_PREFIX = 'news_aggregator'
+MAX_SPANS = 20000  # 리포트에 남길 개별 span 수 (집계는 전부 반영)
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((key, str(value)) for key, value in labels.items() if value is not None))
+
+
+def _prometheus_labels(key: tuple) -> str:
+    if not key:
+        return ''
+    escaped = (
+        '{}="{}"'.format(name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in key
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """새 실행 시작 (이전 기록 삭제)"""
+        with self._lock:
+            self.started_at = time.time()
+            self._started = time.perf_counter()
+            self.spans = []
+            self.dropped_spans = 0
+            self.stage_totals = defaultdict(lambda: [0, 0.0, 0.0])  # (stage, labels) → [횟수, 합계, 최대]
+            self.counters = defaultdict(float)                     # (name, labels) → 값
+            self.memory = {}
+            self._snapshot = None
+
+    @contextmanager
+    def span(self, stage: str, source: str = None, item: str = None):
+        """
+        소요 시간 기록
+
+        Args:
+            stage: 단계 이름 (fetch, parse, summarize, format, send ...)
+            source: 소스 이름 (피드, 'github', 채팅 id ...)
+            item: 항목 (기사 링크, 레포 이름 ...) - 개별 span 목록에만 남고 집계에서는 빠짐
+
+        예외가 나면 failures 카운터를 올리고 그대로 다시 올린다.
+        """
+        started = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            self._record_span(stage, source, item, started - self._started, duration, error)
+
+    def _record_span(self, stage, source, item, offset, duration, error):
+        labels = _label_key({'stage': stage, 'source': source})
+        with self._lock:
+            totals = self.stage_totals[labels]
+            totals[0] += 1
+            totals[1] += duration
+            totals[2] = max(totals[2], duration)
+            if error:
+                self.counters[('failures', labels + (('error', error),))] += 1
+
+            if len(self.spans) < MAX_SPANS:
+                record = {'stage': stage, 'start': round(offset, 4), 'seconds': round(duration, 6)}
+                if source is not None:
+                    record['source'] = source
+                if item is not None:
+                    record['item'] = item
+                if error:
+                    record['error'] = error
+                self.spans.append(record)
+            else:
+                self.dropped_spans += 1
+
+    def incr(self, name: str, value: float = 1, **labels):
+        """카운터 증가 (예: incr('llm_calls', source='rss'))"""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self.counters[key] += value
+
+    def counter(self, name: str, **labels) -> float:
+        """카운터 값 (labels를 주지 않으면 같은 이름 전체 합)"""
+        with self._lock:
+            if labels:
+                return self.counters.get((name, _label_key(labels)), 0)
+            return sum(value for (counter, _), value in self.counters.items() if counter == name)
+
+    def take_snapshot(self, stage: str, top: int = 10):
+        """
+        tracemalloc 스냅샷을 떠서 직전 스냅샷보다 늘어난 메모리 상위 위치 기록
+
+        스테이지 경계에서 호출 (tracemalloc이 꺼져 있으면 아무것도 안 함)
+        """
+        if not tracemalloc.is_tracing():
+            return
+
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        previous, self._snapshot = self._snapshot, snapshot
+
+        stats = snapshot.compare_to(previous, 'lineno') if previous else snapshot.statistics('lineno')
+        self.memory[stage] = {
+            'current_bytes': current,
+            'peak_bytes': peak,
+            'top': [
+                {
+                    'where': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    'size_bytes': stat.size,
+                    'size_diff_bytes': getattr(stat, 'size_diff', stat.size),
+                    'count': stat.count,
+                }
+                for stat in stats[:top]
+            ],
+        }
+
+    def stage_summary(self) -> dict:
+        """단계별 합계 {stage: {'calls', 'seconds', 'max_seconds'}} (소스 합산)"""
+        summary = defaultdict(lambda: {'calls': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+        with self._lock:
+            for labels, (calls, total, longest) in self.stage_totals.items():
+                stage = dict(labels)['stage']
+                summary[stage]['calls'] += calls
+                summary[stage]['seconds'] += total
+                summary[stage]['max_seconds'] = max(summary[stage]['max_seconds'], longest)
+        return {
+            stage: {key: round(value, 4) if isinstance(value, float) else value for key, value in values.items()}
+            for stage, values in summary.items()
+        }
+
+    def report(self) -> dict:
+        """JSON 실행 리포트"""
+        with self._lock:
+            stages = [
+                {**dict(labels), 'calls': calls, 'seconds': round(total, 4), 'max_seconds': round(longest, 4)}
+                for labels, (calls, total, longest) in self.stage_totals.items()
+            ]
+            counters = [
+                {'name': name, **dict(labels), 'value': value}
+                for (name, labels), value in sorted(self.counters.items())
+            ]
+            spans = list(self.spans)
+            dropped = self.dropped_spans
+            memory = dict(self.memory)
+
+        report = {
+            'started_at': self.started_at,
+            'duration_seconds': round(time.perf_counter() - self._started, 4),
+            'stage_summary': self.stage_summary(),
+            'stages': sorted(stages, key=lambda stage: -stage['seconds']),
+            'counters': counters,
+            'spans': spans,
+            'dropped_spans': dropped,
+        }
+        if memory:
+            report['memory'] = memory
+        return report
+
+    def prometheus(self) -> str:
+        """Prometheus 텍스트 형식"""
+        lines = []
+        with self._lock:
+            stage_totals = dict(self.stage_totals)
+            counters = dict(self.counters)
+
+        def family(name: str, help_text: str, samples: list, metric_type: str = 'counter'):
+            metric = f"{PROMETHEUS_PREFIX}_{_metric_name(name)}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {metric_type}")
+            for labels, value in samples:
+                lines.append(f"{metric}{_prometheus_labels(labels)} {value:.15g}")
+
+        family('stage_duration_seconds_total', "단계별 소요 시간 합계",
+               [(labels, totals[1]) for labels, totals in stage_totals.items()])
+        family('stage_calls_total', "단계별 실행 횟수",
+               [(labels, totals[0]) for labels, totals in stage_totals.items()])
+
+        by_name = defaultdict(list)
+        for (name, labels), value in counters.items():
+            by_name[name].append((labels, value))
+        for name, samples in sorted(by_name.items()):
+            family(f"{name}_total", name, samples)
+
+        family('run_duration_seconds', "실행 전체 소요 시간", [((), time.perf_counter() - self._started)], 'gauge')
+        family('run_timestamp_seconds', "마지막 실행 시각 (epoch)", [((), self.started_at)], 'gauge')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _write_atomic(path: Path, text: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        tmp_path.write_text(text, encoding='utf-8')
+        os.replace(tmp_path, path)  # textfile collector가 쓰다 만 파일을 읽지 않게
+
+    def write(self, json_path: Path = None, prometheus_path: Path = None) -> tuple:
+        """
+        리포트 파일 저장
+
+        Returns:
+            (json_path, prometheus_path)
+        """
+        json_path = Path(json_path) if json_path else DEFAULT_METRICS_DIR / 'run.json'
+        prometheus_path = Path(prometheus_path) if prometheus_path else DEFAULT_METRICS_DIR / 'news_aggregator.prom'
+        try:
+            self._write_atomic(json_path, json.dumps(self.report(), ensure_ascii=False, indent=2))
+            self._write_atomic(prometheus_path, self.prometheus())
+        except OSError as e:
+            print(f"⚠️ 메트릭 저장 실패: {e}")
+        return json_path, prometheus_path
+
+    def summary(self) -> str:
+        """콘솔용 한 줄 요약"""
+        stages = self.stage_summary()
+        parts = [f"{stage} {values['seconds']:.1f}초/{values['calls']}회" for stage, values in stages.items()
+                 if '.' not in stage]
+        return "📈 " + ", ".join(parts) if parts else "📈 기록 없음"
+
+
+metrics = Metrics()
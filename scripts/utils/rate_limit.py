@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Rate Limit
+요청 속도 제한용 토큰 버킷 (Gemini 실행기, 텔레그램 발송 등에서 공용)
+- 스레드 안전, 토큰을 미리 예약하고 그 시점까지 대기
+- 스레드에서는 wait(), 이벤트 루프에서는 await acquire()
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (토큰을 미리 예약하고 그 시점까지 대기)"""
+
+    def __init__(self, rate_per_minute: float, burst: int = 1):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나 예약 → 사용 가능해질 때까지 기다려야 하는 시간 (초)"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    async def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def wait(self):
+        """acquire의 동기 버전 (스레드에서 사용)"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Seen Store
+이전 실행에서 이미 보낸 항목을 기억해서 새 항목만 처리
+- 키: 정규화 URL의 해시 (utm 파라미터 등이 달라도 같은 기사)
+- 소스별 하이워터마크: 지난번 가장 최신 항목에 닿으면 그 뒤(더 오래된 항목)는 보지 않음
+- 보존 기간이 지난 기록은 자동 삭제
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from utils.dedup import canonicalize_url
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent / '.cache' / 'seen.sqlite3'
+
+
+class SeenStore:
+    def __init__(self, db_path: Path = None, retention_days: float = 30):
+        """
+        Args:
+            db_path: SQLite 파일 위치
+            retention_days: 본 항목을 기억하는 기간 (일)
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.retention = retention_days * 86400
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS seen (
+                key TEXT PRIMARY KEY,
+                source TEXT,
+                first_seen REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_seen_first_seen ON seen(first_seen);
+            CREATE TABLE IF NOT EXISTS high_water (
+                source TEXT PRIMARY KEY,
+                key TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+        """)
+        self.purge()
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        """URL → 저장 키 (정규화 URL의 SHA-1 앞 16자리)"""
+        return hashlib.sha1(canonicalize_url(url).encode('utf-8')).hexdigest()[:16]
+
+    def seen_keys(self, keys: list) -> set:
+        """keys 중 이미 본 것"""
+        found = set()
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            for start in range(0, len(unique), 500):
+                chunk = unique[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT key FROM seen WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                found.update(row[0] for row in rows)
+        return found
+
+    def filter_new(self, items: list, url_of=None) -> list:
+        """
+        처음 보는 항목만 반환 (기록은 하지 않음, 발송 후 mark_seen으로 기록)
+
+        Args:
+            items: 항목 목록 (models.Item)
+            url_of: 항목 → URL (Item이 아닌 피드 원본 항목 등, 없으면 item.url)
+        """
+        url_of = url_of or (lambda item: item.url)
+        keys = [self.make_key(url_of(item) or '') for item in items]
+        seen = self.seen_keys(keys)
+        return [item for item, key in zip(items, keys) if key not in seen]
+
+    def mark_seen(self, items: list):
+        """항목들(models.Item)을 본 것으로 기록"""
+        now = time.time()
+        rows = [(self.make_key(item.url), item.source, now) for item in items if item.url]
+        with self._lock:
+            self.conn.executemany("INSERT OR IGNORE INTO seen (key, source, first_seen) VALUES (?, ?, ?)", rows)
+            self.conn.commit()
+
+    def get_high_water(self, source: str):
+        """소스의 하이워터마크 키 (없으면 None)"""
+        with self._lock:
+            row = self.conn.execute("SELECT key FROM high_water WHERE source = ?", (source,)).fetchone()
+        return row[0] if row else None
+
+    def set_high_water(self, source: str, key: str):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO high_water (source, key, updated_at) VALUES (?, ?, ?)",
+                (source, key, time.time()),
+            )
+            self.conn.commit()
+
+    def purge(self):
+        """보존 기간이 지난 기록 삭제"""
+        cutoff = time.time() - self.retention
+        with self._lock:
+            self.conn.execute("DELETE FROM seen WHERE first_seen < ?", (cutoff,))
+            self.conn.execute("DELETE FROM high_water WHERE updated_at < ?", (cutoff,))
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
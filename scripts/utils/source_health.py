@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Source Health
+소스(RSS 피드, GitHub Trending 등)별 성공/실패 기록과 응답 시간을 남기고,
+계속 실패하는 소스는 회로를 열어 기다리지 않고 바로 건너뜀 (서킷 브레이커)
+- closed: 평소 상태, 연속 실패가 failure_threshold회가 되면 open
+- open: 요청하지 않고 바로 CircuitOpenError, 쿨다운이 지나면 half_open
+- half_open: 시험 요청 하나만 보냄 → 성공하면 closed, 실패하면 쿨다운을 두 배로 늘려 다시 open
+- 최근 window회의 응답 시간으로 p50/p95, 실패에 쓴 시간 합계를 리포트
+
+쿨다운 단위: 기본은 초 (데몬처럼 계속 도는 프로세스). per_run=True면 실행 횟수로 센다
+(하루 한 번 도는 cron - 몇 분짜리 쿨다운은 다음 실행 전에 항상 끝나고, 24시간으로 재면
+실행 시각이 조금만 흔들려도 경계에 걸리므로). 이때는 실행마다 start_run()을 부른다.
+단위는 회로(소스 행)마다 기록되므로 데몬과 cron이 같은 파일을 써도 서로의 쿨다운을 건드리지
+않는다 - 다른 단위로 열린 회로는 그 단위대로 판단하고, 그 회로가 다시 열릴 때 지금 단위로 바뀐다.
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent / '.cache' / 'health.sqlite3'
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+def describe_wait(amount: float, per_run: bool = False) -> str:
+    """쿨다운/남은 대기 → '10분 뒤' / '실행 2회 뒤'"""
+    return f"실행 {amount:.0f}회 뒤" if per_run else f"{amount / 60:.0f}분 뒤"
+
+
+class CircuitOpenError(Exception):
+    """회로가 열린 소스 - 요청하지 않고 건너뜀"""
+
+    def __init__(self, source: str, retry_in: float, per_run: bool = False):
+        super().__init__(f"{source}: 회로 열림, {describe_wait(retry_in, per_run)} 재시도")
+        self.source = source
+        self.retry_in = retry_in
+
+
+def percentile(values: list, q: float) -> float:
+    """정렬된 값 목록의 q 분위수 (최근접 순위, 비어 있으면 0)"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class SourceHealth:
+    def __init__(self, db_path: Path = None, failure_threshold: int = 3, cooldown: float = 600,
+                 max_cooldown: float = 12 * 3600, window: int = 50, per_run: bool = False):
+        """
+        Args:
+            db_path: SQLite 파일 위치
+            failure_threshold: 회로를 여는 연속 실패 수
+            cooldown: 처음 회로를 열었을 때 다시 시험하기까지 대기 (초, per_run이면 실행 횟수)
+            max_cooldown: 시험이 계속 실패할 때 최대 대기 (cooldown과 같은 단위, 실패마다 두 배)
+            window: 응답 시간 분위수에 쓸 최근 기록 수 (소스별)
+            per_run: 쿨다운을 실행 횟수로 셈 (2면 다음 실행은 건너뛰고 그다음 실행에서 시험)
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.window = window
+        self.per_run = per_run
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sources (
+                source TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                consecutive_failures INTEGER NOT NULL,
+                cooldown REAL NOT NULL,
+                opened_at REAL,
+                per_run INTEGER NOT NULL DEFAULT 0,
+                successes INTEGER NOT NULL,
+                failures INTEGER NOT NULL,
+                skipped INTEGER NOT NULL,
+                failed_seconds REAL NOT NULL,
+                last_error TEXT,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS outcomes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT NOT NULL,
+                ok INTEGER NOT NULL,
+                latency REAL NOT NULL,
+                at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_outcomes_source ON outcomes(source, id);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+        """)
+        if 'per_run' not in {row[1] for row in self.conn.execute("PRAGMA table_info(sources)")}:
+            # 단위 열이 없던 파일 - 예전 회로는 모두 초 단위
+            self.conn.execute("ALTER TABLE sources ADD COLUMN per_run INTEGER NOT NULL DEFAULT 0")
+            self.conn.commit()
+        self.runs = self._stored_runs()
+        # 상태는 메모리에 두고 바뀔 때만 기록 (allow는 매 요청마다 불림)
+        columns = ('state', 'consecutive_failures', 'cooldown', 'opened_at', 'per_run', 'successes', 'failures',
+                   'skipped', 'failed_seconds', 'last_error')
+        self.states = {
+            row[0]: dict(zip(columns, row[1:]))
+            for row in self.conn.execute(f"SELECT source, {', '.join(columns)} FROM sources")
+        }
+
+    def _stored_runs(self) -> int:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'runs'").fetchone()
+        return row[0] if row else 0
+
+    def _now(self, per_run: bool) -> float:
+        """
+        쿨다운 시계 (per_run이면 지금까지의 실행 횟수, 아니면 epoch 초)
+
+        실행 횟수는 cron 쪽 프로세스가 늘리므로 시간 단위로 도는 쪽(데몬)은 파일에서 읽는다.
+        """
+        if not per_run:
+            return time.time()
+        return self.runs if self.per_run else self._stored_runs()
+
+    def start_run(self):
+        """실행 한 번 시작 (per_run 쿨다운의 시계, 실행 횟수는 파일에 남음)"""
+        with self._lock:
+            self.runs += 1
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('runs', ?)", (self.runs,))
+            self.conn.commit()
+
+    def _state(self, source: str) -> dict:
+        return self.states.setdefault(source, {
+            'state': CLOSED, 'consecutive_failures': 0, 'cooldown': self.cooldown, 'opened_at': None,
+            'per_run': int(self.per_run), 'successes': 0, 'failures': 0, 'skipped': 0, 'failed_seconds': 0.0,
+            'last_error': None,
+        })
+
+    def _save(self, source: str):
+        """호출 측에서 _lock을 잡고 있어야 함"""
+        state = self.states[source]
+        self.conn.execute(
+            "INSERT OR REPLACE INTO sources (source, state, consecutive_failures, cooldown, opened_at, per_run, "
+            "successes, failures, skipped, failed_seconds, last_error, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (source, state['state'], state['consecutive_failures'], state['cooldown'], state['opened_at'],
+             state['per_run'], state['successes'], state['failures'], state['skipped'], state['failed_seconds'],
+             state['last_error'], time.time()),
+        )
+        self.conn.commit()
+
+    def allow(self, source: str) -> bool:
+        """
+        지금 요청해도 되는지 (open이면 False, 쿨다운이 지났으면 half_open으로 바꾸고 시험 요청 하나만 True)
+        """
+        with self._lock:
+            state = self._state(source)
+            if state['state'] == CLOSED:
+                return True
+            now = self._now(state['per_run'])  # 회로를 연 쪽의 단위로
+            # half_open 시험 요청이 기록 없이 끝난 경우(프로세스 종료 등)도 쿨다운 뒤에는 다시 시험
+            if now >= state['opened_at'] + state['cooldown']:
+                state['state'] = HALF_OPEN
+                state['opened_at'] = now
+                self._save(source)
+                return True
+            state['skipped'] += 1
+            self._save(source)
+            return False
+
+    def retry_in(self, source: str) -> float:
+        """회로가 열린 소스를 다시 시험하기까지 남은 시간 (회로의 단위 - 초 또는 실행 횟수)"""
+        state = self._state(source)
+        if state['state'] == CLOSED:
+            return 0.0
+        return max(0.0, state['opened_at'] + state['cooldown'] - self._now(state['per_run']))
+
+    def _record(self, source: str, ok: bool, latency: float):
+        self.conn.execute(
+            "INSERT INTO outcomes (source, ok, latency, at) VALUES (?, ?, ?, ?)",
+            (source, int(ok), latency, time.time()),
+        )
+        # 최근 window개만 남김
+        self.conn.execute(
+            "DELETE FROM outcomes WHERE source = ? AND id <= "
+            "(SELECT id FROM outcomes WHERE source = ? ORDER BY id DESC LIMIT 1 OFFSET ?)",
+            (source, source, self.window),
+        )
+        self._save(source)
+
+    def record_success(self, source: str, latency: float):
+        with self._lock:
+            state = self._state(source)
+            if state['state'] != CLOSED:
+                print(f"  🔌 {source}: 회복, 회로 닫음")
+            state.update(state=CLOSED, consecutive_failures=0, cooldown=self.cooldown, opened_at=None,
+                         per_run=int(self.per_run))
+            state['successes'] += 1
+            self._record(source, True, latency)
+
+    def record_failure(self, source: str, latency: float, error: Exception = None):
+        with self._lock:
+            state = self._state(source)
+            state['consecutive_failures'] += 1
+            state['failures'] += 1
+            state['failed_seconds'] += latency
+            state['last_error'] = str(error)[:200] if error else None
+
+            if state['state'] == HALF_OPEN:
+                # 시험 요청 실패 → 더 오래 쉼 (다른 단위로 열렸던 회로는 지금 단위의 처음 쿨다운부터)
+                same_unit = bool(state['per_run']) == self.per_run
+                state.update(state=OPEN, opened_at=self._now(self.per_run), per_run=int(self.per_run),
+                             cooldown=min(self.max_cooldown, state['cooldown'] * 2) if same_unit else self.cooldown)
+            elif state['state'] == CLOSED and state['consecutive_failures'] >= self.failure_threshold:
+                state.update(state=OPEN, opened_at=self._now(self.per_run), per_run=int(self.per_run),
+                             cooldown=self.cooldown)
+            if state['state'] == OPEN:
+                print(f"  🔌 {source}: 연속 {state['consecutive_failures']}회 실패, "
+                      f"{describe_wait(state['cooldown'], state['per_run'])} 다시 시험")
+            self._record(source, False, latency)
+
+    @contextmanager
+    def track(self, source: str):
+        """
+        요청 하나를 감싸서 결과와 소요 시간 기록
+
+            with health.track(name):
+                fetch()
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있으면 블록을 실행하지 않고 바로
+        """
+        if not self.allow(source):
+            raise CircuitOpenError(source, self.retry_in(source), self._state(source)['per_run'])
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self.record_failure(source, time.monotonic() - started, e)
+            raise
+        self.record_success(source, time.monotonic() - started)
+
+    def stats(self) -> list:
+        """
+        소스별 상태 + 최근 window회 기준 지표, 실패에 쓴 시간이 많은 순
+
+        Returns:
+            list of dict (source, state, success_rate, p50, p95, recent_seconds, failed_seconds, ...)
+        """
+        with self._lock:
+            rows = self.conn.execute("SELECT source, ok, latency FROM outcomes ORDER BY source, id").fetchall()
+            states = {source: dict(state) for source, state in self.states.items()}
+
+        recent = {}
+        for source, ok, latency in rows:
+            recent.setdefault(source, []).append((ok, latency))
+
+        report = []
+        for source, state in states.items():
+            outcomes = recent.get(source, [])
+            latencies = sorted(latency for _, latency in outcomes)
+            report.append({
+                'source': source,
+                'state': state['state'],
+                'consecutive_failures': state['consecutive_failures'],
+                'successes': state['successes'],
+                'failures': state['failures'],
+                'skipped': state['skipped'],
+                'success_rate': sum(ok for ok, _ in outcomes) / len(outcomes) if outcomes else None,
+                'p50': percentile(latencies, 0.5),
+                'p95': percentile(latencies, 0.95),
+                'recent_seconds': sum(latencies),
+                'failed_seconds': state['failed_seconds'],
+                'last_error': state['last_error'],
+                'retry_in': self.retry_in(source),
+                'per_run': bool(state['per_run']),
+            })
+        report.sort(key=lambda entry: (-entry['failed_seconds'], -entry['recent_seconds']))
+        return report
+
+    def report(self, limit: int = None) -> str:
+        """소스별 상태 요약 (실패로 시간을 가장 많이 쓴 소스부터)"""
+        entries = self.stats()[:limit]
+        if not entries:
+            return "🩺 소스 상태: 기록 없음"
+
+        icons = {CLOSED: '✅', HALF_OPEN: '🟡', OPEN: '⛔'}
+        lines = ["🩺 소스 상태 (실패로 쓴 시간 순):"]
+        for entry in entries:
+            rate = f"{entry['success_rate'] * 100:3.0f}%" if entry['success_rate'] is not None else "  -"
+            line = (f"  {icons[entry['state']]} {entry['source']:<22} 성공 {rate}  "
+                    f"p50 {entry['p50']:5.2f}s  p95 {entry['p95']:5.2f}s  "
+                    f"실패 {entry['failures']}회 {entry['failed_seconds']:6.1f}s")
+            if entry['skipped']:
+                line += f"  건너뜀 {entry['skipped']}회"
+            if entry['state'] != CLOSED:
+                line += f"  (재시도 {describe_wait(entry['retry_in'], entry['per_run'])})"
+            if entry['consecutive_failures'] and entry['last_error']:
+                line += f"\n      └ {entry['last_error'][:100]}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def reset(self, sources: list = None) -> int:
+        """
+        기록 삭제 (회로도 닫힘)
+
+        Args:
+            sources: 지울 소스 목록 (None이면 전부)
+
+        Returns:
+            지운 소스 수
+        """
+        with self._lock:
+            targets = list(self.states) if sources is None else [s for s in sources if s in self.states]
+            for source in targets:
+                del self.states[source]
+                self.conn.execute("DELETE FROM sources WHERE source = ?", (source,))
+                self.conn.execute("DELETE FROM outcomes WHERE source = ?", (source,))
+            self.conn.commit()
+        return len(targets)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Batch Summarizer
+여러 항목을 프롬프트 하나로 묶어 Gemini에 한 번에 요약 요청
+- 응답은 JSON 배열 (실패 시 "1. ..." 번호 목록으로 파싱)
+- 응답에서 빠진 항목만 골라서 재요청
+- SummaryCache가 있으면 이미 요약한 항목은 요청하지 않음
+- 묶음 요청들은 LLMExecutor로 동시에 (속도 제한 지키면서) 실행
+"""
+
+import json
+import re
+import time
+
+from utils.llm_executor import LLMExecutor
+from utils.metrics import metrics
+
+# "1. 요약", "[2] 요약", "3) 요약", "4: 요약" 형태의 번호 목록
+NUMBERED_LINE_RE = re.compile(r'^\s*\[?(\d+)[\].):]\s*(.+?)\s*$')
+CODE_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+
+class BatchSummarizer:
+    def __init__(self, model, batch_size: int = 10, max_retries: int = 2, cache=None,
+                 executor: LLMExecutor = None, timeout: float = None, name: str = 'llm'):
+        """
+        Args:
+            model: generate_content()를 가진 Gemini 모델
+            batch_size: 요청 하나에 묶을 최대 항목 수 (1이면 항목별 개별 요청)
+            max_retries: 응답에서 빠진 항목 재요청 횟수
+            cache: SummaryCache (None이면 캐시 안 함)
+            executor: 요청 실행기 (쿼터를 나눠 쓰려면 여러 요약기가 같은 것을 공유)
+            timeout: summarize() 한 번의 제한 시간 (초, 넘으면 끝난 요약만 사용)
+            name: 메트릭에 남길 요약기 이름 (예: 'rss', 'github')
+        """
+        self.model = model
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max_retries
+        self.cache = cache
+        self.executor = executor or LLMExecutor()
+        self.timeout = timeout
+        self.name = name
+
+    def build_prompt(self, items: list, instruction: str) -> str:
+        """번호 붙인 항목들을 하나의 프롬프트로 구성"""
+        blocks = "\n\n".join(f"[{i}]\n{item}" for i, item in enumerate(items, 1))
+        return f"""{instruction}
+각 항목마다 한 줄씩, 아래 JSON 배열 형식으로만 답해줘.
+[{{"id": 1, "summary": "..."}}, {{"id": 2, "summary": "..."}}]
+
+{blocks}"""
+
+    def parse_response(self, text: str, count: int) -> dict:
+        """
+        응답 → {번호: 요약}
+
+        JSON 배열을 먼저 시도하고, 안 되면 번호 목록으로 파싱.
+        범위를 벗어난 번호나 빈 요약은 버린다.
+        """
+        text = CODE_FENCE_RE.sub('', text.strip())
+        summaries = {}
+
+        try:
+            data = json.loads(text)
+        except ValueError:
+            data = None
+
+        if isinstance(data, list):
+            for i, entry in enumerate(data, 1):
+                if isinstance(entry, dict):
+                    idx, summary = entry.get('id', i), entry.get('summary')
+                else:
+                    idx, summary = i, entry
+                try:
+                    idx = int(idx)
+                except (TypeError, ValueError):
+                    continue
+                if isinstance(summary, str) and summary.strip():
+                    summaries[idx] = summary.strip().split('\n')[0]
+        else:
+            for line in text.splitlines():
+                match = NUMBERED_LINE_RE.match(line)
+                if match:
+                    summaries[int(match.group(1))] = match.group(2)
+
+        return {idx: s for idx, s in summaries.items() if 1 <= idx <= count}
+
+    def summarize_chunk(self, items: list, instruction: str) -> dict:
+        """항목 묶음 하나 요약 → {묶음 내 인덱스(0부터): 요약}"""
+        metrics.incr('llm_calls', source=self.name)
+        metrics.incr('llm_items', len(items), source=self.name)
+        with metrics.span('summarize', source=self.name):
+            response = self.model.generate_content(self.build_prompt(items, instruction))
+        parsed = self.parse_response(response.text, len(items))
+        return {idx - 1: summary for idx, summary in parsed.items()}
+
+    def summarize(self, items: list, instruction: str, prompt_version: str = None) -> list:
+        """
+        항목 목록 일괄 요약
+
+        Args:
+            items: 항목별 요약 대상 텍스트 (예: "프로젝트명: ...\\n설명: ...")
+            instruction: 요약 지시문
+            prompt_version: 캐시 키에 들어갈 프롬프트 버전 (None이면 캐시 안 함)
+
+        Returns:
+            items와 같은 순서의 요약 목록 (끝내 실패한 항목은 "")
+        """
+        results = [""] * len(items)
+        if not self.model or not items:
+            return results
+
+        keys = None
+        if self.cache and prompt_version:
+            keys = [self.cache.make_key(item, prompt_version) for item in items]
+            cached = self.cache.get_many(keys)
+            for i, key in enumerate(keys):
+                results[i] = cached.get(key, "")
+            pending = [i for i, key in enumerate(keys) if key not in cached]
+            metrics.incr('summary_cache_hits', len(items) - len(pending), source=self.name)
+            metrics.incr('summary_cache_misses', len(pending), source=self.name)
+        else:
+            pending = list(range(len(items)))
+
+        if pending:
+            self.request_all(items, pending, instruction, results)
+
+        if keys:
+            self.cache.put_many({keys[i]: results[i] for i in pending})
+
+        return results
+
+    def request_all(self, items: list, pending: list, instruction: str, results: list):
+        """pending 항목들을 batch_size씩 동시에 요청해 results에 채움 (빠진 항목은 재요청)"""
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+
+        for attempt in range(self.max_retries + 1):
+            remaining = deadline - time.monotonic() if deadline else None
+            if remaining is not None and remaining <= 0:
+                break
+
+            chunks = [pending[start:start + self.batch_size]
+                      for start in range(0, len(pending), self.batch_size)]
+            responses = self.executor.map(
+                lambda chunk: self.summarize_chunk([items[i] for i in chunk], instruction),
+                chunks,
+                timeout=remaining,
+            )
+
+            missing = []
+            for chunk, parsed in zip(chunks, responses):
+                parsed = parsed or {}
+                for pos, idx in enumerate(chunk):
+                    if pos in parsed:
+                        results[idx] = parsed[pos]
+                    else:
+                        missing.append(idx)
+
+            if not missing:
+                break
+            metrics.incr('llm_missing_items', len(missing), source=self.name)
+            if attempt < self.max_retries:
+                print(f"  🔁 응답에서 빠진 {len(missing)}개 재요청")
+            pending = missing
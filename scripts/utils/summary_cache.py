@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Summary Cache
+한 번 요약한 항목은 다시 Gemini에 보내지 않도록 SQLite에 저장
+- 키: 정규화한 요약 입력(이름/제목 + 설명) + 프롬프트 버전의 해시
+- TTL 지나면 만료, 최대 개수 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU)
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent / '.cache' / 'summaries.sqlite3'
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+class SummaryCache:
+    def __init__(self, db_path: Path = None, ttl_days: float = 14, max_entries: int = 5000):
+        """
+        Args:
+            db_path: SQLite 파일 위치
+            ttl_days: 요약 유효 기간 (일)
+            max_entries: 최대 저장 개수 (초과 시 LRU 삭제)
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl_days * 86400
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_last_used ON summaries(last_used)")
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(text: str, prompt_version: str) -> str:
+        """요약 입력 + 프롬프트 버전 → 캐시 키 (대소문자/공백 차이는 무시)"""
+        normalized = WHITESPACE_RE.sub(' ', text).strip().lower()
+        return hashlib.sha256(f"{prompt_version}\x00{normalized}".encode('utf-8')).hexdigest()
+
+    def get_many(self, keys: list) -> dict:
+        """
+        키 목록 조회
+
+        Returns:
+            dict: {key: summary} (캐시에 있고 만료되지 않은 것만)
+        """
+        if not keys:
+            return {}
+
+        now = time.time()
+        unique = list(dict.fromkeys(keys))
+        found = {}
+
+        with self._lock:
+            # SQLite 변수 개수 제한 때문에 나눠서 조회
+            for start in range(0, len(unique), 500):
+                chunk = unique[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT key, summary FROM summaries WHERE key IN ({placeholders}) AND created_at >= ?",
+                    (*chunk, now - self.ttl),
+                ).fetchall()
+                found.update(rows)
+
+            if found:
+                self.conn.executemany(
+                    "UPDATE summaries SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                self.conn.commit()
+
+            self.hits += sum(1 for key in keys if key in found)
+            self.misses += sum(1 for key in keys if key not in found)
+
+        return found
+
+    def put_many(self, summaries: dict):
+        """{key: summary} 저장 (빈 요약은 저장하지 않음)"""
+        rows = [(key, summary) for key, summary in summaries.items() if summary]
+        if not rows:
+            return
+
+        now = time.time()
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO summaries (key, summary, created_at, last_used) VALUES (?, ?, ?, ?)",
+                [(key, summary, now, now) for key, summary in rows],
+            )
+            self.conn.commit()
+        self.evict()
+
+    def evict(self):
+        """만료된 항목과 최대 개수를 넘는 LRU 항목 삭제"""
+        with self._lock:
+            self.conn.execute("DELETE FROM summaries WHERE created_at < ?", (time.time() - self.ttl,))
+            self.conn.execute("""
+                DELETE FROM summaries WHERE key IN (
+                    SELECT key FROM summaries ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+            self.conn.commit()
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def summary(self) -> str:
+        """통계 한 줄 요약"""
+        s = self.stats()
+        return f"요약 캐시: 적중 {s['hits']} / 미스 {s['misses']} (적중률 {s['hit_rate']:.0%})"
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Text Normalization
+피드 설명(HTML 조각) → 요약 프롬프트/메시지에 넣을 평문
+- CDATA 껍데기는 벗기고 내용은 살림, <script>/<style>/주석은 내용째 제거
+- 태그 제거 (블록 태그 자리는 공백으로 - 문단끼리 단어가 붙지 않게)
+- HTML 엔티티 디코딩 (&amp; &#8217; &nbsp; ...)
+- 연속 공백/줄바꿈을 공백 하나로
+- 자를 때는 단어 경계, 그리고 글자(grapheme) 경계에서 (이모지 ZWJ 조합, 결합 문자 중간에서 자르지 않음)
+- 검색 토큰: 영문/숫자는 단어, 한글은 음절 bigram (조사가 붙어도 찾을 수 있게)
+
+예전 방식(정규식 하나로 태그만 지우고 500자에서 자름)보다 약 4배 느리다 - 엔티티 디코딩, 블록 태그
+공백, 공백 합치기, 경계 자르기를 하느라 C 패스가 다섯 번이라서 (bench_text_normalize.py 참고).
+설명들을 \\x00으로 이어 붙여 한 번에 처리하는 묶음 경로도 있었지만 이득이 10%대라 뺐다.
+"""
+
+import html
+import re
+import unicodedata
+
+CDATA_RE = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.DOTALL)
+DROP_RE = re.compile(
+    r'<(script|style|noscript|template)\b[^>]*>.*?</\1\s*>'
+    r'|<!--.*?-->',
+    re.IGNORECASE | re.DOTALL,
+)
+# 블록 태그는 소문자만 (IGNORECASE면 두 배 느림, 대문자 태그도 TAG_RE가 지우기는 함)
+BLOCK_TAG_RE = re.compile(
+    r'</?(?:p|div|br|li|ul|ol|h[1-6]|blockquote|pre|tr|td|th|table|section|article|figure|figcaption|hr)\b[^>]*>'
+)
+TAG_RE = re.compile(r'<[^>]*>')
+# 폭 없는 공백, NUL → 공백 (str.split()이 공백으로 보지 않는 문자)
+ZERO_WIDTH = str.maketrans({'\u200b': ' ', '\ufeff': ' ', '\x00': ' '})
+
+ZWJ = '\u200d'
+
+
+def _is_grapheme_extender(ch: str) -> bool:
+    """앞 글자에 붙어 한 글자로 보이는 문자 (여기서 자르면 글자가 깨짐)"""
+    return (
+        unicodedata.combining(ch) != 0
+        or ch == ZWJ
+        or '\ufe00' <= ch <= '\ufe0f'            # variation selector (❤️ 등)
+        or '\U0001f3fb' <= ch <= '\U0001f3ff'    # 피부색 수식자
+        or '\U000e0020' <= ch <= '\U000e007f'    # 태그 문자 (지역 깃발)
+        or unicodedata.category(ch) == 'Mc'
+    )
+
+
+def truncate(text: str, limit: int, suffix: str = '') -> str:
+    """
+    limit자 이하로 자르기 (잘랐을 때만 suffix를 붙이며 suffix 길이도 limit에 포함)
+
+    단어 중간이면 앞 공백까지 물러나고 (너무 많이 잃으면 그냥 글자 경계에서),
+    이모지 조합/결합 문자 한가운데는 피한다.
+    """
+    if len(text) <= limit:
+        return text
+
+    cut = max(0, limit - len(suffix))
+    # 글자 경계: 자르는 위치 뒤가 앞 글자에 붙는 문자거나 앞이 ZWJ면 조합 시작까지 물러남
+    while 0 < cut and (_is_grapheme_extender(text[cut]) or text[cut - 1] == ZWJ):
+        cut -= 1
+
+    # 단어 경계: 마지막 20% 안에 공백이 있으면 거기서
+    if not text[cut].isspace():
+        space = text.rfind(' ', int(cut * 0.8), cut)
+        if space > 0:
+            cut = space
+
+    return text[:cut].rstrip() + suffix
+
+
+def _strip(text: str) -> str:
+    if '<![CDATA[' in text:
+        text = CDATA_RE.sub(r'\1', text)
+    text = DROP_RE.sub(' ', text)
+    text = BLOCK_TAG_RE.sub(' ', text)
+    text = TAG_RE.sub('', text)
+    return html.unescape(text) if '&' in text else text
+
+
+def _collapse_spaces(text: str) -> str:
+    # \xa0, 줄바꿈 등은 str.split()이 공백으로 봄, 폭 없는 공백과 NUL은 직접 바꿈
+    if '\u200b' in text or '\ufeff' in text or '\x00' in text:
+        text = text.translate(ZERO_WIDTH)
+    return ' '.join(text.split())
+
+
+def html_to_text(text: str, limit: int = None) -> str:
+    """HTML 조각 하나 → 평문 (limit이 있으면 단어/글자 경계에서 자름)"""
+    text = text or ''
+    if '<' in text or '&' in text:
+        text = _strip(text)
+    text = _collapse_spaces(text)
+    return truncate(text, limit) if limit is not None else text
+
+
+# 검색 토큰: 영문/숫자 단어 (c++, c# 포함) 또는 한글 음절 덩어리
+SEARCH_WORD_RE = re.compile(r'[a-z0-9]+[+#]*|[가-힣]+')
+
+
+def search_tokens(text: str) -> set:
+    """
+    검색 색인/질의용 토큰 집합
+
+    한글은 형태소 분석 없이 음절 bigram으로 나눈다 ("제미나이가" → 제미, 미나, 나이, 이가).
+    질의도 같은 방식으로 나누므로 "제미나이"로 "제미나이가"를 찾을 수 있다.
+    """
+    tokens = set()
+    for word in SEARCH_WORD_RE.findall(unicodedata.normalize('NFKC', text or '').lower()):
+        if '가' <= word[0] <= '힣' and len(word) > 1:
+            tokens.update(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.add(word)
+    return tokens
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Timestamps
+피드/트윗 시간 문자열 → epoch 초 (랭킹의 최신도, 데몬 스케줄러의 발행 간격이 함께 씀)
+- ISO 8601 (끝의 Z 포함) 먼저, 안 되면 RFC 822 (RSS pubDate)
+- 시간대가 없으면 UTC로 봄
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(value: str) -> Optional[float]:
+    """피드 발행일 (ISO 8601 / RFC 822) → epoch 초, 해석할 수 없으면 None"""
+    if not value:
+        return None
+
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):  # 형식이 많이 어긋나면 IndexError도 남
+            return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    try:
+        return parsed.timestamp()
+    except (OverflowError, ValueError):  # 9999년 등 범위 밖
+        return None